@@ -0,0 +1,62 @@
+"""Compares the methods available for choosing the representative points of E-NAUTILUS.
+
+For each method, reports the latency of choosing the representative points
+of a reachable region, and the spread of the chosen points: the smallest
+distance between two of them (separation, larger is better) and the largest
+distance from a reachable solution to its nearest representative point
+(coverage, smaller is better). The warm started methods are started from the
+centroids of the region one iteration earlier. The construction time is
+reported too, as the tree method clusters the whole front on construction.
+The front has 2 * 10^5 points.
+Run with
+
+    python benchmarks/enautilus_representatives.py
+
+"""
+import time
+
+import numpy as np
+from desdeo_mcdm.interactive import ENautilus
+from desdeo_mcdm.interactive.ENautilus import REPRESENTATIVE_METHODS
+from scipy.spatial.distance import pdist
+from sklearn.metrics import pairwise_distances_argmin_min
+
+
+def spread(points: np.ndarray, representatives: np.ndarray):
+    _, distances = pairwise_distances_argmin_min(points, representatives)
+    return np.min(pdist(representatives)), np.max(distances)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(1)
+    front = rng.uniform(0, 1, size=(2 * 10 ** 5, 4))
+    front /= np.linalg.norm(front, axis=1, keepdims=True)
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+    n_points = 10
+
+    # the reachable region of the second iteration is within the region of the first one
+    previous = np.arange(len(front))
+    reachable = np.flatnonzero(np.all(front <= np.quantile(front, 0.8, axis=0), axis=1))
+
+    print(f"{'method':>24} {'construction (s)':>17} {'latency (ms)':>13} {'separation':>11} {'coverage':>9}")
+    for representative_method in REPRESENTATIVE_METHODS:
+        for warm_start in (False, True):
+            if warm_start and representative_method not in ("kmeans", "minibatch_kmeans"):
+                continue
+
+            start = time.perf_counter()
+            method = ENautilus(front, ideal, nadir, representative_method=representative_method, warm_start=warm_start)
+            construction = time.perf_counter() - start
+
+            latencies = []
+            for _ in range(3):
+                method.calculate_representative_points(front, previous, n_points)
+
+                start = time.perf_counter()
+                zbars = method.calculate_representative_points(front, reachable, n_points)
+                latencies.append(time.perf_counter() - start)
+            latency = min(latencies)
+
+            separation, coverage = spread(front[reachable], zbars)
+            name = f"{representative_method}{' (warm)' if warm_start else ''}"
+            print(f"{name:>24} {construction:>17.2f} {1000 * latency:>13.1f} {separation:>11.3f} {coverage:>9.3f}")
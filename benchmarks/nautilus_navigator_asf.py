@@ -0,0 +1,68 @@
+"""Measures the latency of solving the ASF problem of the NAUTILUS Navigator.
+
+Compares the earlier implementation, which copies the whole front and fills
+the rows outside the reachable region with NaNs, to the current one, which
+only evaluates the reachable rows. The front has 10^6 points. Run with
+
+    python benchmarks/nautilus_navigator_asf.py
+
+"""
+import time
+
+import numpy as np
+from desdeo_mcdm.interactive import NautilusNavigator
+from desdeo_tools.scalarization.ASF import PointMethodASF
+from desdeo_tools.scalarization.Scalarizer import DiscreteScalarizer
+from desdeo_tools.solver.ScalarSolver import DiscreteMinimizer
+
+
+def copying_asf_problem(pareto_f, subset_indices, ref_point, ideal, nadir, user_bounds):
+    # the implementation before evaluating only the reachable rows
+    asf = PointMethodASF(nadir, ideal)
+    scalarizer = DiscreteScalarizer(asf, {"reference_point": ref_point})
+    solver = DiscreteMinimizer(scalarizer)
+
+    tmp = np.copy(pareto_f)
+    mask = np.zeros(tmp.shape[0], dtype=bool)
+    mask[subset_indices] = True
+    tmp[~mask] = np.nan
+
+    bound_mask = np.any(tmp > user_bounds, axis=1)
+    tmp[bound_mask] = np.nan
+
+    return solver.minimize(tmp)["x"]
+
+
+def timed(fun, *args, repeats: int = 5):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fun(*args)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(1)
+    front = rng.uniform(0, 1, size=(10 ** 6, 4))
+    front /= np.linalg.norm(front, axis=1, keepdims=True)
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+    ref_point = np.array([0.3, 0.5, 0.4, 0.6])
+    user_bounds = np.array([np.nan, 0.9, np.nan, np.nan])
+
+    # the reachable region shrinks around the preferred solutions as the navigation proceeds
+    distances = np.max(np.abs(front - ref_point), axis=1)
+
+    print(f"{'reachable':>10} {'before (ms)':>12} {'after (ms)':>11} {'speedup':>8}")
+    for fraction in (1.0, 0.1, 0.01, 0.001):
+        reachable = np.flatnonzero(distances <= np.quantile(distances, fraction))
+        args = (front, reachable, ref_point, ideal, nadir, user_bounds)
+
+        before, before_time = timed(copying_asf_problem, *args)
+        after, after_time = timed(NautilusNavigator.solve_nautilus_asf_problem, *args)
+        assert before == after
+
+        print(
+            f"{len(reachable):>10} {1000 * before_time:>12.1f} {1000 * after_time:>11.1f} "
+            f"{before_time / after_time:>8.1f}"
+        )
@@ -0,0 +1,64 @@
+"""Compares the reference sets available for computing a Pareto front representation.
+
+For each reference set, reports the number of achievement scalarization
+problems solved, the number of unique Pareto optimal points found, and the
+number of solves needed per unique point. Run with
+
+    python benchmarks/reference_sets.py
+
+"""
+import time
+
+import numpy as np
+from desdeo_mcdm.utilities import NonDominatedArchive, iter_pareto_front_representation_general
+from desdeo_tools.solver.ScalarSolver import ScalarMethod
+from scipy.optimize import differential_evolution
+
+
+def objectives(xs: np.ndarray) -> np.ndarray:
+    # three convex objectives with conflicting minima
+    xs = np.atleast_2d(xs)
+    f_1 = xs[:, 0] ** 2 + xs[:, 1] ** 2
+    f_2 = (xs[:, 0] - 2) ** 2 + (xs[:, 1] - 1) ** 2
+    f_3 = (xs[:, 0] + 1) ** 2 + (xs[:, 1] - 2) ** 2
+    return np.stack((f_1, f_2, f_3)).T
+
+
+def de(fun, x0, **kwargs):
+    return differential_evolution(fun, **kwargs)
+
+
+def run(reference_set: str, step: float, decimals: int = 3) -> None:
+    method = ScalarMethod(de, method_args={"seed": 1, "polish": True, "maxiter": 200, "tol": 1e-8}, use_scipy=True)
+    bounds = np.array([[-3.0, 3.0], [-3.0, 3.0]])
+    ideal, nadir = np.zeros(3), np.array([5.0, 5.0, 5.0])
+
+    start = time.perf_counter()
+    archive = NonDominatedArchive(3)
+    n_of_solves = 0
+    solutions = iter_pareto_front_representation_general(
+        objectives,
+        3,
+        bounds,
+        step=step,
+        ideal=ideal,
+        nadir=nadir,
+        solver_method=method,
+        reference_set=reference_set,
+        seed=1,
+    )
+    for _, x, f in solutions:
+        archive.add(f, x)
+        n_of_solves += 1
+    elapsed = time.perf_counter() - start
+
+    n_of_unique = len(np.unique(np.round(archive.objectives, decimals), axis=0))
+    per_point = n_of_solves / max(n_of_unique, 1)
+    print(f"{reference_set:>8} {n_of_solves:>8} {n_of_unique:>8} {per_point:>10.2f} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    step = 0.5
+    print(f"{'set':>8} {'solves':>8} {'unique':>8} {'per point':>10} {'time (s)':>9}")
+    for reference_set in ("grid", "simplex", "lhs", "sobol"):
+        run(reference_set, step)
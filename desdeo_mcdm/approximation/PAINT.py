@@ -50,15 +50,18 @@ class PAINT:
         """
         return np.array(sorted(arr, key=lambda x: (len(np.unique(x)), min(x))))
     
-    def perturbate(self, epsilon: Optional[float] = 1e-06):
+    def perturbate(self, epsilon: Optional[float] = 1e-06, seed: Optional[int] = None):
         """
         Perturbate pareto optimal outcomes by maximum of epsilon. 
         This is only needed if the initial Pareto optimal outcomes are not in general position
 
         Args:
             epsilon (Optional[float], optional): The maximum value each point can change to either direction
+            seed (Optional[int], optional): Seed for the perturbations, which makes them reproducible. Defaults to None.
         """
-        self._po_outcomes = self.po_outcomes + np.random.uniform(-epsilon, epsilon, self.po_outcomes.shape)
+        # without a seed, the global random state is used as before
+        rng = np.random if seed is None else np.random.default_rng(seed)
+        self._po_outcomes = self.po_outcomes + rng.uniform(-epsilon, epsilon, self.po_outcomes.shape)
 
     def approximate(
             self,
@@ -1,9 +1,18 @@
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
+from desdeo_mcdm.utilities.fronts import (
+    ClusterTree,
+    FrontIndex,
+    as_front,
+    batched_leave_one_out_bounds,
+    nearest_point,
+    points_within_bounds,
+)
 from desdeo_tools.interaction.request import BaseRequest
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans, kmeans_plusplus
 from sklearn.metrics import pairwise_distances_argmin_min
 
 
@@ -165,21 +174,98 @@ class ENautilusStopRequest(BaseRequest):
         super().__init__("print", "no_interaction", content=content)
 
 
+#: The methods available for choosing the representative points.
+REPRESENTATIVE_METHODS = ("kmeans", "minibatch_kmeans", "kmeans++", "farthest_point", "tree")
+
+
+def _clustered_representatives(
+    points: np.ndarray, n_points: int, method: str, init: Optional[np.ndarray], random_state=None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # the points closest to the centroids of a k-means clustering, optionally started from given centroids
+    if init is None:
+        kwargs = {}
+    else:
+        kwargs = {"init": init, "n_init": 1}
+
+    if method == "kmeans":
+        kmeans = KMeans(n_clusters=n_points, random_state=random_state, **kwargs)
+    else:
+        kmeans = MiniBatchKMeans(n_clusters=n_points, random_state=random_state, **kwargs)
+    kmeans.fit(points)
+
+    closest, _ = pairwise_distances_argmin_min(kmeans.cluster_centers_, points)
+
+    return closest, kmeans.cluster_centers_
+
+
+def _seeded_representatives(points: np.ndarray, n_points: int, random_state=None) -> Tuple[np.ndarray, np.ndarray]:
+    # the points chosen by k-means++ seeding, without running k-means
+    centers, indices = kmeans_plusplus(points, n_points, random_state=random_state)
+
+    return indices, centers
+
+
+def _farthest_point_representatives(points: np.ndarray, n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    # starting from the point closest to the mean, adds the point farthest from the points added so far
+    indices = np.zeros(n_points, dtype=int)
+    indices[0] = np.argmin(np.linalg.norm(points - np.mean(points, axis=0), axis=1))
+    distances = np.linalg.norm(points - points[indices[0]], axis=1)
+
+    for i in range(1, n_points):
+        indices[i] = np.argmax(distances)
+        distances = np.minimum(distances, np.linalg.norm(points - points[indices[i]], axis=1))
+
+    return indices, points[indices]
+
+
+def _representatives(
+    points: np.ndarray, n_points: int, method: str, init: Optional[np.ndarray] = None, random_state=None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # the indices of the representative points, and the centroids to warm start the next clustering with
+    if method in ("kmeans", "minibatch_kmeans"):
+        return _clustered_representatives(points, n_points, method, init, random_state)
+
+    elif method == "kmeans++":
+        return _seeded_representatives(points, n_points, random_state)
+
+    elif method == "farthest_point":
+        return _farthest_point_representatives(points, n_points)
+
+    else:
+        raise ENautilusException(
+            f"Unknown representative method '{method}'. Expected one of {', '.join(REPRESENTATIVE_METHODS)}."
+        )
+
+
+def _check_reachable(found: np.ndarray) -> None:
+    # the bounds are infinite in the objectives where no solution was found
+    if not np.all(found):
+        raise ENautilusException(
+            "No solutions on the Pareto front are within the region reachable from one or more of the "
+            "intermediate points."
+        )
+
+
 class ENautilus(InteractiveMethod):
     def __init__(
         self,
-        pareto_front: np.ndarray,
+        pareto_front: Union[np.ndarray, str, Path],
         ideal: np.ndarray,
         nadir: np.ndarray,
         objective_names: Optional[List[str]] = None,
         variables: Optional[np.ndarray] = None,
+        use_index: bool = False,
+        representative_method: str = "kmeans",
+        warm_start: bool = False,
+        seed: Optional[int] = None,
     ):
         """
 
         Args:
-            pareto_front (np.ndarray): A two dimensional numpy array
+            pareto_front (Union[np.ndarray, str, Path]): A two dimensional numpy array
                 representing a Pareto front with objective vectors on each of its
-                rows.
+                rows, or the path to a .npy file containing one. A file is
+                memory-mapped instead of being read into memory.
             ideal (np.ndarray): The ideal objective vector of the problem
                 being represented by the Pareto front.
             nadir (np.ndarray): The nadir objective vector of the problem
@@ -191,11 +277,46 @@ class ENautilus(InteractiveMethod):
                 of the objective vectors in pareto_front. The i'th variable vector
                 in variables corresponds to the i'th objective vector in
                 pareto_front. Defaults to None.
+            use_index (bool, optional): Whether to build a FrontIndex over the
+                Pareto front on construction. The reachable solutions and the
+                bounds of the intermediate points are then found by range
+                queries on the index instead of scanning the front. Defaults
+                to False.
+            representative_method (str, optional): How the representative
+                points of the reachable solutions are chosen on each
+                iteration. 'kmeans' picks the solutions closest to the
+                centroids of a k-means clustering. 'minibatch_kmeans' does the
+                same with mini-batch k-means, which is faster on large fronts.
+                'kmeans++' picks the solutions chosen by k-means++ seeding,
+                without clustering. 'farthest_point' adds, one at a time, the
+                solution farthest from those picked so far, starting from the
+                one closest to the mean. 'tree' builds a ClusterTree over the
+                Pareto front on construction, and picks the representatives of
+                the largest clusters within the reachable bounds, so that the
+                whole reachable subset is not clustered on each iteration.
+                Defaults to 'kmeans'.
+            warm_start (bool, optional): Whether to start the clustering of
+                'kmeans' and 'minibatch_kmeans' from the centroids found on the
+                previous iteration, instead of seeding it anew. Defaults to
+                False.
+            seed (Optional[int], optional): Seed for choosing the
+                representative points. Every choice is seeded with it, so
+                that the same reachable solutions always give the same
+                intermediate points, no matter what was done before. Defaults
+                to None.
 
         Raises:
             ENavigatorException: One or more dimension mismatches are
                 encountered among the supplies arguments.
         """
+        pareto_front = as_front(pareto_front)
+
+        if representative_method not in REPRESENTATIVE_METHODS:
+            raise ENautilusException(
+                f"Unknown representative method '{representative_method}'. Expected one of "
+                f"{', '.join(REPRESENTATIVE_METHODS)}."
+            )
+
         if not pareto_front.ndim == 2:
             raise ENautilusException(
                 "The supplied Pareto front should be a two dimensional array. Found "
@@ -232,16 +353,28 @@ class ENautilus(InteractiveMethod):
         # in objective space!
         self._pareto_front = pareto_front
 
+        # optional index for range queries over the front
+        self._index = FrontIndex(pareto_front) if use_index else None
+
+        # optional hierarchical clustering of the front for choosing the representative points
+        self._tree = ClusterTree(pareto_front) if representative_method == "tree" else None
+
         # bounds of the reachable region
         self._reachable_ub = self._nadir
         self._reachable_lb = self._ideal
 
         # currently reachable solution as a list of indices of the Pareto front
-        self._reachable_idx = list(range(0, self._pareto_front.shape[0]))
+        self._reachable_idx = np.arange(self._pareto_front.shape[0])
 
         self._preferred_point = None
         self._projection_index = None
 
+        # how the representative points are chosen, and the centroids of the previous clustering
+        self._representative_method = representative_method
+        self._warm_start = warm_start
+        self._seed = seed
+        self._centroids = None
+
         self._n_points = None
         self._n_iterations_left = None
 
@@ -279,9 +412,7 @@ class ENautilus(InteractiveMethod):
         zs = self.calculate_intermediate_points(
             self._preferred_point, zbars, self._n_iterations_left
         )
-        new_lower_bounds, new_upper_bounds = self.calculate_bounds(
-            self._pareto_front, zs
-        )
+        new_lower_bounds, new_upper_bounds = self._calculate_bounds(zs)
         distances = self.calculate_distances(zs, zbars, self._nadir)
 
         return ENautilusRequest(
@@ -311,9 +442,7 @@ class ENautilus(InteractiveMethod):
                 # return the variable vector at the found position. Otherwise,
                 # do not return any variable vectors.
                 if self._variables is not None:
-                    idx = np.linalg.norm(
-                        np.abs(self._pareto_front - self._preferred_point), axis=1
-                    ).argmin()
+                    idx = nearest_point(self._pareto_front, self._preferred_point)
                     solution = self._variables[idx]
                 else:
                     solution = None
@@ -322,9 +451,14 @@ class ENautilus(InteractiveMethod):
             self._reachable_lb = request.content["lower_bounds"][preferred_point_index]
             self._reachable_ub = request.content["upper_bounds"][preferred_point_index]
 
-            self._reachable_idx = self.calculate_reachable_point_indices(
-                self._pareto_front, self._reachable_lb, self._reachable_ub
-            )
+            if self._index is None:
+                self._reachable_idx = self.calculate_reachable_point_indices(
+                    self._pareto_front, self._reachable_lb, self._reachable_ub
+                )
+            else:
+                self._reachable_idx = self._index.points_within_bounds(
+                    self._reachable_lb, self._reachable_ub
+                ).squeeze()
 
             if not request.response["change_remaining"]:
                 # decrement iterations left
@@ -332,16 +466,18 @@ class ENautilus(InteractiveMethod):
             else:
                 self._n_iterations_left = request.response["iterations_left"]
 
-            # Start again
+            # Start again, the reachable solutions are those within the reachable bounds
             zbars = self.calculate_representative_points(
-                self._pareto_front, self._reachable_idx, self._n_points
+                self._pareto_front,
+                self._reachable_idx,
+                self._n_points,
+                lower_bounds=self._reachable_lb,
+                upper_bounds=self._reachable_ub,
             )
             zs = self.calculate_intermediate_points(
                 self._preferred_point, zbars, self._n_iterations_left
             )
-            new_lower_bounds, new_upper_bounds = self.calculate_bounds(
-                self._pareto_front, zs
-            )
+            new_lower_bounds, new_upper_bounds = self._calculate_bounds(zs)
             distances = self.calculate_distances(zs, zbars, self._nadir)
 
         # stepping back
@@ -363,9 +499,20 @@ class ENautilus(InteractiveMethod):
         )
 
     def calculate_representative_points(
-        self, pareto_front: np.ndarray, subset_indices: List[int], n_points: int
+        self,
+        pareto_front: np.ndarray,
+        subset_indices: List[int],
+        n_points: int,
+        lower_bounds: Optional[np.ndarray] = None,
+        upper_bounds: Optional[np.ndarray] = None,
     ) -> np.ndarray:
-        """Calculates the most representative points on the Pareto front. The points are clustered using k-means.
+        """Calculates the most representative points on the Pareto front, chosen as set by representative_method.
+
+        With the 'tree' method, the representative points are chosen by
+        querying the ClusterTree of the Pareto front given on construction
+        for the solutions within the bounding box of the subset. These are
+        the subset itself when it consists of the solutions within some
+        bounds, like the reachable solutions do.
 
         Args:
             pareto_front (np.ndarray): The Pareto front.
@@ -373,21 +520,48 @@ class ENautilus(InteractiveMethod):
                 subset of the points on the Pareto front for which the
                 representative points should be calculated.
             n_points (int): The number of representative points to be calculated.
+            lower_bounds (Optional[np.ndarray], optional): The lower bounds of
+                the subset, used by the 'tree' method instead of computing them.
+                Defaults to None.
+            upper_bounds (Optional[np.ndarray], optional): The upper bounds of
+                the subset, used by the 'tree' method instead of computing them.
+                Defaults to None.
+
+        Raises:
+            ENautilusException: The 'tree' method is used with a Pareto front
+                other than the one given on construction.
 
         Returns:
             np.ndarray: A 2D array of the most representative points. If the
                 subset of Pareto efficient points is less than n_points, returns
                 the subset of the Pareto front.
         """
-        if len(np.atleast_1d(subset_indices)) > n_points:
-            kmeans = KMeans(n_clusters=n_points)
-            kmeans.fit(pareto_front[subset_indices])
+        if len(np.atleast_1d(subset_indices)) > n_points and self._tree is not None:
+            if pareto_front is not self._pareto_front:
+                raise ENautilusException(
+                    "The 'tree' method chooses representative points only on the Pareto front given on construction."
+                )
 
-            closest, _ = pairwise_distances_argmin_min(
-                kmeans.cluster_centers_, pareto_front[subset_indices]
+            if lower_bounds is None or upper_bounds is None:
+                subset = np.asarray(pareto_front[subset_indices])
+                lower_bounds, upper_bounds = np.min(subset, axis=0), np.max(subset, axis=0)
+
+            closest = self._tree.representatives(n_points, lower_bounds, upper_bounds, seed=self._seed)
+            zbars = np.asarray(pareto_front[closest])
+
+        elif len(np.atleast_1d(subset_indices)) > n_points:
+            points = np.asarray(pareto_front[subset_indices])
+
+            if self._warm_start and self._centroids is not None and len(self._centroids) == n_points:
+                init = self._centroids
+            else:
+                init = None
+
+            closest, self._centroids = _representatives(
+                points, n_points, self._representative_method, init, random_state=self._seed
             )
 
-            zbars = pareto_front[subset_indices][closest]
+            zbars = points[closest]
 
         else:
             zbars = pareto_front[subset_indices]
@@ -422,31 +596,30 @@ class ENautilus(InteractiveMethod):
             pareto_front (np.ndarray): The Pareto optimal front.
             intermediate_points (np.ndarray): The current intermediate points as a 2D array.
 
+        Raises:
+            ENautilusException: No solutions are reachable from an intermediate point in some objective.
+
         Returns:
             Tuple[np.ndarray, np.ndarray]: The lower and upper bounds for each of the intermediate points.
         """
-        _pareto_front = np.atleast_2d(pareto_front)
-        n_points = np.atleast_2d(intermediate_points).shape[0]
-        new_lower_bounds = np.zeros((n_points, _pareto_front.shape[1]))
-        new_upper_bounds = np.zeros((n_points, _pareto_front.shape[1]))
-
-        for i, point in enumerate(np.atleast_2d(intermediate_points)):
-            # TODO: vectorize this loop
-            for r in range(_pareto_front.shape[1]):
-                mask = np.zeros(_pareto_front.shape[1], dtype=bool)
-                mask[r] = True
-
-                subject_to = _pareto_front[:, ~mask].reshape(
-                    (_pareto_front.shape[0], _pareto_front.shape[1] - 1)
-                )
+        # all the bounds in a single chunked pass over the front, with the rows compared to all the points at once
+        new_lower_bounds, new_upper_bounds, found = batched_leave_one_out_bounds(
+            np.atleast_2d(pareto_front), np.atleast_2d(intermediate_points)
+        )
 
-                con_mask = np.all(subject_to <= point[~mask], axis=1)
+        _check_reachable(found)
+
+        return new_lower_bounds, new_upper_bounds
 
-                min_val = np.min(_pareto_front[con_mask, mask])
-                max_val = np.max(_pareto_front[con_mask, mask])
+    def _calculate_bounds(self, intermediate_points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # the bounds over the whole front, queried from the index when there is one
+        if self._index is None:
+            return self.calculate_bounds(self._pareto_front, intermediate_points)
 
-                new_lower_bounds[i, r] = min_val
-                new_upper_bounds[i, r] = max_val
+        bounds = [self._index.leave_one_out_bounds(point) for point in np.atleast_2d(intermediate_points)]
+        new_lower_bounds, new_upper_bounds, found = (np.array(arrays) for arrays in zip(*bounds))
+
+        _check_reachable(found)
 
         return new_lower_bounds, new_upper_bounds
 
@@ -482,9 +655,4 @@ class ENautilus(InteractiveMethod):
         Returns:
             List[int]: List of the indices of the reachable solutions.
         """
-        low_idx = np.all(pareto_front >= lower_bounds, axis=1)
-        up_idx = np.all(pareto_front <= upper_bounds, axis=1)
-
-        reachable_idx = np.argwhere(low_idx & up_idx).squeeze()
-
-        return reachable_idx
+        return points_within_bounds(pareto_front, lower_bounds, upper_bounds).squeeze()
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, Union
+import logging
+from contextlib import contextmanager
+from copy import copy
+from functools import partial
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
-from desdeo_mcdm.utilities.solvers import payoff_table_method
+from desdeo_mcdm.utilities.cache import EvaluationCache
+from desdeo_mcdm.utilities.fronts import iter_chunks
+from desdeo_mcdm.utilities.solvers import (
+    PayoffTableCache,
+    SolverConfiguration,
+    is_warm_started,
+    make_de_method,
+    managed_executor,
+    payoff_table_method,
+)
 from desdeo_problem.problem import DiscreteDataProblem, MOProblem
 from desdeo_tools.interaction.request import BaseRequest, SimplePlotRequest
 from desdeo_tools.scalarization.ASF import AugmentedGuessASF, MaxOfTwoASF, PointMethodASF, SimpleASF, StomASF
-from desdeo_tools.scalarization.Scalarizer import DiscreteScalarizer, Scalarizer
-from desdeo_tools.solver.ScalarSolver import DiscreteMinimizer, ScalarMethod, ScalarMinimizer
+from desdeo_tools.scalarization.Scalarizer import Scalarizer
+from desdeo_tools.solver.ScalarSolver import ScalarMethod, ScalarMinimizer
+
+logger = logging.getLogger(__name__)
 
 
 class NimbusException(Exception):
@@ -131,6 +147,8 @@ class NimbusSaveRequest(BaseRequest):
     Args:
         solution_vectors (List[np.ndarray]): A list of numpy arrays each representing a decision variable vector.
         objective_vectors (List[np.ndarray]): A list of numpy arrays each representing an objective vector.
+        subproblem_times (Optional[Dict[str, float]], optional): The wall time in seconds spent solving the
+            subproblem of each scalarizing function that produced the solutions. Defaults to None.
 
     Note:
         The objective vector at position 'i' in `objective_vectors` should correspond to the decision variables at
@@ -138,7 +156,10 @@ class NimbusSaveRequest(BaseRequest):
     """
 
     def __init__(
-        self, solution_vectors: List[np.ndarray], objective_vectors: List[np.ndarray],
+        self,
+        solution_vectors: List[np.ndarray],
+        objective_vectors: List[np.ndarray],
+        subproblem_times: Optional[Dict[str, float]] = None,
     ):
         msg = (
             "Please specify which solutions shown you would like to save for later viewing. Supply the "
@@ -150,6 +171,7 @@ class NimbusSaveRequest(BaseRequest):
             "solutions": solution_vectors,
             "objectives": objective_vectors,
             "indices": [],
+            "subproblem_times": {} if subproblem_times is None else subproblem_times,
         }
         super().__init__("classification_preference", "required", content=content)
 
@@ -351,6 +373,234 @@ class NimbusStopRequest(BaseRequest):
         super().__init__("classification_preference", "no_interaction", content=content)
 
 
+class DiscreteNimbusEngine:
+    """Minimizes the ASFs used in NIMBUS over a discrete set of objective vectors.
+
+    Each of the ASFs is the maximum of affine functions of some of the
+    objectives, plus a weighted sum of the objectives. The objective vectors
+    are normalized once using the ideal and nadir points and kept in a
+    contiguous buffer, and the ASFs are minimized together in a single pass
+    over the buffer, a chunk of rows at a time.
+
+    Args:
+        objectives (np.ndarray): A 2D array with an objective vector on each row.
+        ideal (np.ndarray): The ideal point used in the normalization.
+        nadir (np.ndarray): The nadir point used in the normalization.
+        dtype (np.dtype, optional): The type of the normalized buffer. Use
+            float32 to halve the memory used by large sets of objective
+            vectors, at the cost of precision. Defaults to np.float64.
+        chunksize (int, optional): The number of rows processed at a time. Defaults to 16384.
+        precompute (Optional[bool], optional): Whether to keep the normalized
+            buffer in memory. Otherwise each chunk is normalized when needed,
+            and no copies of the objectives are made. Defaults to None, which
+            precomputes the buffer unless the objectives are memory-mapped.
+    """
+
+    def __init__(
+        self,
+        objectives: np.ndarray,
+        ideal: np.ndarray,
+        nadir: np.ndarray,
+        dtype: np.dtype = np.float64,
+        chunksize: int = 16384,
+        precompute: Optional[bool] = None,
+    ):
+        ideal = np.asarray(ideal, dtype=float)
+        scale = np.asarray(nadir, dtype=float) - ideal
+
+        self._shift = ideal
+        # an objective with an equal ideal and nadir value is left unscaled
+        self._scale = np.where(scale != 0, scale, 1.0)
+        self._dtype = dtype
+        self._chunksize = chunksize
+
+        if precompute is None:
+            precompute = not isinstance(objectives, np.memmap)
+
+        if precompute:
+            self._objectives = None
+            self._normalized = np.ascontiguousarray((np.asarray(objectives) - self._shift) / self._scale, dtype=dtype)
+        else:
+            self._objectives = objectives
+            self._normalized = None
+
+    def __len__(self) -> int:
+        return len(self._normalized if self._normalized is not None else self._objectives)
+
+    def _iter_normalized(self) -> Iterator[Tuple[int, np.ndarray]]:
+        if self._normalized is not None:
+            yield from iter_chunks(self._normalized, self._chunksize)
+        else:
+            for start, chunk in iter_chunks(self._objectives, self._chunksize):
+                yield start, ((chunk - self._shift) / self._scale).astype(self._dtype, copy=False)
+
+    def _affine(self, asf, reference_point: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # coefficients a, b and c of an ASF of the form max_i(a_i * f_i + b_i) + sum_i(c_i * f_i), with b_i = -inf
+        # excluding an objective from the maximum
+        k = len(self._shift)
+        z = np.asarray(reference_point, dtype=float).reshape(-1)
+        a, b = np.zeros(k), np.full(k, -np.inf)
+
+        if isinstance(asf, MaxOfTwoASF):
+            w = asf.nadir - (asf.ideal - asf.rho)
+            a[asf.lt_inds] = 1 / w[asf.lt_inds]
+            b[asf.lt_inds] = -asf.ideal[asf.lt_inds] / w[asf.lt_inds]
+            a[asf.lte_inds] = 1 / w[asf.lte_inds]
+            b[asf.lte_inds] = -z[asf.lte_inds] / w[asf.lte_inds]
+            c = asf.rho_sum / w
+
+        elif isinstance(asf, StomASF):
+            uto = asf.ideal - asf.rho
+            a, b = 1 / (z - uto), -uto / (z - uto)
+            c = asf.rho_sum / (z - uto)
+
+        elif isinstance(asf, PointMethodASF):
+            w = asf.nadir - (asf.ideal - asf.rho)
+            a, b = 1 / w, -z / w
+            c = asf.rho_sum / w
+
+        elif isinstance(asf, AugmentedGuessASF):
+            included = np.ones(k, dtype=bool)
+            included[asf.index_to_exclude] = False
+            d = asf.nadir - z
+            w = asf.nadir - (asf.ideal - asf.rho)
+            a[included] = 1 / d[included]
+            b[included] = -asf.nadir[included] / d[included]
+            c = np.where(included, asf.rho_sum / np.where(included, d, 1), asf.rho_sum / w)
+
+        else:
+            raise NimbusException(f"Unsupported ASF {type(asf).__name__} for the discrete engine.")
+
+        return a, b, c
+
+    def minimize(
+        self,
+        asfs: List,
+        reference_points: List[np.ndarray],
+        upper_bounds: Optional[np.ndarray] = None,
+        constrained: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Finds the objective vector minimizing each of the given ASFs.
+
+        Args:
+            asfs (List): The ASFs to be minimized. Each should be a MaxOfTwoASF, StomASF,
+                PointMethodASF, or AugmentedGuessASF.
+            reference_points (List[np.ndarray]): A reference point for each ASF.
+            upper_bounds (Optional[np.ndarray], optional): Upper bounds for the objective values of
+                the vectors considered when minimizing the constrained ASFs. Use np.inf to leave an
+                objective unbounded. Defaults to None.
+            constrained (Optional[np.ndarray], optional): A boolean array indicating which of the ASFs
+                are subject to upper_bounds. Defaults to None, which constrains all of them.
+
+        Raises:
+            NimbusException: None of the objective vectors satisfy the upper bounds.
+
+        Returns:
+            np.ndarray: The index of the objective vector minimizing each ASF.
+        """
+        terms = [self._affine(asf, z) for (asf, z) in zip(asfs, reference_points)]
+        a, b, c = (np.stack(coefficients) for coefficients in zip(*terms))
+
+        # the same ASFs expressed for the normalized objectives
+        b = a * self._shift + b
+        a = a * self._scale
+        d = c @ self._shift
+        c = c * self._scale
+
+        if upper_bounds is not None:
+            upper_bounds = (np.asarray(upper_bounds, dtype=float) - self._shift) / self._scale
+            constrained = np.ones(len(asfs), dtype=bool) if constrained is None else np.asarray(constrained)
+
+        best_values = np.full(len(asfs), np.inf)
+        best_indices = np.full(len(asfs), -1)
+        columns = np.arange(len(asfs))
+
+        for start, g in self._iter_normalized():
+            # each ASF for each row in the chunk, a row of ASF values for each objective vector
+            values = np.max(g[:, None, :] * a + b, axis=2) + g @ c.T + d
+            values[np.isnan(values)] = np.inf
+
+            if upper_bounds is not None:
+                infeasible = np.any(g > upper_bounds, axis=1)
+                values[np.ix_(infeasible, constrained)] = np.inf
+
+            rows = np.argmin(values, axis=0)
+            chunk_values = values[rows, columns]
+
+            better = chunk_values < best_values
+            best_values[better] = chunk_values[better]
+            best_indices[better] = start + rows[better]
+
+        if np.any(best_indices < 0):
+            raise NimbusException("None of the objective vectors satisfy the given upper bounds.")
+
+        return best_indices
+
+
+def _problem_constraints(evaluations: EvaluationCache, xs: np.ndarray) -> np.ndarray:
+    # the constraints of the problem
+    return evaluations.evaluate(xs).constraints.squeeze()
+
+
+def _classification_constraints(
+    evaluations: EvaluationCache,
+    f_current: np.ndarray,
+    levels: np.ndarray,
+    improve_inds: np.ndarray,
+    improve_until_inds: np.ndarray,
+    acceptable_inds: np.ndarray,
+    impaire_until_inds: np.ndarray,
+    xs: np.ndarray,
+) -> np.ndarray:
+    # the constraints of the problem and the classification, a row of constraint values for each row in xs
+    f = np.atleast_2d(evaluations.evaluate(xs).objectives)
+
+    res_1 = f_current[improve_inds] - f[:, improve_inds]
+    res_2 = f_current[improve_until_inds] - f[:, improve_until_inds]
+    res_3 = f_current[acceptable_inds] - f[:, acceptable_inds]
+    res_4 = levels[impaire_until_inds] - f[:, impaire_until_inds]
+
+    res = np.hstack((res_1, res_2, res_3, res_4))
+
+    if evaluations.problem.n_of_constraints > 0:
+        res_prob = np.reshape(evaluations.evaluate(xs).constraints, (len(f), -1))
+
+        res = np.hstack((res_prob, res))
+
+    return res[0] if np.ndim(xs) == 1 else res
+
+
+def _solve_subproblem(
+    evaluations: EvaluationCache,
+    asf,
+    reference_point: np.ndarray,
+    bounds: np.ndarray,
+    constraint_evaluator: Optional[Callable[[np.ndarray], np.ndarray]],
+    method: Optional[Union[ScalarMethod, str]],
+    x0: np.ndarray,
+) -> Dict:
+    """Minimizes the ASF of a NIMBUS subproblem.
+
+    Defined on the module level so that it can be sent to worker processes.
+
+    Returns:
+        Dict: The result of the minimization.
+    """
+    scalarizer = Scalarizer(evaluations.objectives, asf, scalarizer_args={"reference_point": reference_point})
+
+    # the minimizer shifts the bounds in place, work on a copy
+    solver = ScalarMinimizer(scalarizer, np.copy(bounds), constraint_evaluator, method=method)
+
+    return solver.minimize(x0)
+
+
+def _timed_solve(solve: Callable[[], Dict]) -> Tuple[Dict, float]:
+    # the result of a subproblem, and the wall time in seconds spent solving it
+    start = perf_counter()
+    res = solve()
+    return res, perf_counter() - start
+
+
 class NIMBUS(InteractiveMethod):
     """Implements the synchronous NIMBUS algorithm.
 
@@ -360,25 +610,74 @@ class NIMBUS(InteractiveMethod):
             the various ASF minimization problems present in the method. Defaults to 'scipy_de' (differential evolution).
         starting_point(Optional[np.ndarray], optional): The initial solution (objectives) to start classification from.
             If None, a neutral starting point will be computed. 
+        solver_configuration (Optional[SolverConfiguration], optional): Configures how all the subproblems,
+            including the payoff table, are solved. Overrides scalar_method when given. With warm_start, the
+            subproblems start from the current and archived solutions, and the latest intermediate solutions. The
+            method must then be 'scipy_de' or made with make_de_method(..., warm_start=True). When an executor is
+            configured, the new solutions of each classification are computed concurrently. With a process
+            executor, the problem and the method must be picklable, e.g., with their functions defined on the module
+            level. With a seed, differential evolution is seeded and the method gives the same solutions for the same
+            classifications. Defaults to None.
+        payoff_table_cache (Optional[PayoffTableCache], optional): A persistent cache for the payoff table,
+            used when the ideal and nadir points of the problem are not defined. Defaults to None.
+
+    Raises:
+        NimbusException: Warm starting is configured with a method that does not accept a 2D initial guess.
+
+    Attributes:
+        phase_times (Dict[str, float]): The wall time in seconds of the latest run of each phase:
+            'payoff_table', 'initial_solution', 'new_solutions', and 'intermediate_solutions'.
+
     Note:
         When a starting point is supplied, decision variables of that point will be approximated to be the variables of the
         solution closest to the starting point. In other words, the decision variables associated to the initial point may be
         inaccurate!
     """
 
-    def __init__(self, problem: Union[MOProblem, DiscreteDataProblem], scalar_method: Optional[Union[ScalarMethod, str]] = "scipy_de", starting_point: Optional[np.ndarray] = None):
+    def __init__(
+        self,
+        problem: Union[MOProblem, DiscreteDataProblem],
+        scalar_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+        starting_point: Optional[np.ndarray] = None,
+        solver_configuration: Optional[SolverConfiguration] = None,
+        payoff_table_cache: Optional[PayoffTableCache] = None,
+    ):
+        # wall times of the phases of the method, in seconds
+        self.phase_times: Dict[str, float] = {}
+
+        if solver_configuration is None:
+            solver_configuration = SolverConfiguration(scalar_method)
+        else:
+            # do not modify the configuration supplied by the user
+            solver_configuration = copy(solver_configuration)
+
+        if solver_configuration.method == "scipy_de":
+            # evaluate each generation of differential evolution as a single batch
+            solver_configuration.method = make_de_method(
+                {"polish": True, "seed": solver_configuration.seed}, warm_start=solver_configuration.warm_start
+            )
+
+        if solver_configuration.warm_start and not is_warm_started(solver_configuration.method):
+            raise NimbusException(
+                "Warm starting supplies a 2D initial guess, which only methods made with "
+                "make_de_method(..., warm_start=True) accept."
+            )
+
+        self._solver_configuration = solver_configuration
+        self._scalar_method = solver_configuration.method
+
         # check if ideal and nadir are defined
         if problem.ideal is None or problem.nadir is None:
-            # TODO: use same method as defined in scalar_method
-            ideal, nadir = payoff_table_method(problem)
+            with self._timed("payoff_table"):
+                ideal, nadir = payoff_table_method(
+                    problem, configuration=self._solver_configuration, cache=payoff_table_cache
+                )
             self._ideal = ideal
             self._nadir = nadir
         else:
             self._ideal = problem.ideal
             self._nadir = problem.nadir
 
-        self._scalar_method = scalar_method
-
         # check starting point if given
         if starting_point is not None:
             if np.squeeze(starting_point).shape != np.squeeze(self._ideal.shape):
@@ -387,6 +686,9 @@ class NIMBUS(InteractiveMethod):
                     )
 
         if isinstance(problem, MOProblem):
+            # the objectives and constraints share the evaluations of the problem
+            self._evaluations = EvaluationCache(problem)
+
             # Change me to be the right ASF
             # if starting point was given, use that as the reference point
             if starting_point is None:
@@ -396,13 +698,13 @@ class NIMBUS(InteractiveMethod):
 
             asf = PointMethodASF(self._nadir, self._ideal)
             scalarizer = Scalarizer(
-                lambda x: problem.evaluate(x).objectives,
+                self._evaluations.objectives,
                 asf,
                 scalarizer_args={"reference_point": reference_point},
             )
 
             if problem.n_of_constraints > 0:
-                _con_eval = lambda x: problem.evaluate(x).constraints.squeeze()
+                _con_eval = lambda x: self._evaluations.evaluate(x).constraints.squeeze()
             else:
                 _con_eval = None
 
@@ -412,11 +714,12 @@ class NIMBUS(InteractiveMethod):
             # TODO: fix tools to check for scipy methods in general and delete me!
             solver._use_scipy = True
 
-            res = solver.minimize(problem.get_variable_upper_bounds() / 2)
+            with self._timed("initial_solution"):
+                res = solver.minimize(problem.get_variable_upper_bounds() / 2)
 
             if res["success"]:
                 self._current_solution = res["x"]
-                self._current_objectives = problem.evaluate(self._current_solution).objectives.squeeze()
+                self._current_objectives = self._evaluations.evaluate(self._current_solution).objectives.squeeze()
             else:
                 raise NimbusException("Could not solve the initial ASF.")
 
@@ -427,13 +730,13 @@ class NIMBUS(InteractiveMethod):
             else:
                 reference_point = starting_point
 
-            asf = PointMethodASF(self._nadir, self._ideal)
-            scalarizer = DiscreteScalarizer(asf, scalarizer_args={"reference_point": reference_point})
-            solver = DiscreteMinimizer(scalarizer)
+            # the objective vectors are normalized once, and shared by all the subproblems
+            self._discrete_engine = DiscreteNimbusEngine(problem.objectives, self._ideal, self._nadir)
 
-            res = solver.minimize(problem.objectives)
-            self._current_solution = problem.decision_variables[res["x"]]
-            self._current_objectives = problem.objectives[res["x"]]
+            with self._timed("initial_solution"):
+                (index,) = self._discrete_engine.minimize([PointMethodASF(self._nadir, self._ideal)], [reference_point])
+            self._current_solution = problem.decision_variables[index]
+            self._current_objectives = problem.objectives[index]
 
         else:
             # unsupported problem type
@@ -441,10 +744,58 @@ class NIMBUS(InteractiveMethod):
 
         self._archive_solutions = []
         self._archive_objectives = []
+        # the latest intermediate solutions, used to warm start the subproblems
+        self._intermediate_solutions = []
         self._state = "classify"
 
         super().__init__(problem)
 
+    @contextmanager
+    def _timed(self, phase: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[phase] = perf_counter() - start
+            logger.info(f"NIMBUS phase '{phase}' took {self.phase_times[phase]:.3f} seconds.")
+
+    def _initial_guess(self) -> np.ndarray:
+        """Returns the initial guess for the subproblems. When warm starting, the archived and intermediate
+        solutions are stacked below the current solution."""
+        if not self._solver_configuration.warm_start:
+            return self._current_solution
+
+        return np.vstack([self._current_solution, *self._archive_solutions, *self._intermediate_solutions])
+
+    def _solve_subproblems(
+        self, subproblems: List[Tuple[str, Callable[[], Dict]]]
+    ) -> Tuple[List[Dict], Dict[str, float]]:
+        """Solves independent subproblems, concurrently if an executor has been configured.
+
+        Args:
+            subproblems (List[Tuple[str, Callable[[], Dict]]]): The name of each subproblem and a function
+                solving it. The functions are sent to the worker processes of a process executor.
+
+        Returns:
+            Tuple[List[Dict], Dict[str, float]]: The results of the subproblems in the order given, and the wall
+            time in seconds spent solving each subproblem, keyed by name.
+        """
+
+        solves = [solve for (_, solve) in subproblems]
+        executor = self._solver_configuration.executor
+
+        if executor is None or len(solves) < 2:
+            outcomes = [_timed_solve(solve) for solve in solves]
+        else:
+            with managed_executor(executor, self._solver_configuration.n_workers) as pool:
+                outcomes = list(pool.map(_timed_solve, solves))
+
+        subproblem_times = {name: elapsed for ((name, _), (_, elapsed)) in zip(subproblems, outcomes)}
+        for name, elapsed in subproblem_times.items():
+            logger.info(f"NIMBUS subproblem '{name}' took {elapsed:.3f} seconds.")
+
+        return [res for (res, _) in outcomes], subproblem_times
+
     def start(self) -> Tuple[NimbusClassificationRequest, SimplePlotRequest]:
         """Return the first request to start iterating NIMBUS.
         
@@ -515,15 +866,16 @@ class NIMBUS(InteractiveMethod):
         impaire_until_inds = np.where(np.array(request.response["classifications"]) == ">=")[0]
 
         # calculate the new solutions
-        return self.calculate_new_solutions(
-            int(request.response["number_of_solutions"]),
-            np.array(request.response["levels"]),
-            improve_inds,
-            improve_until_inds,
-            acceptable_inds,
-            impaire_until_inds,
-            free_inds,
-        )
+        with self._timed("new_solutions"):
+            return self.calculate_new_solutions(
+                int(request.response["number_of_solutions"]),
+                np.array(request.response["levels"]),
+                improve_inds,
+                improve_until_inds,
+                acceptable_inds,
+                impaire_until_inds,
+                free_inds,
+            )
 
     def handle_save_request(
         self, request: NimbusSaveRequest
@@ -563,10 +915,11 @@ class NIMBUS(InteractiveMethod):
             returned with the solutions available in it.
         """
         if len(request.response["indices"]) > 0:
-            return self.compute_intermediate_solutions(
-                np.array(request.content["solutions"])[request.response["indices"]],
-                int(request.response["number_of_desired_solutions"]),
-            )
+            with self._timed("intermediate_solutions"):
+                return self.compute_intermediate_solutions(
+                    np.array(request.content["solutions"])[request.response["indices"]],
+                    int(request.response["number_of_desired_solutions"]),
+                )
 
         return self.request_most_preferred_solution(
             np.array(request.content["solutions"]), np.array(request.content["objectives"]),
@@ -667,47 +1020,51 @@ class NIMBUS(InteractiveMethod):
         intermediate_points = np.array([solutions[1] + i * step_size * between_norm for i in range(1, n_desired + 1)])
 
         # project each of the intermediate solutions to the Pareto front
-        intermediate_solutions = np.zeros(intermediate_points.shape)
-        intermediate_objectives = np.zeros((n_desired, self._problem.n_of_objectives))
         asf = PointMethodASF(self._nadir, self._ideal)
+        subproblem_times = None
 
-        for i in range(n_desired):
-            if isinstance(self._problem, MOProblem):
-                scalarizer = Scalarizer(
-                    lambda x: self._problem.evaluate(x).objectives,
-                    asf,
-                    scalarizer_args={"reference_point": self._problem.evaluate(intermediate_points[i]).objectives},
-                )
+        if isinstance(self._problem, MOProblem):
+            # the reference points of all the projections in a single evaluation
+            reference_points = np.atleast_2d(self._evaluations.evaluate(intermediate_points).objectives)
 
-                if self._problem.n_of_constraints > 0:
-                    cons = lambda x: self._problem.evaluate(x).constraints.squeeze()
-                else:
-                    cons = None
+            if self._problem.n_of_constraints > 0:
+                cons = partial(_problem_constraints, self._evaluations)
+            else:
+                cons = None
 
-                solver = ScalarMinimizer(
-                    scalarizer, self._problem.get_variable_bounds(), cons, method=self._scalar_method,
-                )
+            bounds = self._problem.get_variable_bounds()
+            x0 = self._initial_guess()
 
-                res = solver.minimize(self._current_solution)
-                intermediate_solutions[i] = res["x"]
-                intermediate_objectives[i] = self._problem.evaluate(res["x"]).objectives
+            # the projections only differ in their reference point, and may be solved concurrently
+            results, subproblem_times = self._solve_subproblems(
+                [
+                    (
+                        f"intermediate_{i}",
+                        partial(_solve_subproblem, self._evaluations, asf, z, bounds, cons, self._scalar_method, x0),
+                    )
+                    for (i, z) in enumerate(reference_points)
+                ]
+            )
+            intermediate_solutions = np.array([res["x"] for res in results])
+            intermediate_objectives = np.atleast_2d(self._evaluations.evaluate(intermediate_solutions).objectives)
 
-            else:
-                # discrete case
-                scalarizer = DiscreteScalarizer(
-                    asf,
-                    scalarizer_args={
-                        "reference_point": self._problem.objectives[self._problem.find_closest(intermediate_points[i])]
-                    },
-                )
-                solver = DiscreteMinimizer(scalarizer)
+        else:
+            # discrete case, all the projections are computed in a single pass
+            reference_points = [
+                self._problem.objectives[self._problem.find_closest(point)] for point in intermediate_points
+            ]
+            indices = self._discrete_engine.minimize([asf] * n_desired, reference_points)
+
+            intermediate_solutions = self._problem.decision_variables[indices]
+            intermediate_objectives = self._problem.objectives[indices]
 
-                res = solver.minimize(self._problem.objectives)
-                intermediate_solutions[i] = self._problem.decision_variables[res["x"]]
-                intermediate_objectives[i] = self._problem.objectives[res["x"]]
+        # only the latest are kept, so that the initial guess does not grow over the session
+        self._intermediate_solutions = list(intermediate_solutions)
 
         # create appropriate requests
-        save_request = NimbusSaveRequest(list(intermediate_solutions), list(intermediate_objectives))
+        save_request = NimbusSaveRequest(
+            list(intermediate_solutions), list(intermediate_objectives), subproblem_times=subproblem_times
+        )
 
         msg = "Computed intermediate solutions"
         plot_request = self.create_plot_request(intermediate_objectives, msg)
@@ -777,178 +1134,91 @@ class NIMBUS(InteractiveMethod):
             Tuple[NimbusSaveRequest, SimplePlotRequest]: A save request with the newly computed solutions, and 
             a plot request to visualize said solutions.
         """
-        results = []
-
-        # always computed
-        asf_1 = MaxOfTwoASF(self._nadir, self._ideal, improve_inds, improve_until_inds)
+        x0 = self._initial_guess()
+
+        # the reference point used by all the ASFs but the first one
+        z_bar = np.zeros(self._problem.n_of_objectives)
+        z_bar[improve_inds] = self._ideal[improve_inds]
+        z_bar[improve_until_inds] = levels[improve_until_inds]
+        z_bar[acceptable_inds] = self._current_objectives[acceptable_inds]
+        z_bar[impaire_until_inds] = levels[impaire_until_inds]
+        z_bar[free_inds] = self._nadir[free_inds]
+
+        # the first ASF is always computed, the rest as requested
+        asfs = [
+            ("MaxOfTwoASF", MaxOfTwoASF(self._nadir, self._ideal, improve_inds, improve_until_inds), levels),
+            ("StomASF", StomASF(self._ideal), z_bar),
+            ("PointMethodASF", PointMethodASF(self._nadir, self._ideal), z_bar),
+            ("AugmentedGuessASF", AugmentedGuessASF(self._nadir, self._ideal, free_inds), z_bar),
+        ][: max(number_of_solutions, 1)]
 
         if isinstance(self._problem, MOProblem):
-
-            def cons_1(
-                x: np.ndarray,
-                f_current: np.ndarray = self._current_objectives,
-                levels: np.ndarray = levels,
-                improve_until_inds: np.ndarray = improve_until_inds,
-                improve_inds: np.ndarray = improve_inds,
-                impaire_until_inds: np.ndarray = impaire_until_inds,
-                acceptable_inds: np.ndarray = acceptable_inds,
-            ):
-                f = self._problem.evaluate(x).objectives.squeeze()
-
-                res_1 = f_current[improve_inds] - f[improve_inds]
-                res_2 = f_current[improve_until_inds] - f[improve_until_inds]
-                res_3 = f_current[acceptable_inds] - f[acceptable_inds]
-                res_4 = levels[impaire_until_inds] - f[impaire_until_inds]
-
-                res = np.hstack((res_1, res_2, res_3, res_4))
-
-                if self._problem.n_of_constraints > 0:
-                    res_prob = self._problem.evaluate(x).constraints.squeeze()
-
-                    return np.hstack((res_prob, res))
-
-                else:
-                    return res
-
-            scalarizer_1 = Scalarizer(
-                lambda x: self._problem.evaluate(x).objectives, asf_1, scalarizer_args={"reference_point": levels},
-            )
-
-            solver_1 = ScalarMinimizer(
-                scalarizer_1, self._problem.get_variable_bounds(), cons_1, method=self._scalar_method,
+            cons_1 = partial(
+                _classification_constraints,
+                self._evaluations,
+                self._current_objectives,
+                levels,
+                improve_inds,
+                improve_until_inds,
+                acceptable_inds,
+                impaire_until_inds,
             )
 
-            res_1 = solver_1.minimize(self._current_solution)
-
-        else:
-            # discrete case
-            def cons_1(
-                objective_vectors: np.ndarray,
-                f_current: np.ndarray = self._current_objectives,
-                levels: np.ndarray = levels,
-                improve_until_inds: np.ndarray = improve_until_inds,
-                improve_inds: np.ndarray = improve_inds,
-                impaire_until_inds: np.ndarray = impaire_until_inds,
-                acceptable_inds: np.ndarray = acceptable_inds,
-            ):
-                res_1 = f_current[improve_inds] - objective_vectors[:, improve_inds]
-                res_2 = f_current[improve_until_inds] - objective_vectors[:, improve_until_inds]
-                res_3 = f_current[acceptable_inds] - objective_vectors[:, acceptable_inds]
-                res_4 = levels[impaire_until_inds] - objective_vectors[:, impaire_until_inds]
-
-                res = np.hstack((res_1, res_2, res_3, res_4)) >= 0
-
-                return np.all(res, axis=1)
-
-            scalarizer_1 = DiscreteScalarizer(asf_1, scalarizer_args={"reference_point": levels})
-
-            solver_1 = DiscreteMinimizer(scalarizer_1, cons_1)
-
-            res_1 = solver_1.minimize(self._problem.objectives)
-
-        results.append(res_1)
-
-        if number_of_solutions > 1:
-            # create the reference point needed in the rest of the ASFs
-            z_bar = np.zeros(self._problem.n_of_objectives)
-            z_bar[improve_inds] = self._ideal[improve_inds]
-            z_bar[improve_until_inds] = levels[improve_until_inds]
-            z_bar[acceptable_inds] = self._current_objectives[acceptable_inds]
-            z_bar[impaire_until_inds] = levels[impaire_until_inds]
-            z_bar[free_inds] = self._nadir[free_inds]
-
-            # second ASF
-            asf_2 = StomASF(self._ideal)
-
-            # cons_2 can be used in the rest of the ASF scalarizations, it's not a bug!
-            if isinstance(self._problem, MOProblem) and self._problem.n_of_constraints > 0:
-                cons_2 = lambda x: self._problem.evaluate(x).constraints.squeeze()
+            # cons_2 is used in the rest of the ASF scalarizations, it's not a bug!
+            if self._problem.n_of_constraints > 0:
+                cons_2 = partial(_problem_constraints, self._evaluations)
             else:
                 cons_2 = None
 
-            if isinstance(self._problem, MOProblem):
-                scalarizer_2 = Scalarizer(
-                    lambda x: self._problem.evaluate(x).objectives, asf_2, scalarizer_args={"reference_point": z_bar},
-                )
-
-                solver_2 = ScalarMinimizer(
-                    scalarizer_2, self._problem.get_variable_bounds(), cons_2, method=self._scalar_method,
-                )
-
-                res_2 = solver_2.minimize(self._current_solution)
-
-            else:
-                # discrete case
-                scalarizer_2 = DiscreteScalarizer(asf_2, scalarizer_args={"reference_point": z_bar})
-
-                solver_2 = DiscreteMinimizer(scalarizer_2, cons_2)
-
-                res_2 = solver_2.minimize(self._problem.objectives)
-
-            results.append(res_2)
-
-        if number_of_solutions > 2:
-            # asf 3
-            asf_3 = PointMethodASF(self._nadir, self._ideal)
-
-            if isinstance(self._problem, MOProblem):
-                scalarizer_3 = Scalarizer(
-                    lambda x: self._problem.evaluate(x).objectives, asf_3, scalarizer_args={"reference_point": z_bar},
-                )
-
-                solver_3 = ScalarMinimizer(
-                    scalarizer_3, self._problem.get_variable_bounds(), cons_2, method=self._scalar_method,
-                )
-
-                res_3 = solver_3.minimize(self._current_solution)
-
-            else:
-                # discrete case
-                scalarizer_3 = DiscreteScalarizer(asf_3, scalarizer_args={"reference_point": z_bar})
-
-                solver_3 = DiscreteMinimizer(scalarizer_3, cons_2)
-
-                res_3 = solver_3.minimize(self._problem.objectives)
-
-            results.append(res_3)
-
-        if number_of_solutions > 3:
-            # asf 4
-            asf_4 = AugmentedGuessASF(self._nadir, self._ideal, free_inds)
-
-            if isinstance(self._problem, MOProblem):
-
-                scalarizer_4 = Scalarizer(
-                    lambda x: self._problem.evaluate(x).objectives, asf_4, scalarizer_args={"reference_point": z_bar},
-                )
-
-                solver_4 = ScalarMinimizer(
-                    scalarizer_4, self._problem.get_variable_bounds(), cons_2, method=self._scalar_method,
+            # the subproblems are independent, collected here and solved together
+            bounds = self._problem.get_variable_bounds()
+            subproblems: List[Tuple[str, Callable[[], Dict]]] = [
+                (
+                    name,
+                    partial(
+                        _solve_subproblem,
+                        self._evaluations,
+                        asf,
+                        reference_point,
+                        bounds,
+                        cons_1 if i == 0 else cons_2,
+                        self._scalar_method,
+                        x0,
+                    ),
                 )
+                for i, (name, asf, reference_point) in enumerate(asfs)
+            ]
 
-                res_4 = solver_4.minimize(self._current_solution)
-
-            else:
-                # discrete case
-                scalarizer_4 = DiscreteScalarizer(asf_4, scalarizer_args={"reference_point": z_bar})
-
-                solver_4 = DiscreteMinimizer(scalarizer_4, cons_2)
-
-                res_4 = solver_4.minimize(self._problem.objectives)
+            results, subproblem_times = self._solve_subproblems(subproblems)
 
-            results.append(res_4)
-
-        # create the save request
-        if isinstance(self._problem, MOProblem):
             solutions = [res["x"] for res in results]
-            objectives = [self._problem.evaluate(x).objectives.squeeze() for x in solutions]
+            objectives = [self._evaluations.evaluate(x).objectives.squeeze() for x in solutions]
 
         else:
-            # discrete case
-            solutions = [self._problem.decision_variables[res["x"]] for res in results]
-            objectives = [self._problem.objectives[res["x"]] for res in results]
+            # discrete case, the first ASF may not impair the objectives to be improved or kept, nor exceed the
+            # bounds given for the objectives to be impaired
+            upper_bounds = np.full(self._problem.n_of_objectives, np.inf)
+            upper_bounds[improve_inds] = self._current_objectives[improve_inds]
+            upper_bounds[improve_until_inds] = self._current_objectives[improve_until_inds]
+            upper_bounds[acceptable_inds] = self._current_objectives[acceptable_inds]
+            upper_bounds[impaire_until_inds] = levels[impaire_until_inds]
+
+            constrained = np.zeros(len(asfs), dtype=bool)
+            constrained[0] = True
+
+            start = perf_counter()
+            indices = self._discrete_engine.minimize(
+                [asf for (_, asf, _) in asfs],
+                [reference_point for (_, _, reference_point) in asfs],
+                upper_bounds=upper_bounds,
+                constrained=constrained,
+            )
+            subproblem_times = {"fused": perf_counter() - start}
+
+            solutions = [self._problem.decision_variables[i] for i in indices]
+            objectives = [self._problem.objectives[i] for i in indices]
 
-        save_request = NimbusSaveRequest(solutions, objectives)
+        save_request = NimbusSaveRequest(solutions, objectives, subproblem_times=subproblem_times)
 
         msg = "Computed new solutions."
         plot_request = self.create_plot_request(objectives, msg)
@@ -1,12 +1,23 @@
+import hashlib
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
+from desdeo_mcdm.utilities.cache import LRUCache
+from desdeo_mcdm.utilities.fronts import (
+    FrontIndex,
+    as_front,
+    batched_argmin,
+    batched_leave_one_out_bounds,
+    chunked_argmin,
+    leave_one_out_bounds,
+    points_within_bounds,
+)
 from desdeo_tools.interaction.request import BaseRequest, SimplePlotRequest
 from desdeo_tools.scalarization.ASF import PointMethodASF
 from desdeo_tools.scalarization.Scalarizer import DiscreteScalarizer
-from desdeo_tools.solver.ScalarSolver import DiscreteMinimizer
 
 
 class NautilusNavigatorStopRequest(BaseRequest):
@@ -193,6 +204,22 @@ class NautilusNavigatorRequest(BaseRequest):
         self._response = response
 
 
+# the attributes updated by a navigation step
+_STEP_STATE = (
+    "_step_number",
+    "_steps_remaining",
+    "_navigation_point",
+    "_reachable_lb",
+    "_reachable_ub",
+    "_user_bounds",
+    "_reachable_idx",
+    "_distance",
+    "_reference_point",
+    "_projection_index",
+    "_current_speed",
+)
+
+
 class NautilusNavigatorException(Exception):
     """Raised when an exception related to NAUTILUS Navigator is encountered.
     """
@@ -204,9 +231,10 @@ class NautilusNavigator(InteractiveMethod):
     """Implementations of the NAUTILUS Navigator algorithm.
 
     Args:
-        pareto_front (np.ndarray): A two dimensional numpy array
+        pareto_front (Union[np.ndarray, str, Path]): A two dimensional numpy array
             representing a Pareto front with objective vectors on each of its
-            rows.
+            rows, or the path to a .npy file containing one. A file is
+            memory-mapped instead of being read into memory.
         ideal (np.ndarray): The ideal objective vector of the problem
             being represented by the Pareto front.
         nadir (np.ndarray): The nadir objective vector of the problem
@@ -216,6 +244,18 @@ class NautilusNavigator(InteractiveMethod):
             that can be optionally supplied. The i'th vector in 
             decision_variables should result in the i'th objective
             vector in pareto_front. Defaults to None.
+        use_index (bool, optional): Whether to build a FrontIndex over the
+            Pareto front on construction. The reachable solutions and the
+            bounds of the reachable region are then found by range queries
+            on the index instead of scanning the reachable solutions, which
+            pays off on large fronts navigated for many steps. Defaults to
+            False.
+        trajectory_cache_size (int, optional): The number of navigation steps
+            whose outcome is cached. Stepping forward from a state with the
+            same preferences as before, e.g., after going back to a previous
+            step, restores the cached outcome instead of computing the step
+            again. The least recently used steps are evicted first. Zero
+            disables the cache. Defaults to 32.
 
     Raises:
         NautilusNavigatorException: One or more dimension mismatches are
@@ -224,11 +264,15 @@ class NautilusNavigator(InteractiveMethod):
 
     def __init__(
         self,
-        pareto_front: np.ndarray,
+        pareto_front: Union[np.ndarray, str, Path],
         ideal: np.ndarray,
         nadir: np.ndarray,
         decision_variables: Optional[np.ndarray] = None,
+        use_index: bool = False,
+        trajectory_cache_size: int = 32,
     ):
+        pareto_front = as_front(pareto_front)
+
         if not pareto_front.ndim == 2:
             raise NautilusNavigatorException(
                 "The supplied Pareto front should be a two dimensional array. Found "
@@ -265,6 +309,9 @@ class NautilusNavigator(InteractiveMethod):
         # in objective space!
         self._pareto_front = pareto_front
 
+        # optional index for range queries over the front
+        self._index = FrontIndex(pareto_front) if use_index else None
+
         # bounds of the reachable region
         self._reachable_ub = self._nadir
         self._reachable_lb = self._ideal
@@ -273,7 +320,10 @@ class NautilusNavigator(InteractiveMethod):
         self._user_bounds = np.repeat(np.nan, self._ideal.size)
 
         # currently reachable solution as a list of indices of the Pareto front
-        self._reachable_idx = list(range(0, self._pareto_front.shape[0]))
+        self._reachable_idx = np.arange(self._pareto_front.shape[0])
+
+        # whether the reachable solutions must be searched from the whole front on the next step
+        self._rescan_reachable = False
 
         # current iteration step number
         self._step_number = 1
@@ -291,6 +341,9 @@ class NautilusNavigator(InteractiveMethod):
         self._navigation_point = self._nadir
         self._projection_index = None
 
+        # outcomes of the navigation steps taken, keyed by the state and preferences they were taken with
+        self._trajectory_cache = LRUCache(trajectory_cache_size) if trajectory_cache_size > 0 else None
+
     def start(self) -> NautilusNavigatorRequest:
         """Returns the first Request object to begin iterating.
 
@@ -422,11 +475,169 @@ class NautilusNavigator(InteractiveMethod):
             self._reachable_idx = reachable_idx
             self._distance = distance
             self._steps_remaining = steps_remaining
+            self._rescan_reachable = True
             return NautilusNavigatorRequest.init_with_method(self)
 
+        if self._trajectory_cache is None:
+            self._take_step(ref_point, speed, user_bounds)
+        else:
+            # a step taken before from the same state with the same preferences is restored
+            state = self._trajectory_cache.get_or_compute(
+                self._trajectory_key(ref_point, speed, user_bounds),
+                lambda: self._take_step(ref_point, speed, user_bounds),
+            )
+            for (attribute, value) in state.items():
+                setattr(self, attribute, value)
+            self._rescan_reachable = False
+
+        return NautilusNavigatorRequest.init_with_method(self)
+
+    def replay(
+        self, reference_points: np.ndarray, user_bounds: Optional[np.ndarray] = None, steps_remaining: int = 100,
+    ) -> Dict[str, np.ndarray]:
+        """Replays many scripted navigations from the start at once, e.g.,
+        for previewing the outcomes of different preferences.
+
+        The navigations are stepped forward together: the projections, the
+        bounds and the reachable regions of all of them are computed in single
+        passes over the Pareto front on each step. The outcome of each step is
+        the same as if it was taken by iterating a new NautilusNavigator, but
+        no requests are constructed or validated. The state of self is not
+        changed.
+
+        Args:
+            reference_points (np.ndarray): The reference point of each
+                navigation on each step, a 3D array of shape (number of
+                navigations, number of steps, number of objectives).
+            user_bounds (Optional[np.ndarray], optional): The user bounds
+                of each navigation on each step. Must be broadcastable to the
+                shape of reference_points. NaN's indicate 'no bound is given'.
+                Defaults to None.
+            steps_remaining (int, optional): The number of steps remaining at
+                the start of the navigations. Defaults to 100.
+
+        Raises:
+            NautilusNavigatorException: The reference points are of the wrong
+                shape or outside the ranges imposed by the ideal and nadir points.
+
+        Returns:
+            Dict[str, np.ndarray]: For each navigation and step, the
+            "navigation_points", the bounds of the reachable region
+            "reachable_lb" and "reachable_ub", the "distances" to the Pareto
+            front and the "projection_indices" of the reference points. Also
+            the "step_numbers" and the "steps_remaining" after each step.
+        """
+        reference_points = np.asarray(reference_points, dtype=float)
+        if reference_points.ndim != 3 or reference_points.shape[2] != self._ideal.size:
+            raise NautilusNavigatorException(
+                "The reference points should be a three dimensional array with a reference point "
+                f"for each navigation and step. Found an array of shape {reference_points.shape}."
+            )
+
+        if np.any(reference_points < self._ideal) or np.any(reference_points > self._nadir):
+            raise NautilusNavigatorException(
+                "The given reference points must be between the ranges imposed by the ideal and nadir points."
+            )
+
+        n_of_navigations, n_of_steps, n_of_objectives = reference_points.shape
+        if user_bounds is None:
+            user_bounds = np.full(reference_points.shape, np.nan)
+        user_bounds = np.broadcast_to(np.asarray(user_bounds, dtype=float), reference_points.shape)
+
+        navigation_points = np.zeros(reference_points.shape)
+        lower_bounds = np.zeros(reference_points.shape)
+        upper_bounds = np.zeros(reference_points.shape)
+        distances = np.zeros((n_of_navigations, n_of_steps))
+        projection_indices = np.zeros((n_of_navigations, n_of_steps), dtype=int)
+        step_numbers = np.zeros(n_of_steps, dtype=int)
+        steps_remaining_after = np.zeros(n_of_steps, dtype=int)
+
+        nav_points = np.tile(np.asarray(self._nadir, dtype=float), (n_of_navigations, 1))
+        reachable_lb = np.tile(np.asarray(self._ideal, dtype=float), (n_of_navigations, 1))
+        reachable_ub = np.tile(np.asarray(self._nadir, dtype=float), (n_of_navigations, 1))
+        # the reachable solutions lie within a box, at first the whole front is reachable
+        box_lb = np.full((n_of_navigations, n_of_objectives), -np.inf)
+        box_ub = np.full((n_of_navigations, n_of_objectives), np.inf)
+        previous_user_bounds = np.full((n_of_navigations, n_of_objectives), np.nan)
+        previous_reference_points = np.full((n_of_navigations, n_of_objectives), np.nan)
+        projections = np.zeros(n_of_navigations, dtype=int)
+        step_number = 1
+
+        asf = PointMethodASF(self._nadir, self._ideal)
+        scales = asf.nadir - (asf.ideal - asf.rho)
+
+        for step in range(n_of_steps):
+            ref_points = reference_points[:, step]
+
+            # like in update, the projections are only computed for changed reference points
+            if step_number == 1:
+                changed = np.ones(n_of_navigations, dtype=bool)
+            else:
+                changed = ~np.all(np.isclose(ref_points, previous_reference_points), axis=1)
+
+            if np.any(changed):
+                z, bounds = ref_points[changed], previous_user_bounds[changed]
+                lb, ub = box_lb[changed], box_ub[changed]
+
+                def batched_scalarizer(chunk: np.ndarray) -> np.ndarray:
+                    # the PointMethodASF of each changed navigation, NaN for unreachable solutions, computed one
+                    # objective at a time on arrays with solutions along the first axis and navigations along the second
+                    chunk = np.asarray(chunk)
+                    max_term = np.full((len(chunk), len(z)), -np.inf)
+                    infeasible = np.zeros((len(chunk), len(z)), dtype=bool)
+                    for j in range(n_of_objectives):
+                        column = chunk[:, j, None]
+                        np.maximum(max_term, (column - z[:, j]) / scales[j], out=max_term)
+                        infeasible |= (column > bounds[:, j]) | (column < lb[:, j]) | (column > ub[:, j])
+
+                    values = max_term + asf.rho_sum * np.sum(chunk / scales, axis=1)[:, None]
+                    values[infeasible] = np.nan
+                    return values
+
+                projections[changed], _ = batched_argmin(self._pareto_front, batched_scalarizer, int(np.sum(changed)))
+                previous_reference_points[changed] = ref_points[changed]
+
+            projected = np.asarray(self._pareto_front[projections])
+            nav_points = ((steps_remaining - 1) / steps_remaining) * nav_points + (1 / steps_remaining) * projected
+            previous_user_bounds = user_bounds[:, step]
+
+            new_lb, new_ub, found = batched_leave_one_out_bounds(
+                self._pareto_front, nav_points, previous_user_bounds, box_lb, box_ub
+            )
+            reachable_lb = np.where(found, new_lb, reachable_lb)
+            reachable_ub = np.where(found, new_ub, reachable_ub)
+            box_lb, box_ub = reachable_lb, reachable_ub
+
+            if steps_remaining > 1:
+                step_number += 1
+                steps_remaining -= 1
+
+            navigation_points[:, step] = nav_points
+            lower_bounds[:, step] = reachable_lb
+            upper_bounds[:, step] = reachable_ub
+            distances[:, step] = (
+                np.linalg.norm(nav_points - self._nadir, axis=1) / np.linalg.norm(projected - self._nadir, axis=1) * 100
+            )
+            projection_indices[:, step] = projections
+            step_numbers[step] = step_number
+            steps_remaining_after[step] = steps_remaining
+
+        return {
+            "navigation_points": navigation_points,
+            "reachable_lb": lower_bounds,
+            "reachable_ub": upper_bounds,
+            "distances": distances,
+            "projection_indices": projection_indices,
+            "step_numbers": step_numbers,
+            "steps_remaining": steps_remaining_after,
+        }
+
+    def _take_step(self, ref_point: np.ndarray, speed: int, user_bounds: np.ndarray) -> Dict:
+        # takes a navigation step and returns the updated state
+
         # compute a new navigation point closer to the Pareto front and the
         # bounds of the reachable Pareto optimal region.
-        elif self._step_number == 1 or not np.allclose(
+        if self._step_number == 1 or not np.allclose(
             ref_point, self._reference_point
         ):
             if self._step_number == 1:
@@ -451,15 +662,26 @@ class NautilusNavigator(InteractiveMethod):
         )
 
         self._navigation_point = new_nav
+        user_bounds_changed = not np.array_equal(
+            np.asarray(self._user_bounds, dtype=float), np.asarray(user_bounds, dtype=float), equal_nan=True
+        )
         self._user_bounds = user_bounds
 
-        new_lb, new_ub = self.calculate_bounds(
-            self._pareto_front[self._reachable_idx],
-            self._navigation_point,
-            self._user_bounds,
-            self._reachable_lb,
-            self._reachable_ub,
-        )
+        if self._index is None:
+            new_lb, new_ub = self.calculate_bounds(
+                self._pareto_front,
+                self._navigation_point,
+                self._user_bounds,
+                self._reachable_lb,
+                self._reachable_ub,
+                subset_indices=self._reachable_idx,
+            )
+        else:
+            new_lb, new_ub = self._calculate_bounds_with_index()
+
+        # the reachable region usually shrinks, and then only the solutions reachable so far need to be checked
+        region_shrunk = np.all(new_lb >= self._reachable_lb) and np.all(new_ub <= self._reachable_ub)
+        rescan = self._rescan_reachable or user_bounds_changed or not region_shrunk
 
         self._reachable_lb = new_lb
         self._reachable_ub = new_ub
@@ -472,40 +694,88 @@ class NautilusNavigator(InteractiveMethod):
 
         self._distance = new_dist
 
-        new_reachable = self.calculate_reachable_point_indices(
-            self._pareto_front, self._reachable_lb, self._reachable_ub,
-        )
+        if self._index is None:
+            new_reachable = self.calculate_reachable_point_indices(
+                self._pareto_front,
+                self._reachable_lb,
+                self._reachable_ub,
+                subset_indices=None if rescan else self._reachable_idx,
+            )
+        else:
+            new_reachable = self._index.points_within_bounds(self._reachable_lb, self._reachable_ub).squeeze()
 
         self._reachable_idx = new_reachable
+        self._rescan_reachable = False
 
         # If stop, do not update steps
-        if self._steps_remaining == 1:
-            # stop
-            return NautilusNavigatorRequest.init_with_method(self)
+        if self._steps_remaining > 1:
+            self._step_number += 1
+            self._steps_remaining -= 1
 
-        self._step_number += 1
-        self._steps_remaining -= 1
+        return {attribute: getattr(self, attribute) for attribute in _STEP_STATE}
 
-        return NautilusNavigatorRequest.init_with_method(self)
+    def _trajectory_key(self, ref_point: np.ndarray, speed: int, user_bounds: np.ndarray) -> tuple:
+        # the outcome of a step depends on the state it is taken from and the preferences it is taken with
+        if self._step_number == 1 or not np.allclose(ref_point, self._reference_point):
+            projection_index = None
+        else:
+            # the projection of the current reference point is reused
+            projection_index = self._projection_index
+
+        # the speed is set on the first step and carried over after it
+        current_speed = speed if self._step_number == 1 else self._current_speed
+
+        # the reference point is projected on the reachable solutions within the previous user bounds
+        reachable_digest = hashlib.sha256(np.asarray(self._reachable_idx, dtype=np.int64).tobytes()).digest()
+
+        return (
+            self._step_number,
+            self._steps_remaining,
+            current_speed,
+            projection_index,
+            reachable_digest,
+            *(
+                np.asarray(array, dtype=float).tobytes()
+                for array in (
+                    self._navigation_point,
+                    self._reachable_lb,
+                    self._reachable_ub,
+                    ref_point,
+                )
+            ),
+            *(
+                # missing bounds are NaN, and all NaNs are made alike
+                np.where(np.isnan(bounds), np.nan, bounds).tobytes()
+                for bounds in (np.asarray(self._user_bounds, dtype=float), np.asarray(user_bounds, dtype=float))
+            ),
+        )
 
     def calculate_reachable_point_indices(
         self,
         pareto_front: np.ndarray,
         lower_bounds: np.ndarray,
         upper_bounds: np.ndarray,
+        subset_indices: Optional[np.ndarray] = None,
     ) -> List[int]:
         """Calculate the indices of the reachable Pareto optimal solutions
         based on lower and upper bounds.
 
+        Args:
+            pareto_front (np.ndarray): The Pareto optimal front.
+            lower_bounds (np.ndarray): The lower bounds of the reachable region.
+            upper_bounds (np.ndarray): The upper bounds of the reachable region.
+            subset_indices (Optional[np.ndarray], optional): Indices of the solutions known to contain all the
+                reachable ones, e.g., those reachable on the previous step. Only these are checked. Defaults to None,
+                which checks the whole front.
+
         Returns:
             List[int]: List of the indices of the reachable solutions.
         """
-        low_idx = np.all(pareto_front >= lower_bounds, axis=1)
-        up_idx = np.all(pareto_front <= upper_bounds, axis=1)
+        if subset_indices is not None and np.size(subset_indices) == pareto_front.shape[0]:
+            # gathering all the rows would only slow the search down
+            subset_indices = None
 
-        reachable_idx = np.argwhere(low_idx & up_idx).squeeze()
-
-        return reachable_idx
+        return points_within_bounds(pareto_front, lower_bounds, upper_bounds, indices=subset_indices).squeeze()
 
     @staticmethod
     def solve_nautilus_asf_problem(
@@ -535,23 +805,17 @@ class NautilusNavigator(InteractiveMethod):
         """
         asf = PointMethodASF(nadir, ideal)
         scalarizer = DiscreteScalarizer(asf, {"reference_point": ref_point})
-        solver = DiscreteMinimizer(scalarizer)
-
-        # Copy the front and filter out the reachable solutions.
-        # If user bounds are given, filter out solutions outside the those bounds.
-        # Infeasible solutions on the pareto font are set to be NaNs.
-        tmp = np.copy(pareto_f)
-        mask = np.zeros(tmp.shape[0], dtype=bool)
-        mask[subset_indices] = True
-        tmp[~mask] = np.nan
 
-        # indices of solutions with one or more objective value exceeding the user bounds.
-        bound_mask = np.any(tmp > user_bounds, axis=1)
-        tmp[bound_mask] = np.nan
+        def bounded_scalarizer(chunk: np.ndarray) -> np.ndarray:
+            # solutions with one or more objective value exceeding the user bounds are infeasible
+            values = scalarizer(chunk)
+            values[np.any(chunk > user_bounds, axis=1)] = np.nan
+            return values
 
-        res = solver.minimize(tmp)
+        # the ASF is only evaluated for the reachable solutions, gathered from the front a chunk at a time
+        index, _ = chunked_argmin(pareto_f, bounded_scalarizer, indices=subset_indices)
 
-        return res["x"]
+        return index
 
     def calculate_navigation_point(
         self, projection: np.ndarray, nav_point: np.ndarray, steps_remaining: int,
@@ -580,6 +844,7 @@ class NautilusNavigator(InteractiveMethod):
         user_bounds: np.ndarray,
         previous_lb: np.ndarray,
         previous_ub: np.ndarray,
+        subset_indices: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Calculate the new bounds of the reachable points on the Pareto
         optimal front from a navigation point.
@@ -591,6 +856,8 @@ class NautilusNavigator(InteractiveMethod):
                 exceeded. A 1D array where NaN's indicate 'no bound is given' for the respective objective value.
             previous_lb (np.ndarray): If no new lower bound can be found for an objective, this value is used.
             previous_ub (np.ndarray): If no new upper bound can be found for an objective, this value is used.
+            subset_indices (Optional[np.ndarray], optional): Indices of the solutions in pareto_front to consider,
+                e.g., the currently reachable ones. Defaults to None, which considers all of them.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: The lower and upper bounds.
@@ -598,35 +865,31 @@ class NautilusNavigator(InteractiveMethod):
         # make sure the front is at least 2D
         _pareto_front = np.atleast_2d(pareto_front)
 
-        new_lower_bounds = np.zeros(_pareto_front.shape[1])
-        new_upper_bounds = np.zeros(_pareto_front.shape[1])
-
-        # discard solutions that breach the given user bounds by setting them to NaN
-        user_bounds_mask = np.any(_pareto_front > user_bounds, axis=1)
-        _pareto_front[user_bounds_mask] = np.nan
-
-        # TODO: vectorize this loop
-        for r in range(_pareto_front.shape[1]):
-            mask = np.zeros(_pareto_front.shape[1], dtype=bool)
-            mask[r] = True
-
-            subject_to = _pareto_front[:, ~mask].reshape(
-                (_pareto_front.shape[0], _pareto_front.shape[1] - 1)
-            )
+        # all the bounds in a single pass, solutions that breach the given user bounds are discarded
+        new_lower_bounds, new_upper_bounds, found = leave_one_out_bounds(
+            _pareto_front, nav_point, user_bounds, indices=subset_indices
+        )
 
-            con_mask = np.all(subject_to <= nav_point[~mask], axis=1)
+        return np.where(found, new_lower_bounds, previous_lb), np.where(found, new_upper_bounds, previous_ub)
 
-            if _pareto_front[con_mask, mask].size != 0:
-                min_val = np.nanmin(_pareto_front[con_mask, mask])
-                max_val = np.nanmax(_pareto_front[con_mask, mask])
-            else:
-                min_val = previous_lb[r]
-                max_val = previous_ub[r]
+    def _calculate_bounds_with_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        # same as calculate_bounds, with the reachable solutions given by the box they lie in
+        if np.size(self._reachable_idx) == self._pareto_front.shape[0]:
+            reachable_lb, reachable_ub = None, None
+        else:
+            reachable_lb, reachable_ub = self._reachable_lb, self._reachable_ub
 
-            new_lower_bounds[r] = min_val
-            new_upper_bounds[r] = max_val
+        new_lower_bounds, new_upper_bounds, found = self._index.leave_one_out_bounds(
+            self._navigation_point,
+            np.asarray(self._user_bounds, dtype=float),
+            lower_bounds=reachable_lb,
+            upper_bounds=reachable_ub,
+        )
 
-        return new_lower_bounds, new_upper_bounds
+        return (
+            np.where(found, new_lower_bounds, self._reachable_lb),
+            np.where(found, new_upper_bounds, self._reachable_ub),
+        )
 
     def calculate_distance(
         self, nav_point: np.ndarray, projection: np.ndarray, nadir: np.ndarray
@@ -5,6 +5,8 @@ from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
+from desdeo_mcdm.utilities.cache import EvaluationCache
+from desdeo_mcdm.utilities.solvers import make_de_method
 from desdeo_problem.problem import MOProblem, VectorObjective, _ScalarObjective, variable_builder
 from desdeo_tools.interaction.request import BaseRequest
 from desdeo_tools.scalarization import EpsilonConstraintMethod as ECM
@@ -380,6 +382,8 @@ class NautilusV2(InteractiveMethod):
         minimize (Optional[List[int]], optional): Multipliers for each objective. '-1' indicates maximization
                                                   and '1' minimization. Defaults to all objective values being
                                                   minimized.
+        seed (Optional[int], optional): Seed for the differential evolution minimizing the subproblems, which makes
+                                        the method reproducible. Defaults to None.
 
     Raises:
         NautilusException: One or more dimension mismatches are encountered among the supplies arguments.
@@ -394,6 +398,7 @@ class NautilusV2(InteractiveMethod):
         epsilon: float = 1e-6,
         objective_names: Optional[List[str]] = None,
         minimize: Optional[List[int]] = None,
+        seed: Optional[int] = None,
     ):
 
         if not ideal.shape == nadir.shape:
@@ -424,9 +429,11 @@ class NautilusV2(InteractiveMethod):
         # initialize method with problem
         super().__init__(problem)
         self._problem = problem
-        self._objectives: Callable = lambda x: self._problem.evaluate(x).objectives
+        # the objectives and constraints share the evaluations of the problem
+        self._evaluations = EvaluationCache(problem)
+        self._objectives: Callable = self._evaluations.objectives
         self._variable_bounds: Union[np.ndarray, None] = problem.get_variable_bounds()
-        self._constraints: Optional[Callable] = lambda x: self._problem.evaluate(x).constraints
+        self._constraints: Optional[Callable] = self._evaluations.constraints
 
         # Used to calculate the utopian point from the ideal point
         self._epsilon = epsilon
@@ -472,10 +479,16 @@ class NautilusV2(InteractiveMethod):
         self._first_iteration: bool = True
 
         # evolutionary method for minimizing
-        self._method_de: ScalarMethod = ScalarMethod(
-            lambda x, _, **y: differential_evolution(x, **y),
-            method_args={"disp": False, "polish": False, "tol": 0.000001, "popsize": 10, "maxiter": 50000},
-            use_scipy=True,
+        self._seed = seed
+        self._method_de: ScalarMethod = make_de_method(
+            method_args={
+                "disp": False,
+                "polish": False,
+                "tol": 0.000001,
+                "popsize": 10,
+                "maxiter": 50000,
+                "seed": self._seed,
+            }
         )
 
     def start(self) -> NautilusInitialRequest:
@@ -1010,7 +1023,14 @@ class NautilusV2(InteractiveMethod):
         # set polish to False
         method_e: ScalarMethod = ScalarMethod(
             lambda x, _, **y: differential_evolution(x, **y),
-            method_args={"disp": False, "polish": False, "tol": 0.000001, "popsize": 10, "maxiter": 50000},
+            method_args={
+                "disp": False,
+                "polish": False,
+                "tol": 0.000001,
+                "popsize": 10,
+                "maxiter": 50000,
+                "seed": self._seed,
+            },
             use_scipy=True,
         )
 
@@ -7,11 +7,12 @@ from desdeo_tools.scalarization.Scalarizer import Scalarizer, DiscreteScalarizer
 from desdeo_tools.solver.ScalarSolver import (
     ScalarMethod,
     ScalarMinimizer,
-    DiscreteMinimizer,
 )
 from desdeo_mcdm.interactive.ReferencePointMethod import validate_reference_point
 from typing import Dict, Optional, Tuple, Union
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
+from desdeo_mcdm.utilities.cache import EvaluationCache
+from desdeo_mcdm.utilities.fronts import chunked_argmin
 from desdeo_tools.interaction.request import BaseRequest
 from scipy.spatial import ConvexHull
 from scipy.optimize import linprog
@@ -755,14 +756,16 @@ class ParetoNavigator(InteractiveMethod):
         """
         asf = SimpleASF(np.ones(ref_point.shape))
         if isinstance(problem, MOProblem):
+            # the objectives and constraints share the evaluations of the problem
+            evaluations = EvaluationCache(problem)
             scalarizer = Scalarizer(
-                lambda x: problem.evaluate(x).objectives,
+                evaluations.objectives,
                 asf,
                 scalarizer_args={"reference_point": np.atleast_2d(ref_point)},
             )
 
             if problem.n_of_constraints > 0:
-                _con_eval = lambda x: problem.evaluate(x).constraints.squeeze()
+                _con_eval = lambda x: evaluations.evaluate(x).constraints.squeeze()
             else:
                 _con_eval = None
 
@@ -785,9 +788,9 @@ class ParetoNavigator(InteractiveMethod):
         else:  # Discrete case
             # Find closest objective to ref point
             scalarizer = DiscreteScalarizer(asf, {"reference_point": ref_point})
-            solver = DiscreteMinimizer(scalarizer)
-            res = solver.minimize(problem.objectives)
-            return res['x']
+            # the objectives are processed in chunks, and may be memory-mapped
+            index, _ = chunked_argmin(problem.objectives, scalarizer)
+            return index
 
 
 
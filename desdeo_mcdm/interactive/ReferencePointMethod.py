@@ -2,12 +2,14 @@ from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 from desdeo_mcdm.interactive.InteractiveMethod import InteractiveMethod
+from desdeo_mcdm.utilities.cache import EvaluationCache
+from desdeo_mcdm.utilities.fronts import chunked_argmin
+from desdeo_mcdm.utilities.solvers import make_de_method
 from desdeo_problem.problem import DiscreteDataProblem, MOProblem, VectorObjective, _ScalarObjective, variable_builder
 from desdeo_tools.interaction.request import BaseRequest
 from desdeo_tools.scalarization import ReferencePointASF
 from desdeo_tools.scalarization.Scalarizer import DiscreteScalarizer, Scalarizer
-from desdeo_tools.solver.ScalarSolver import DiscreteMinimizer, ScalarMethod, ScalarMinimizer
-from scipy.optimize import differential_evolution
+from desdeo_tools.solver.ScalarSolver import ScalarMethod, ScalarMinimizer
 
 """
 Reference Point Method (RPM)
@@ -228,6 +230,8 @@ class ReferencePointMethod(InteractiveMethod):
         minimize (Optional[List[int]], optional): Multipliers for each objective. '-1' indicates maximization
                                                   and '1' minimization. Defaults to all objective values being
                                                   minimized.
+        seed (Optional[int], optional): Seed for the differential evolution minimizing the achievement function,
+                                        which makes the method reproducible. Defaults to None.
 
     Raises:
         RPMException: Dimensions of ideal, nadir, objective_names, and minimize-list do not match.
@@ -241,6 +245,7 @@ class ReferencePointMethod(InteractiveMethod):
         epsilon: float = 1e-6,
         objective_names: Optional[List[str]] = None,
         minimize: Optional[List[int]] = None,
+        seed: Optional[int] = None,
     ):
 
         if not ideal.shape == nadir.shape:
@@ -293,16 +298,23 @@ class ReferencePointMethod(InteractiveMethod):
 
         if isinstance(problem, MOProblem):
             # initialize method with MOProblem
-            self._objectives: Callable = lambda x: self._problem.evaluate(x).objectives
+            # the objectives and constraints share the evaluations of the problem
+            self._evaluations = EvaluationCache(problem)
+            self._objectives: Callable = self._evaluations.objectives
             self._variable_bounds: Union[np.ndarray, None] = problem.get_variable_bounds()
             self._variable_vectors = None
-            self._constraints: Optional[Callable] = lambda x: self._problem.evaluate(x).constraints
+            self._constraints: Optional[Callable] = self._evaluations.constraints
 
             # evolutionary method for minimizing
-            self._method_de: ScalarMethod = ScalarMethod(
-                lambda x, _, **y: differential_evolution(x, **y),
-                method_args={"disp": False, "polish": False, "tol": 0.000001, "popsize": 10, "maxiter": 50000},
-                use_scipy=True,
+            self._method_de: ScalarMethod = make_de_method(
+                method_args={
+                    "disp": False,
+                    "polish": False,
+                    "tol": 0.000001,
+                    "popsize": 10,
+                    "maxiter": 50000,
+                    "seed": seed,
+                }
             )
         else:
             # Initialize the method with DiscreteData
@@ -605,12 +617,10 @@ class ReferencePointMethod(InteractiveMethod):
             asf = ReferencePointASF(preferential_factors, nadir, utopian, rho=1e-4)
             asf_scalarizer = DiscreteScalarizer(asf, scalarizer_args={"reference_point": ref_point})
 
-            # minimize the discrete problem
-            minimizer = DiscreteMinimizer(asf_scalarizer)
+            # minimize the discrete problem, processing the objectives in chunks as they may be memory-mapped
+            index, value = chunked_argmin(objectives, asf_scalarizer)
 
-            res = minimizer.minimize(objectives)
-
-            return res
+            return {"x": index, "fun": value, "success": True}
 
 
 # testing the method
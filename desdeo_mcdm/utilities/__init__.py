@@ -3,17 +3,65 @@
 """
 
 __all__ = [
+    "ArchiveException",
+    "ClusterTree",
+    "EvaluationCache",
+    "FrontException",
+    "FrontIndex",
+    "LRUCache",
+    "NonDominatedArchive",
+    "PayoffTableCache",
+    "SolverConfiguration",
+    "as_front",
+    "batched_argmin",
+    "batched_leave_one_out_bounds",
+    "chunked_argmin",
+    "iter_chunks",
+    "is_warm_started",
+    "iter_pareto_front_representation",
+    "iter_pareto_front_representation_general",
+    "leave_one_out_bounds",
+    "load_front",
+    "make_de_method",
+    "managed_executor",
+    "nearest_point",
     "payoff_table_method",
     "payoff_table_method_general",
+    "points_within_bounds",
+    "problem_fingerprint",
     "solve_pareto_front_representation",
     "solve_pareto_front_representation_general",
     "weighted_scalarizer",
 ]
 
 
+from desdeo_mcdm.utilities.archive import ArchiveException, NonDominatedArchive
+from desdeo_mcdm.utilities.cache import EvaluationCache, LRUCache
+from desdeo_mcdm.utilities.fronts import (
+    ClusterTree,
+    FrontException,
+    FrontIndex,
+    as_front,
+    batched_argmin,
+    batched_leave_one_out_bounds,
+    chunked_argmin,
+    iter_chunks,
+    leave_one_out_bounds,
+    load_front,
+    nearest_point,
+    points_within_bounds,
+)
 from desdeo_mcdm.utilities.solvers import (
+    PayoffTableCache,
+    SolverConfiguration,
+    is_warm_started,
+    iter_pareto_front_representation,
+    iter_pareto_front_representation_general,
+    make_de_method,
+    managed_executor,
     payoff_table_method,
     payoff_table_method_general,
+    problem_fingerprint,
     solve_pareto_front_representation,
     solve_pareto_front_representation_general,
     weighted_scalarizer,
@@ -0,0 +1,179 @@
+"""Implements an archive for collecting mutually non-dominated objective vectors.
+
+"""
+
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+
+
+class ArchiveException(Exception):
+    """Raised when an exception related to the non-dominated archive is encountered.
+
+    """
+
+    pass
+
+
+class NonDominatedArchive:
+    """An archive of mutually non-dominated objective vectors, assuming minimization.
+
+    The vectors are kept sorted by their first objective. A new vector can
+    only be dominated by vectors preceding it in that order, and can only
+    dominate vectors following it, which limits the comparisons needed on
+    each insertion. With two objectives the archive forms a staircase and
+    the dominance checks reduce to binary searches.
+
+    With more objectives, the new vector is compared to all the archived
+    vectors on both sides of it, i.e., O(n k) work for each insertion into an
+    archive of n vectors, although the comparisons are vectorized. Collecting
+    n mutually non-dominated vectors is then O(n^2 k) in the worst case, and
+    only the two objective case is sub-quadratic.
+
+    Args:
+        n_of_objectives (int): The number of objectives in each vector.
+        initial_capacity (int, optional): The number of vectors to allocate
+            room for initially. The storage grows as needed. Defaults to 64.
+
+    Raises:
+        ArchiveException: The number of objectives is less than one.
+    """
+
+    def __init__(self, n_of_objectives: int, initial_capacity: int = 64):
+        if n_of_objectives < 1:
+            raise ArchiveException("The archive needs at least one objective.")
+
+        self._k = n_of_objectives
+        self._objectives = np.empty((max(initial_capacity, 1), n_of_objectives))
+        self._payloads: List[Any] = []
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def objectives(self) -> np.ndarray:
+        """np.ndarray: A copy of the archived objective vectors sorted by the first objective."""
+        return self._objectives[: self._n].copy()
+
+    @property
+    def payloads(self) -> List[Any]:
+        """List[Any]: The payloads of the archived vectors, in the same order as objectives."""
+        return list(self._payloads)
+
+    def add(self, objective_vector: np.ndarray, payload: Optional[Any] = None) -> bool:
+        """Adds a vector to the archive if no archived vector weakly dominates it.
+
+        Archived vectors dominated by the new vector are removed.
+
+        Args:
+            objective_vector (np.ndarray): The objective vector to be added.
+            payload (Optional[Any], optional): Anything to be stored alongside
+                the vector, such as the corresponding decision variables.
+                Defaults to None.
+
+        Returns:
+            bool: Whether the vector was added to the archive. Vectors
+            containing NaN are never added.
+
+        Raises:
+            ArchiveException: The length of the vector does not match the
+            number of objectives.
+        """
+        f = np.asarray(objective_vector, dtype=float).reshape(-1)
+        if len(f) != self._k:
+            raise ArchiveException(
+                f"Expected an objective vector of length {self._k}, got one of length {len(f)}."
+            )
+
+        if np.any(np.isnan(f)):
+            return False
+
+        if self._k == 2:
+            return self._add_two_objectives(f, payload)
+
+        first = self._objectives[: self._n, 0]
+        right = np.searchsorted(first, f[0], side="right")
+
+        # only vectors with a smaller or an equal first objective can dominate f
+        if np.any(np.all(self._objectives[:right] <= f, axis=1)):
+            return False
+
+        # and only those with a larger or an equal first objective can be dominated by f
+        left = np.searchsorted(first, f[0], side="left")
+        dominated = np.all(f <= self._objectives[left : self._n], axis=1)
+        if np.any(dominated):
+            self._remove(left + np.flatnonzero(dominated))
+
+        # break ties in the first objective lexicographically, so that the order does not depend on insertion order
+        first = self._objectives[: self._n, 0]
+        left, right = np.searchsorted(first, f[0], side="left"), np.searchsorted(first, f[0], side="right")
+        index = left + sum(tuple(g) < tuple(f) for g in self._objectives[left:right])
+
+        self._insert(index, f, payload)
+
+        return True
+
+    def extend(self, objective_vectors: np.ndarray, payloads: Optional[Iterable[Any]] = None) -> np.ndarray:
+        """Adds multiple vectors to the archive, one after another.
+
+        Args:
+            objective_vectors (np.ndarray): A 2D array with a vector on each row.
+            payloads (Optional[Iterable[Any]], optional): A payload for each
+                vector. Defaults to None.
+
+        Returns:
+            np.ndarray: A boolean array indicating which of the vectors were
+            added. A vector added may have been removed later by a subsequent
+            vector dominating it.
+        """
+        objective_vectors = np.atleast_2d(objective_vectors)
+        if payloads is None:
+            payloads = [None] * len(objective_vectors)
+
+        return np.array([self.add(f, p) for (f, p) in zip(objective_vectors, payloads)], dtype=bool)
+
+    def _add_two_objectives(self, f: np.ndarray, payload: Any) -> bool:
+        # sorted by the first objective, the second objective is strictly decreasing
+        first = self._objectives[: self._n, 0]
+        right = np.searchsorted(first, f[0], side="right")
+
+        # the closest preceding vector is the only candidate for dominating f
+        if right > 0 and self._objectives[right - 1, 1] <= f[1]:
+            return False
+
+        # the vectors dominated by f form a contiguous run starting at left
+        left = np.searchsorted(first, f[0], side="left")
+        lo, hi = left, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._objectives[mid, 1] >= f[1]:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo > left:
+            self._remove(np.arange(left, lo))
+
+        self._insert(left, f, payload)
+
+        return True
+
+    def _insert(self, index: int, f: np.ndarray, payload: Any) -> None:
+        if self._n == len(self._objectives):
+            grown = np.empty((2 * len(self._objectives), self._k))
+            grown[: self._n] = self._objectives[: self._n]
+            self._objectives = grown
+
+        self._objectives[index + 1 : self._n + 1] = self._objectives[index : self._n]
+        self._objectives[index] = f
+        self._payloads.insert(index, payload)
+        self._n += 1
+
+    def _remove(self, indices: np.ndarray) -> None:
+        keep = np.ones(self._n, dtype=bool)
+        keep[indices] = False
+
+        self._objectives[: np.count_nonzero(keep)] = self._objectives[: self._n][keep]
+        self._payloads = [p for (p, k) in zip(self._payloads, keep) if k]
+        self._n = len(self._payloads)
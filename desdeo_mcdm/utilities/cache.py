@@ -0,0 +1,128 @@
+"""Implements caches for avoiding repeated evaluations of expensive problems.
+
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+from desdeo_problem.problem import EvaluationResults, MOProblem
+
+
+class LRUCache:
+    """A thread-safe mapping which evicts the least recently used entry when full.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries kept. Defaults to 1024.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self):
+        # locks cannot be pickled, each copy gets its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the value stored for key, computing and storing it first if missing.
+
+        Args:
+            key (Hashable): The key of the value.
+            compute (Callable[[], Any]): Called without arguments to compute a missing value.
+
+        Returns:
+            Any: The value stored for the key.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        # compute without holding the lock, so that other threads are not blocked
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class EvaluationCache:
+    """Memoizes the evaluations of a MOProblem.
+
+    The objectives and the constraints of a problem are often needed
+    separately for the same decision variables, e.g., by a scalarizer and a
+    constraint evaluator. Evaluating them through the same cache evaluates
+    the problem only once. The evaluations are keyed on the bytes of the
+    supplied decision variables.
+
+    Args:
+        problem (MOProblem): The problem whose evaluations are cached.
+        maxsize (int, optional): The maximum number of evaluations kept. Defaults to 1024.
+    """
+
+    def __init__(self, problem: MOProblem, maxsize: int = 1024):
+        self.problem = problem
+        self._cache = LRUCache(maxsize)
+
+    @property
+    def hits(self) -> int:
+        """int: The number of evaluations served from the cache."""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """int: The number of evaluations computed by the problem."""
+        return self._cache.misses
+
+    def evaluate(self, xs: np.ndarray) -> EvaluationResults:
+        """Evaluates the problem, or returns the cached results of an earlier
+        evaluation with the same decision variables.
+
+        Args:
+            xs (np.ndarray): The decision variables, as accepted by MOProblem.evaluate.
+
+        Returns:
+            EvaluationResults: The results of the evaluation. Should not be modified.
+        """
+        xs = np.ascontiguousarray(xs)
+        key: Tuple = (xs.dtype.str, xs.shape, xs.tobytes())
+
+        return self._cache.get_or_compute(key, lambda: self.problem.evaluate(xs))
+
+    def objectives(self, xs: np.ndarray) -> np.ndarray:
+        """Returns the objective values of xs. See evaluate."""
+        return self.evaluate(xs).objectives
+
+    def constraints(self, xs: np.ndarray) -> Optional[np.ndarray]:
+        """Returns the constraint values of xs. See evaluate."""
+        return self.evaluate(xs).constraints
+
+    def clear(self) -> None:
+        """Empties the cache and resets the counters."""
+        self._cache.clear()
@@ -0,0 +1,682 @@
+"""Implements utilities for working with large, possibly memory-mapped, Pareto fronts.
+
+The functions process a front a chunk of rows at a time, so that a front
+stored in a .npy file and memory-mapped with load_front is never read into
+memory as a whole, and no copies of it are made.
+
+"""
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.metrics import pairwise_distances_argmin_min
+
+#: The default number of rows processed at a time.
+DEFAULT_CHUNKSIZE = 65536
+
+
+class FrontException(Exception):
+    """Raised when an exception related to processing a Pareto front is encountered.
+
+    """
+
+    pass
+
+
+def load_front(path: Union[str, Path], mmap_mode: Optional[str] = "r") -> np.ndarray:
+    """Loads a Pareto front stored in a .npy file.
+
+    Args:
+        path (Union[str, Path]): The path to the file with a 2D array of objective vectors.
+        mmap_mode (Optional[str], optional): Passed to np.load. By default, the
+            file is memory-mapped read-only, and the rows are only read from
+            the disk when accessed. Use None to read the whole front into
+            memory. Defaults to 'r'.
+
+    Raises:
+        FrontException: The file does not contain a two dimensional array.
+
+    Returns:
+        np.ndarray: The front, an np.memmap unless mmap_mode is None.
+    """
+    front = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+
+    if front.ndim != 2:
+        raise FrontException(f"Expected a two dimensional front in {path}, found {front.ndim} dimensions.")
+
+    return front
+
+
+def as_front(front: Union[np.ndarray, str, Path]) -> np.ndarray:
+    """Returns front as is if it is an array, or memory-maps it with load_front if it is a path.
+
+    Args:
+        front (Union[np.ndarray, str, Path]): An array, or the path to a .npy file.
+
+    Returns:
+        np.ndarray: The front.
+    """
+    if isinstance(front, (str, Path)):
+        return load_front(front)
+
+    return front
+
+
+def iter_chunks(front: np.ndarray, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[Tuple[int, np.ndarray]]:
+    """Iterates over a front a chunk of rows at a time.
+
+    Args:
+        front (np.ndarray): A 2D array.
+        chunksize (int, optional): The number of rows in each chunk. Defaults to DEFAULT_CHUNKSIZE.
+
+    Yields:
+        Tuple[int, np.ndarray]: The index of the first row of a chunk and a view of the chunk.
+    """
+    for start in range(0, len(front), chunksize):
+        yield start, front[start : start + chunksize]
+
+
+def _iter_rows(
+    front: np.ndarray, indices: Optional[np.ndarray], chunksize: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    # yields the indices of the rows in a chunk and the chunk, either of the whole front or of the given rows
+    if indices is None:
+        for start, chunk in iter_chunks(front, chunksize):
+            yield np.arange(start, start + len(chunk)), chunk
+    else:
+        # gather the rows of a chunk of indices at a time, only a chunk is ever copied
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        for _, rows in iter_chunks(indices, chunksize):
+            yield rows, front[rows]
+
+
+def chunked_argmin(
+    front: np.ndarray,
+    fun: Callable[[np.ndarray], np.ndarray],
+    mask: Optional[np.ndarray] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    indices: Optional[np.ndarray] = None,
+) -> Tuple[int, float]:
+    """Finds the row of a front minimizing a function, ignoring NaN values.
+
+    Args:
+        front (np.ndarray): A 2D array.
+        fun (Callable[[np.ndarray], np.ndarray]): Called with a chunk of rows,
+            should return a value for each row, e.g., a DiscreteScalarizer.
+        mask (Optional[np.ndarray], optional): A boolean array indicating the
+            rows to be considered. Defaults to None, which considers all rows.
+        chunksize (int, optional): The number of rows processed at a time. Defaults to DEFAULT_CHUNKSIZE.
+        indices (Optional[np.ndarray], optional): The indices of the rows to
+            be considered. Only these rows are read and passed to fun, a chunk
+            at a time. Defaults to None, which considers all rows.
+
+    Raises:
+        FrontException: No row has a finite value.
+
+    Returns:
+        Tuple[int, float]: The index of the minimizing row, the first one in
+        case of ties, and the minimum value.
+    """
+    best_index, best_value = -1, np.inf
+
+    for rows, chunk in _iter_rows(front, indices, chunksize):
+        values = np.array(fun(chunk), dtype=float).reshape(-1)
+        values[np.isnan(values)] = np.inf
+        if mask is not None:
+            values[~mask[rows]] = np.inf
+
+        i = int(np.argmin(values))
+        if values[i] < best_value:
+            best_index, best_value = int(rows[i]), values[i]
+
+    if best_index < 0:
+        raise FrontException("None of the rows of the front have a finite value.")
+
+    return best_index, float(best_value)
+
+
+def batched_argmin(
+    front: np.ndarray, fun: Callable[[np.ndarray], np.ndarray], n_of_columns: int, chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Finds the rows of a front minimizing several functions at once, ignoring NaN values. See chunked_argmin.
+
+    Args:
+        front (np.ndarray): A 2D array.
+        fun (Callable[[np.ndarray], np.ndarray]): Called with a chunk of rows,
+            should return a 2D array with a column of values for each function.
+        n_of_columns (int): The number of functions.
+        chunksize (int, optional): The number of values computed at a time.
+            A chunk holds chunksize // n_of_columns rows. Defaults to DEFAULT_CHUNKSIZE.
+
+    Raises:
+        FrontException: No row has a finite value for one or more functions.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The index of the minimizing row of each
+        function, the first one in case of ties, and the minimum values.
+    """
+    best_indices, best_values = np.full(n_of_columns, -1), np.full(n_of_columns, np.inf)
+
+    for start, chunk in iter_chunks(front, max(1, chunksize // n_of_columns)):
+        values = np.array(fun(chunk), dtype=float).reshape(len(chunk), n_of_columns)
+        values[np.isnan(values)] = np.inf
+
+        i = np.argmin(values, axis=0)
+        chunk_values = values[i, np.arange(n_of_columns)]
+        improved = chunk_values < best_values
+        best_indices[improved] = start + i[improved]
+        best_values[improved] = chunk_values[improved]
+
+    if np.any(best_indices < 0):
+        raise FrontException("None of the rows of the front have a finite value for one or more of the functions.")
+
+    return best_indices, best_values
+
+
+def points_within_bounds(
+    front: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    indices: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Finds the rows of a front within the given bounds, inclusive.
+
+    Args:
+        front (np.ndarray): A 2D array.
+        lower_bounds (np.ndarray): The lower bound of each column.
+        upper_bounds (np.ndarray): The upper bound of each column.
+        chunksize (int, optional): The number of rows processed at a time. Defaults to DEFAULT_CHUNKSIZE.
+        indices (Optional[np.ndarray], optional): The indices of the rows to
+            be considered, e.g., the rows found within some wider bounds
+            earlier. Defaults to None, which considers all rows.
+
+    Returns:
+        np.ndarray: The indices of the rows within the bounds, in the order
+        of indices, or in ascending order if indices is None.
+    """
+    within = [
+        rows[np.all((chunk >= lower_bounds) & (chunk <= upper_bounds), axis=1)]
+        for (rows, chunk) in _iter_rows(front, indices, chunksize)
+    ]
+
+    return np.concatenate(within) if within else np.zeros(0, dtype=int)
+
+
+def nearest_point(front: np.ndarray, point: np.ndarray, chunksize: int = DEFAULT_CHUNKSIZE) -> int:
+    """Finds the row of a front closest to a point in the Euclidean sense.
+
+    Args:
+        front (np.ndarray): A 2D array.
+        point (np.ndarray): A 1D array.
+        chunksize (int, optional): The number of rows processed at a time. Defaults to DEFAULT_CHUNKSIZE.
+
+    Returns:
+        int: The index of the closest row.
+    """
+    index, _ = chunked_argmin(front, lambda chunk: np.linalg.norm(chunk - point, axis=1), chunksize=chunksize)
+
+    return index
+
+
+def leave_one_out_bounds(
+    front: np.ndarray,
+    point: np.ndarray,
+    user_bounds: Optional[np.ndarray] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    indices: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the range of each objective among the rows of a front no
+    worse than a point in all the other objectives, assuming minimization.
+
+    For each objective r, the rows considered are those with all objectives
+    but r at most the value of the point. A row is compared to the point
+    once, after which a row is considered for r if none of its objectives
+    exceed the point, or if r is the only one exceeding it. The front is not
+    modified.
+
+    Args:
+        front (np.ndarray): A 2D array with an objective vector on each row.
+        point (np.ndarray): A 1D array, e.g., a navigation point.
+        user_bounds (Optional[np.ndarray], optional): Rows exceeding these
+            bounds in any objective are ignored. NaN leaves an objective
+            unbounded. Defaults to None.
+        chunksize (int, optional): The number of rows processed at a time. Defaults to DEFAULT_CHUNKSIZE.
+        indices (Optional[np.ndarray], optional): The indices of the rows to
+            be considered. Defaults to None, which considers all rows.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The lower and upper bound
+        of each objective, and whether any rows were considered for each
+        objective. The bounds of an objective without any rows are inf and
+        -inf, respectively.
+    """
+    n_of_objectives = front.shape[1]
+    lower_bounds = np.full(n_of_objectives, np.inf)
+    upper_bounds = np.full(n_of_objectives, -np.inf)
+    found = np.zeros(n_of_objectives, dtype=bool)
+
+    for _, chunk in _iter_rows(front, indices, chunksize):
+        below = chunk <= point
+        n_above = n_of_objectives - np.count_nonzero(below, axis=1)
+
+        considered = (n_above == 0)[:, None] | ((n_above == 1)[:, None] & ~below)
+        if user_bounds is not None:
+            considered &= ~np.any(chunk > user_bounds, axis=1)[:, None]
+
+        found |= np.any(considered, axis=0)
+        # fmin and fmax ignore NaN values
+        lower_bounds = np.fmin(lower_bounds, np.fmin.reduce(np.where(considered, chunk, np.inf), axis=0))
+        upper_bounds = np.fmax(upper_bounds, np.fmax.reduce(np.where(considered, chunk, -np.inf), axis=0))
+
+    return lower_bounds, upper_bounds, found
+
+
+def batched_leave_one_out_bounds(
+    front: np.ndarray,
+    points: np.ndarray,
+    user_bounds: Optional[np.ndarray] = None,
+    lower_bounds: Optional[np.ndarray] = None,
+    upper_bounds: Optional[np.ndarray] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes leave_one_out_bounds for several points in a single pass over a front.
+
+    Each chunk of rows is compared to all the points at once. Since this
+    takes memory proportional to the number of rows times the number of
+    points, a chunk holds chunksize // n_of_points rows.
+
+    Args:
+        front (np.ndarray): A 2D array with an objective vector on each row.
+        points (np.ndarray): A 2D array with a point on each row.
+        user_bounds (Optional[np.ndarray], optional): Rows exceeding these
+            bounds in any objective are ignored. NaN leaves an objective
+            unbounded. Either a bound for each objective, or a bound for each
+            point and objective. Defaults to None.
+        lower_bounds (Optional[np.ndarray], optional): Together with
+            upper_bounds, a box outside of which the rows are ignored, either
+            shared by the points or given for each point. Defaults to None.
+        upper_bounds (Optional[np.ndarray], optional): See lower_bounds. Defaults to None.
+        chunksize (int, optional): The number of row and point pairs compared
+            at a time. Defaults to DEFAULT_CHUNKSIZE.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The lower and upper bound
+        of each point and objective, and whether any rows were considered for
+        each point and objective, as 2D arrays.
+    """
+    points = np.atleast_2d(points)
+    n_of_points, n_of_objectives = points.shape
+    lower_bounds_found = np.full((n_of_points, n_of_objectives), np.inf)
+    upper_bounds_found = np.full((n_of_points, n_of_objectives), -np.inf)
+    found = np.zeros((n_of_points, n_of_objectives), dtype=bool)
+
+    # the comparisons are made one objective at a time on arrays with rows along the first axis and points along
+    # the second one, which is much faster than reducing over a short last axis
+    for _, chunk in iter_chunks(front, max(1, chunksize // n_of_points)):
+        chunk = np.asarray(chunk)
+        below = [chunk[:, j, None] <= points[:, j] for j in range(n_of_objectives)]
+        n_above = n_of_objectives - np.sum(below, axis=0, dtype=np.int8)
+
+        excluded = np.zeros((len(chunk), n_of_points), dtype=bool)
+        for (bounds, exceeds) in ((user_bounds, np.greater), (upper_bounds, np.greater), (lower_bounds, np.less)):
+            if bounds is not None:
+                bounds = np.broadcast_to(bounds, points.shape)
+                for j in range(n_of_objectives):
+                    excluded |= exceeds(chunk[:, j, None], bounds[:, j])
+
+        all_below = (n_above == 0) & ~excluded
+        one_above = (n_above == 1) & ~excluded
+        for r in range(n_of_objectives):
+            considered = all_below | (one_above & ~below[r])
+            values = np.broadcast_to(chunk[:, r, None], considered.shape)
+            found[:, r] |= np.any(considered, axis=0)
+            # fmin and fmax ignore NaN values
+            lower_bounds_found[:, r] = np.fmin(
+                lower_bounds_found[:, r], np.fmin.reduce(np.where(considered, values, np.inf), axis=0)
+            )
+            upper_bounds_found[:, r] = np.fmax(
+                upper_bounds_found[:, r], np.fmax.reduce(np.where(considered, values, -np.inf), axis=0)
+            )
+
+    return lower_bounds_found, upper_bounds_found, found
+
+
+class FrontIndex:
+    """An index over the objectives of a front for answering box queries in sublinear time.
+
+    Each objective is sorted once, and the rank of each row in each sorted
+    objective is stored. A box query takes the rows within the bounds of the
+    most selective objective, found by binary searches, and filters them
+    using their ranks in the other objectives. The cost depends on the number
+    of rows within the bounds of the most selective objective instead of the
+    size of the front, and the front itself is not read. Constrained minima
+    and maxima of an objective follow from the smallest and the largest rank
+    among the rows within a box.
+
+    The index takes three times the memory of the front, which should not
+    contain NaN values.
+
+    Args:
+        front (np.ndarray): A 2D array with an objective vector on each row.
+    """
+
+    def __init__(self, front: np.ndarray):
+        n_of_rows, n_of_objectives = front.shape
+        index_dtype = np.int32 if n_of_rows < np.iinfo(np.int32).max else np.int64
+
+        self._order = np.empty((n_of_objectives, n_of_rows), dtype=index_dtype)
+        self._ranks = np.empty((n_of_objectives, n_of_rows), dtype=index_dtype)
+        self._sorted = np.empty((n_of_objectives, n_of_rows))
+
+        for j in range(n_of_objectives):
+            column = np.asarray(front[:, j], dtype=float)
+            order = np.argsort(column, kind="stable")
+            self._order[j] = order
+            self._ranks[j, order] = np.arange(n_of_rows)
+            self._sorted[j] = column[order]
+
+    def __len__(self) -> int:
+        return self._order.shape[1]
+
+    def _candidates(self, lower_bounds: Optional[np.ndarray], upper_bounds: Optional[np.ndarray]) -> np.ndarray:
+        # the rows within the bounds, unordered
+        n_of_objectives, n_of_rows = self._order.shape
+        lower_bounds = np.full(n_of_objectives, -np.inf) if lower_bounds is None else lower_bounds
+        upper_bounds = np.full(n_of_objectives, np.inf) if upper_bounds is None else upper_bounds
+
+        # the range of ranks within the bounds of each objective
+        lo = np.array([np.searchsorted(self._sorted[j], lower_bounds[j], side="left") for j in range(n_of_objectives)])
+        hi = np.array([np.searchsorted(self._sorted[j], upper_bounds[j], side="right") for j in range(n_of_objectives)])
+
+        if np.any(hi <= lo):
+            return np.zeros(0, dtype=self._order.dtype)
+
+        selective = np.argmin(hi - lo)
+        candidates = self._order[selective, lo[selective] : hi[selective]]
+
+        for j in range(n_of_objectives):
+            if j == selective or (lo[j] == 0 and hi[j] == n_of_rows):
+                continue
+            ranks = self._ranks[j, candidates]
+            candidates = candidates[(ranks >= lo[j]) & (ranks < hi[j])]
+
+        return candidates
+
+    def points_within_bounds(
+        self, lower_bounds: Optional[np.ndarray] = None, upper_bounds: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Finds the rows of the front within the given bounds, inclusive. See points_within_bounds.
+
+        Args:
+            lower_bounds (Optional[np.ndarray], optional): The lower bound of each objective. Defaults to None.
+            upper_bounds (Optional[np.ndarray], optional): The upper bound of each objective. Defaults to None.
+
+        Returns:
+            np.ndarray: The indices of the rows within the bounds, in ascending order.
+        """
+        return np.sort(self._candidates(lower_bounds, upper_bounds)).astype(int)
+
+    def leave_one_out_bounds(
+        self,
+        point: np.ndarray,
+        user_bounds: Optional[np.ndarray] = None,
+        lower_bounds: Optional[np.ndarray] = None,
+        upper_bounds: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the range of each objective among the rows no worse than a
+        point in all the other objectives. See leave_one_out_bounds.
+
+        Args:
+            point (np.ndarray): A 1D array, e.g., a navigation point.
+            user_bounds (Optional[np.ndarray], optional): Rows exceeding these
+                bounds in any objective are ignored. NaN leaves an objective
+                unbounded. Defaults to None.
+            lower_bounds (Optional[np.ndarray], optional): Together with
+                upper_bounds, a box outside of which the rows are ignored,
+                e.g., the currently reachable region. Defaults to None.
+            upper_bounds (Optional[np.ndarray], optional): See lower_bounds. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The lower and upper bound
+            of each objective, and whether any rows were considered for each
+            objective.
+        """
+        n_of_objectives = self._order.shape[0]
+        box_upper_bounds = np.full(n_of_objectives, np.inf) if upper_bounds is None else np.asarray(upper_bounds)
+        if user_bounds is not None:
+            box_upper_bounds = np.where(np.isnan(user_bounds), box_upper_bounds, np.fmin(box_upper_bounds, user_bounds))
+
+        new_lower_bounds = np.full(n_of_objectives, np.inf)
+        new_upper_bounds = np.full(n_of_objectives, -np.inf)
+        found = np.zeros(n_of_objectives, dtype=bool)
+
+        for r in range(n_of_objectives):
+            # all the objectives but r are bounded by the point
+            query_upper_bounds = np.fmin(box_upper_bounds, point)
+            query_upper_bounds[r] = box_upper_bounds[r]
+
+            candidates = self._candidates(lower_bounds, query_upper_bounds)
+            if len(candidates) > 0:
+                ranks = self._ranks[r, candidates]
+                new_lower_bounds[r] = self._sorted[r, ranks.min()]
+                new_upper_bounds[r] = self._sorted[r, ranks.max()]
+                found[r] = True
+
+        return new_lower_bounds, new_upper_bounds, found
+
+
+class ClusterTree:
+    """A hierarchical clustering of a front, built once by bisecting it recursively with 2-means.
+
+    Each node of the tree holds a cluster of rows, their bounding box, and the
+    row closest to their mean as their representative. The rows of each node
+    are contiguous in a permutation of the front, like in a k-d tree. Choosing
+    representative rows within a box descends the tree only where the box cuts
+    through a node, so that the cost depends on the number of clusters
+    visited instead of the number of rows within the box.
+
+    Args:
+        front (np.ndarray): A 2D array with an objective vector on each row.
+        leaf_size (int, optional): Nodes with at most this many rows are not
+            bisected further. Defaults to 64.
+        n_iterations (int, optional): The number of 2-means iterations used to
+            bisect a node. Defaults to 5.
+    """
+
+    def __init__(self, front: np.ndarray, leaf_size: int = 64, n_iterations: int = 5):
+        self._front = front
+        self._order = np.arange(front.shape[0])
+
+        starts, ends, children, lowers, uppers, medoids = [], [], [], [], [], []
+
+        def add_node(start: int, end: int) -> Tuple[int, np.ndarray]:
+            rows = self._order[start:end]
+            points = np.asarray(front[rows])
+            starts.append(start)
+            ends.append(end)
+            children.append([-1, -1])
+            lowers.append(np.min(points, axis=0))
+            uppers.append(np.max(points, axis=0))
+            medoids.append(rows[np.argmin(np.linalg.norm(points - np.mean(points, axis=0), axis=1))])
+            return len(starts) - 1, points
+
+        pending = [add_node(0, front.shape[0])]
+        while pending:
+            node, points = pending.pop()
+            if len(points) <= leaf_size:
+                continue
+
+            left = self._bisect(points, n_iterations)
+            n_left = np.count_nonzero(left)
+            if n_left == 0 or n_left == len(points):
+                # identical points cannot be bisected
+                continue
+
+            start, end = starts[node], ends[node]
+            rows = self._order[start:end]
+            self._order[start:end] = np.concatenate((rows[left], rows[~left]))
+            del points
+
+            children[node] = []
+            for (child_start, child_end) in ((start, start + n_left), (start + n_left, end)):
+                child, child_points = add_node(child_start, child_end)
+                children[node].append(child)
+                pending.append((child, child_points))
+
+        self._starts = np.array(starts)
+        self._ends = np.array(ends)
+        self._children = np.array(children)
+        self._lowers = np.array(lowers)
+        self._uppers = np.array(uppers)
+        self._medoids = np.array(medoids)
+
+    def __len__(self) -> int:
+        """The number of nodes in the tree."""
+        return len(self._starts)
+
+    @staticmethod
+    def _bisect(points: np.ndarray, n_iterations: int) -> np.ndarray:
+        # 2-means started from two far apart points, the rows closer to the first center are on the left
+        a = points[np.argmax(np.sum((points - np.mean(points, axis=0)) ** 2, axis=1))]
+        b = points[np.argmax(np.sum((points - a) ** 2, axis=1))]
+
+        left = None
+        for _ in range(n_iterations):
+            # closer to a than to b, without computing the distances
+            new_left = points @ (b - a) <= (b @ b - a @ a) / 2
+            if left is not None and np.array_equal(new_left, left):
+                break
+            left = new_left
+            n_left = np.count_nonzero(left)
+            if n_left == 0 or n_left == len(points):
+                break
+            a = np.mean(points[left], axis=0)
+            b = (np.sum(points, axis=0) - a * n_left) / (len(points) - n_left)
+
+        return left
+
+    def _medoids_within(
+        self, leaves: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # the leaves with rows within the box, the number of those rows, and the one closest to their mean
+        sizes = self._ends[leaves] - self._starts[leaves]
+        offsets = np.repeat(self._starts[leaves] - np.cumsum(sizes) + sizes, sizes)
+        rows = self._order[offsets + np.arange(np.sum(sizes))]
+        labels = np.repeat(np.arange(len(leaves)), sizes)
+
+        points = np.asarray(self._front[rows])
+        inside = np.all((points >= lower_bounds) & (points <= upper_bounds), axis=1)
+        rows, labels, points = rows[inside], labels[inside], points[inside]
+
+        counts = np.bincount(labels, minlength=len(leaves))
+        means = np.stack(
+            [np.bincount(labels, weights=points[:, j], minlength=len(leaves)) for j in range(points.shape[1])], axis=1
+        ) / np.maximum(counts, 1)[:, None]
+        distances = np.linalg.norm(points - means[labels], axis=1)
+
+        # the closest row of each leaf comes first when sorted by leaf, then by distance
+        closest = np.lexsort((distances, labels))
+        first = np.concatenate(([True], labels[closest][1:] != labels[closest][:-1])) if len(closest) > 0 else []
+        found = counts > 0
+
+        return leaves[found], counts[found], rows[closest][first]
+
+    def _split(self, cluster: Tuple, lower_bounds: np.ndarray, upper_bounds: np.ndarray) -> List[Tuple]:
+        # the clusters within a cluster, a single row cannot be split
+        _, _, node, cut = cluster
+        if self._children[node, 0] >= 0 and not cut:
+            return [
+                (self._ends[child] - self._starts[child], self._medoids[child], child, False)
+                for child in self._children[node]
+            ]
+
+        rows = self._order[self._starts[node] : self._ends[node]]
+        if cut:
+            points = np.asarray(self._front[rows])
+            rows = rows[np.all((points >= lower_bounds) & (points <= upper_bounds), axis=1)]
+
+        return [(1, row, -1, False) for row in rows]
+
+    def representatives(
+        self,
+        n_points: int,
+        lower_bounds: Optional[np.ndarray] = None,
+        upper_bounds: Optional[np.ndarray] = None,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        """Chooses representative rows of the front within a box.
+
+        The tree is first descended to the largest clusters within the box,
+        one level at a time; only the leaves cut by the box are scanned. The
+        largest clusters are then bisected further until there are at least
+        n_points of them. If there are more, their representatives are
+        clustered into n_points clusters with k-means, weighted by the number
+        of rows they represent, and the representative closest to each
+        centroid is chosen.
+
+        Args:
+            n_points (int): The number of representative rows.
+            lower_bounds (Optional[np.ndarray], optional): The lower bounds of
+                the box. Defaults to None, which leaves the rows unbounded from below.
+            upper_bounds (Optional[np.ndarray], optional): The upper bounds of
+                the box. Defaults to None, which leaves the rows unbounded from above.
+            seed (Optional[int], optional): Seed for the k-means. Defaults to None.
+
+        Raises:
+            FrontException: No rows are within the box.
+
+        Returns:
+            np.ndarray: The indices of the representative rows. Fewer than
+            n_points are returned only when there are fewer rows within the box.
+        """
+        n_of_objectives = self._lowers.shape[1]
+        lower_bounds = np.full(n_of_objectives, -np.inf) if lower_bounds is None else np.asarray(lower_bounds)
+        upper_bounds = np.full(n_of_objectives, np.inf) if upper_bounds is None else np.asarray(upper_bounds)
+
+        contained, cut_leaves = [], []
+        nodes = np.array([0])
+        while len(nodes) > 0:
+            lowers, uppers = self._lowers[nodes], self._uppers[nodes]
+            disjoint = np.any(uppers < lower_bounds, axis=1) | np.any(lowers > upper_bounds, axis=1)
+            within = ~disjoint & np.all(lowers >= lower_bounds, axis=1) & np.all(uppers <= upper_bounds, axis=1)
+            cut = ~disjoint & ~within
+            leaf = self._children[nodes, 0] < 0
+
+            contained.append(nodes[within])
+            cut_leaves.append(nodes[cut & leaf])
+            nodes = self._children[nodes[cut & ~leaf]].ravel()
+
+        contained, cut_leaves = np.concatenate(contained), np.concatenate(cut_leaves)
+        cut_leaves, cut_weights, cut_medoids = self._medoids_within(cut_leaves, lower_bounds, upper_bounds)
+
+        # the number of rows represented, the representative row, the node, and whether the box cuts the node
+        nodes = np.concatenate((contained, cut_leaves))
+        weights = np.concatenate((self._ends[contained] - self._starts[contained], cut_weights))
+        medoids = np.concatenate((self._medoids[contained], cut_medoids)).astype(int)
+        cut = np.arange(len(nodes)) >= len(contained)
+
+        if len(nodes) == 0:
+            raise FrontException("None of the rows of the front are within the given bounds.")
+
+        if len(nodes) < n_points:
+            # split the largest clusters until there are enough of them
+            clusters = list(zip(weights, medoids, nodes, cut))
+            while len(clusters) < n_points:
+                i = max(range(len(clusters)), key=lambda i: clusters[i][0])
+                if clusters[i][0] <= 1:
+                    break
+                clusters.extend(self._split(clusters.pop(i), lower_bounds, upper_bounds))
+
+            weights = np.array([cluster[0] for cluster in clusters], dtype=float)
+            medoids = np.array([cluster[1] for cluster in clusters], dtype=int)
+
+        if len(medoids) <= n_points:
+            return medoids
+
+        points = np.asarray(self._front[medoids])
+        kmeans = KMeans(n_clusters=n_points, random_state=seed).fit(points, sample_weight=weights)
+        closest, _ = pairwise_distances_argmin_min(kmeans.cluster_centers_, points)
+
+        return medoids[closest]
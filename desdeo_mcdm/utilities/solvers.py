@@ -1,14 +1,30 @@
 """Implements various useful solvers.
 
 """
+import hashlib
+import json
 import logging
-from typing import Callable, Optional, Tuple, Union
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice, product
+from math import comb
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
+from desdeo_mcdm.utilities.archive import NonDominatedArchive
+from desdeo_mcdm.utilities.cache import EvaluationCache
 from desdeo_problem.problem import MOProblem
 from desdeo_tools.scalarization.ASF import ASFBase, PointMethodASF
 from desdeo_tools.scalarization.Scalarizer import Scalarizer
 from desdeo_tools.solver.ScalarSolver import ScalarMethod, ScalarMinimizer
+from scipy.optimize import NonlinearConstraint, OptimizeResult, differential_evolution, minimize
+from scipy.stats import qmc
 
 
 class MCDMUtilityException(Exception):
@@ -19,6 +35,47 @@ class MCDMUtilityException(Exception):
     pass
 
 
+class SolverConfiguration:
+    """Configures how the scalarized subproblems of a method are solved.
+
+    A single configuration can be shared by the payoff table method and the
+    subproblems of an interactive method, so that all of them are solved the
+    same way.
+
+    Args:
+        method (Optional[Union[ScalarMethod, str]], optional): The method used
+            to minimize the scalarized subproblems. Defaults to 'scipy_de'.
+        executor (Optional[Union[str, Executor]], optional): Used to solve
+            independent subproblems concurrently. See managed_executor.
+            Defaults to None, which solves them one after another.
+        n_workers (Optional[int], optional): The maximum number of workers
+            used when a new pool is created for executor. Defaults to None.
+        warm_start (bool, optional): Whether to seed the initial population of
+            differential evolution with solutions found earlier. See
+            make_de_method. Methods using the configuration then supply a 2D
+            initial guess with a known solution on each row, which the
+            minimizing method must accept. Defaults to False.
+        seed (Optional[int], optional): Seed for differential evolution when
+            method is 'scipy_de'. With a seed, the same subproblems are always
+            solved the same way, so their solutions are reproducible and can
+            be cached. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+        executor: Optional[Union[str, Executor]] = None,
+        n_workers: Optional[int] = None,
+        warm_start: bool = False,
+        seed: Optional[int] = None,
+    ):
+        self.method = method
+        self.executor = executor
+        self.n_workers = n_workers
+        self.warm_start = warm_start
+        self.seed = seed
+
+
 def weighted_scalarizer(xs: np.ndarray, ws: np.ndarray) -> np.ndarray:
     """A simple linear weight based scalarizer.
     
@@ -32,6 +89,255 @@ def weighted_scalarizer(xs: np.ndarray, ws: np.ndarray) -> np.ndarray:
     return np.sum(np.atleast_2d(xs) * ws, axis=1)
 
 
+def _call_transposed(fun: Callable[[np.ndarray], np.ndarray], xs: np.ndarray) -> np.ndarray:
+    # a vectorized differential evolution passes the population with a candidate on each column
+    xs = np.asarray(xs)
+    return fun(xs.T) if xs.ndim == 2 else fun(xs)
+
+
+def _call_constraint_transposed(fun: Callable[[np.ndarray], np.ndarray], xs: np.ndarray) -> np.ndarray:
+    # and expects the values of each constraint on the rows, one column for each candidate
+    xs = np.asarray(xs)
+    if xs.ndim == 1:
+        return fun(xs)
+
+    return np.reshape(fun(xs.T), (xs.shape[1], -1)).T
+
+
+def _seeded_population(
+    x0: np.ndarray, bounds: np.ndarray, popsize: int = 15, seed: Optional[Union[int, np.random.Generator]] = None
+) -> np.ndarray:
+    """Creates an initial population for differential evolution with the
+    rows of x0 first, and the rest sampled with a Latin hypercube."""
+    bounds = np.asarray(bounds, dtype=float)
+    n_of_variables = len(bounds)
+    size = max(popsize * n_of_variables, 5)
+
+    # the known solutions, without duplicates, within the bounds, and no more than half the population.
+    # The order is kept, so that the first row, the current solution, is always included.
+    seeds = np.clip(np.atleast_2d(np.asarray(x0, dtype=float)), bounds[:, 0], bounds[:, 1])
+    _, first = np.unique(seeds, axis=0, return_index=True)
+    seeds = seeds[np.sort(first)][: size // 2]
+
+    sampler = qmc.LatinHypercube(d=n_of_variables, seed=seed)
+    sampled = qmc.scale(sampler.random(size - len(seeds)), bounds[:, 0], bounds[:, 1])
+
+    return np.vstack((seeds, sampled))
+
+
+def _differential_evolution(
+    fun: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    bounds: np.ndarray,
+    constraints=(),
+    vectorized: bool = True,
+    workers: Union[int, Callable] = 1,
+    warm_start: bool = False,
+    **kwargs,
+) -> OptimizeResult:
+    """Minimizes fun with scipy's differential evolution, evaluating each
+    generation as a single batch when vectorized. x0 is ignored unless
+    warm_start, in which case each of its rows seeds the initial population."""
+    if warm_start and x0 is not None:
+        kwargs["init"] = _seeded_population(x0, bounds, kwargs.get("popsize", 15), kwargs.get("seed"))
+
+    if not vectorized or workers != 1:
+        # parallel workers would override the vectorized evaluation anyway
+        return differential_evolution(fun, bounds, constraints=constraints, workers=workers, **kwargs)
+
+    if isinstance(constraints, NonlinearConstraint):
+        constraints = NonlinearConstraint(
+            partial(_call_constraint_transposed, constraints.fun), constraints.lb, constraints.ub
+        )
+
+    # a vectorized evaluation implies deferred updating, state it explicitly to avoid a warning
+    kwargs["updating"] = "deferred"
+
+    return differential_evolution(
+        partial(_call_transposed, fun), bounds, constraints=constraints, vectorized=True, **kwargs
+    )
+
+
+def make_de_method(
+    method_args: Optional[Dict] = None,
+    vectorized: bool = True,
+    workers: Union[int, Callable] = 1,
+    warm_start: bool = False,
+) -> ScalarMethod:
+    """Creates a ScalarMethod minimizing with scipy's differential evolution.
+
+    Unlike a ScalarMethod wrapping differential_evolution directly, the whole
+    population of each generation is evaluated at once, i.e., the scalarizer
+    and the constraints are called with a 2D array of candidates. They should
+    therefore accept a 2D array with a candidate on each row and return a
+    value, or the values of each constraint, for each row.
+
+    Args:
+        method_args (Optional[Dict], optional): Keyword arguments passed to
+            scipy.optimize.differential_evolution. Defaults to None.
+        vectorized (bool, optional): Whether to evaluate each generation as a
+            single batch. Defaults to True.
+        workers (Union[int, Callable], optional): Passed to
+            differential_evolution for evaluating the population in parallel,
+            e.g., a map-like callable such as the map of an Executor. Takes
+            precedence over vectorized when other than 1. Defaults to 1.
+        warm_start (bool, optional): Whether to seed the initial population
+            with the initial guess. The guess may be a 2D array with a known
+            solution on each row, e.g., solutions to earlier, similar
+            subproblems. Up to half of the population is seeded, the rest is
+            sampled with a Latin hypercube to keep the population diverse.
+            The best member of the final population is polished with a local
+            gradient based solver, unless 'polish' is set in method_args.
+            Defaults to False.
+
+    Returns:
+        ScalarMethod: A method to be supplied to a ScalarMinimizer.
+    """
+    method_args = dict(method_args) if method_args is not None else {}
+    method_args.update({"vectorized": vectorized, "workers": workers})
+    if warm_start:
+        method_args["warm_start"] = True
+        method_args.setdefault("polish", True)
+
+    return ScalarMethod(_differential_evolution, method_args=method_args, use_scipy=True)
+
+
+def is_warm_started(method: Optional[Union[ScalarMethod, str]]) -> bool:
+    """Tells whether a method accepts a 2D initial guess with a known solution on each row.
+
+    Only the methods made by make_de_method with warm_start do.
+
+    Args:
+        method (Optional[Union[ScalarMethod, str]]): The method used to minimize the subproblems.
+
+    Returns:
+        bool: Whether the method was made by make_de_method with warm_start.
+    """
+    return (
+        isinstance(method, ScalarMethod)
+        and method._method is _differential_evolution
+        and bool((method._method_args or {}).get("warm_start"))
+    )
+
+
+def _configured_method(configuration: SolverConfiguration) -> Optional[Union[ScalarMethod, str]]:
+    # the 'scipy_de' of desdeo_tools cannot be seeded, a seeded configuration uses a seeded one instead
+    if configuration.method == "scipy_de" and configuration.seed is not None:
+        return make_de_method({"seed": configuration.seed}, warm_start=configuration.warm_start)
+
+    return configuration.method
+
+
+@contextmanager
+def managed_executor(executor: Union[str, Executor], n_workers: Optional[int] = None) -> Iterator[Executor]:
+    """Provides an executor to run independent subproblems concurrently.
+
+    Args:
+        executor (Union[str, Executor]): Either 'process' or 'thread' to
+            create a new process or thread pool, respectively, or an already
+            existing executor. An existing executor is not shut down when the
+            context exits.
+        n_workers (Optional[int], optional): The maximum number of workers in
+            a newly created pool. Ignored when an existing executor is given.
+            Defaults to None, which lets the pool decide.
+
+    Raises:
+        MCDMUtilityException: The executor is neither 'process', 'thread', nor an Executor.
+
+    Yields:
+        Executor: The executor to submit work to.
+    """
+    if isinstance(executor, Executor):
+        yield executor
+
+    elif executor == "process":
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            yield pool
+
+    elif executor == "thread":
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            yield pool
+
+    else:
+        raise MCDMUtilityException(
+            f"The executor must be either 'process', 'thread', or an instance of Executor. Found {executor}."
+        )
+
+
+def _evaluate_objectives(evaluations: EvaluationCache, xs: np.ndarray) -> np.ndarray:
+    return evaluations.evaluate(xs).objectives
+
+
+def _evaluate_constraints(evaluations: EvaluationCache, xs: np.ndarray) -> np.ndarray:
+    return evaluations.evaluate(xs).constraints.squeeze()
+
+
+def _solve_payoff_table_row(
+    objective_evaluator: Callable[[np.ndarray], np.ndarray],
+    variable_bounds: np.ndarray,
+    constraint_evaluator: Optional[Callable[[np.ndarray], np.ndarray]],
+    initial_guess: np.ndarray,
+    solver_method: Optional[Union[ScalarMethod, str]],
+    ws: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solves a single row of a payoff table by minimizing the objectives weighted by ws.
+
+    Defined on the module level so that it can be sent to worker processes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The variable and objective values of the found solution.
+    """
+    scalarizer = Scalarizer(objective_evaluator, weighted_scalarizer, scalarizer_args={"ws": ws})
+
+    # the minimizer shifts the bounds in place, work on a copy
+    solver = ScalarMinimizer(scalarizer, np.copy(variable_bounds), constraint_evaluator, solver_method,)
+
+    opt_res = solver.minimize(initial_guess)
+    if not opt_res["success"]:
+        print("Unsuccessful optimization result encountered while computing a payoff table!")
+
+    return opt_res["x"], np.reshape(objective_evaluator(opt_res["x"]), -1)
+
+
+def _solve_payoff_table(
+    objective_evaluator: Callable[[np.ndarray], np.ndarray],
+    n_of_objectives: int,
+    variable_bounds: np.ndarray,
+    constraint_evaluator: Optional[Callable[[np.ndarray], np.ndarray]],
+    initial_guess: Optional[np.ndarray],
+    solver_method: Optional[Union[ScalarMethod, str]],
+    executor: Optional[Union[str, Executor]],
+    n_workers: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solves a payoff table. See payoff_table_method_general for the arguments.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The payoff table with the objective
+        values of each row, and the variable values of each row.
+    """
+    ws = np.eye(n_of_objectives)
+    if initial_guess is None:
+        initial_guess = variable_bounds[:, 0]
+
+    solve_row = partial(
+        _solve_payoff_table_row, objective_evaluator, variable_bounds, constraint_evaluator, initial_guess, solver_method,
+    )
+
+    if executor is None:
+        rows = [solve_row(w) for w in ws]
+    else:
+        with managed_executor(executor, n_workers) as pool:
+            rows = list(pool.map(solve_row, ws))
+
+    po_table = np.zeros((n_of_objectives, n_of_objectives))
+    xs = np.zeros((n_of_objectives, len(variable_bounds)))
+    for i, (x, row) in enumerate(rows):
+        po_table[i] = row
+        xs[i] = x
+
+    return po_table, xs
+
+
 def payoff_table_method_general(
     objective_evaluator: Callable[[np.ndarray], np.ndarray],
     n_of_objectives: int,
@@ -39,6 +345,9 @@ def payoff_table_method_general(
     constraint_evaluator: Optional[Callable[[np.ndarray], np.ndarray]] = None,
     initial_guess: Optional[np.ndarray] = None,
     solver_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+    executor: Optional[Union[str, Executor]] = None,
+    n_workers: Optional[int] = None,
+    configuration: Optional[SolverConfiguration] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Solves a representation for the nadir and ideal points for a
     multiobjective minimization problem with objectives defined as the result
@@ -67,26 +376,41 @@ def payoff_table_method_general(
         solver_method (Optional[Union[ScalarMethod, str]], optional): The
             method to solve the scalarized problems in the payoff table method.
             Defaults to "scipy_de", which ignores initial_guess.
+        executor (Optional[Union[str, Executor]], optional): If given, the rows
+            of the payoff table are solved concurrently. Either 'process',
+            'thread', or an existing executor. With 'process', the evaluators and
+            the solver method must be picklable. Defaults to None, which solves
+            the rows one after another.
+        n_workers (Optional[int], optional): The maximum number of workers used
+            when a new pool is created for executor. Defaults to None.
+        configuration (Optional[SolverConfiguration], optional): If given,
+            overrides solver_method, executor, and n_workers. Defaults to None.
     
     Returns:
         Tuple[np.ndarray, np.ndarray]: The representations computed using the
         payoff table for the ideal and nadir points respectively.
-    """
-    scalarizer = Scalarizer(objective_evaluator, weighted_scalarizer, scalarizer_args={"ws": None},)
-
-    solver = ScalarMinimizer(scalarizer, variable_bounds, constraint_evaluator, solver_method,)
 
-    ws = np.eye(n_of_objectives)
-    po_table = np.zeros((n_of_objectives, n_of_objectives))
-    if initial_guess is None:
-        initial_guess = variable_bounds[:, 0]
+    Note:
+        Each row is solved independently of the others. When the solver is
+        seeded, the concurrent modes yield the same table as the serial one.
+    """
+    if configuration is not None:
+        solver_method, executor, n_workers = (
+            _configured_method(configuration),
+            configuration.executor,
+            configuration.n_workers,
+        )
 
-    for i in range(n_of_objectives):
-        scalarizer._scalarizer_args = {"ws": ws[i]}
-        opt_res = solver.minimize(initial_guess)
-        if not opt_res["success"]:
-            print("Unsuccessful optimization result encountered while computing a payoff table!")
-        po_table[i] = objective_evaluator(opt_res["x"])
+    po_table, _ = _solve_payoff_table(
+        objective_evaluator,
+        n_of_objectives,
+        variable_bounds,
+        constraint_evaluator,
+        initial_guess,
+        solver_method,
+        executor,
+        n_workers,
+    )
 
     ideal = np.diag(po_table)
     nadir = np.max(po_table, axis=0)
@@ -94,10 +418,194 @@ def payoff_table_method_general(
     return ideal, nadir
 
 
+def problem_fingerprint(problem: MOProblem, model_version: str = "") -> str:
+    """Computes a fingerprint identifying a problem across sessions.
+
+    The fingerprint covers the variable bounds, the names of the objectives
+    and variables, and the number of constraints. Changes to the models
+    behind the objectives are not visible to it, which is why a model
+    version should be supplied and updated whenever the models change.
+
+    Args:
+        problem (MOProblem): The problem to fingerprint.
+        model_version (str, optional): A version of the models of the
+            problem, supplied by the user. Defaults to "".
+
+    Returns:
+        str: A hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(problem.get_variable_bounds(), dtype=float).tobytes())
+    digest.update(
+        json.dumps(
+            {
+                "objectives": list(problem.get_objective_names()),
+                "variables": list(problem.get_variable_names()),
+                "n_of_constraints": problem.n_of_constraints,
+                "model_version": model_version,
+            }
+        ).encode()
+    )
+
+    return digest.hexdigest()
+
+
+class PayoffTableCache:
+    """A persistent on-disk cache of payoff tables, keyed by problem fingerprints.
+
+    Each entry stores the payoff table, the ideal and nadir points derived
+    from it, and the variable values solving each row. Entries are written
+    to a temporary file first and then atomically renamed in place, so that
+    readers never see partially written entries. Concurrent writers of the
+    same entry are serialized with a lock file. A writer finding the entry
+    locked skips writing, since the other writer is storing the same entry.
+    The lock file records its owner, and a writer only removes its own lock.
+
+    Args:
+        directory (Union[str, os.PathLike]): The directory holding the entries.
+            Created if missing.
+        model_version (str, optional): A version of the models of the problems,
+            see problem_fingerprint. Defaults to "".
+        stale_lock_timeout (float, optional): Lock files older than this, in
+            seconds, are considered left over by crashed writers and removed.
+            Defaults to 600.
+    """
+
+    def __init__(
+        self, directory: Union[str, os.PathLike], model_version: str = "", stale_lock_timeout: float = 600.0
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.model_version = model_version
+        self.stale_lock_timeout = stale_lock_timeout
+
+    def path(self, problem: MOProblem) -> Path:
+        """Returns the path of the entry of a problem."""
+        return self.directory / f"{problem_fingerprint(problem, self.model_version)}.npz"
+
+    def load(self, problem: MOProblem) -> Optional[Dict[str, np.ndarray]]:
+        """Loads the entry of a problem.
+
+        Args:
+            problem (MOProblem): The problem whose entry is loaded.
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: The entry with the keys 'payoff_table',
+            'ideal', 'nadir', and 'xs'. None if the problem has no readable entry.
+        """
+        try:
+            with np.load(self.path(problem)) as entry:
+                return {key: entry[key] for key in ("payoff_table", "ideal", "nadir", "xs")}
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def store(self, problem: MOProblem, payoff_table: np.ndarray, xs: np.ndarray) -> bool:
+        """Stores the payoff table of a problem.
+
+        Args:
+            problem (MOProblem): The problem whose payoff table is stored.
+            payoff_table (np.ndarray): The payoff table, objective values of each row on the rows.
+            xs (np.ndarray): The variable values solving each row of the payoff table.
+
+        Returns:
+            bool: Whether the entry was written. False if another writer held the lock.
+        """
+        path = self.path(problem)
+        lock = path.with_suffix(".lock")
+
+        token = self._acquire(lock)
+        if token is None:
+            return False
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(
+                        f,
+                        payoff_table=payoff_table,
+                        ideal=np.diag(payoff_table),
+                        nadir=np.max(payoff_table, axis=0),
+                        xs=xs,
+                    )
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        finally:
+            self._release(lock, token)
+
+        return True
+
+    def invalidate(self, problem: Optional[MOProblem] = None) -> None:
+        """Removes the entry of a problem, or every entry if no problem is given."""
+        paths = [self.path(problem)] if problem is not None else self.directory.glob("*.npz")
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _acquire(self, lock: Path) -> Optional[str]:
+        # the lock file holds a token of its owner, None if the lock is held by another writer
+        token = uuid.uuid4().hex
+        for _ in range(2):
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if not self._remove_stale(lock):
+                    return None
+                continue
+
+            with os.fdopen(fd, "w") as f:
+                f.write(token)
+            return token
+
+        return None
+
+    def _remove_stale(self, lock: Path) -> bool:
+        # a lock left over by a crashed writer is moved aside under a unique name before it is removed. Only one
+        # writer can move it, and a fresh lock moved by mistake is put back.
+        claimed = lock.with_name(f"{lock.name}.{uuid.uuid4().hex}")
+        try:
+            if time.time() - os.path.getmtime(lock) < self.stale_lock_timeout:
+                return False
+            os.rename(lock, claimed)
+        except FileNotFoundError:
+            # released or removed by another writer
+            return True
+
+        stale = time.time() - os.path.getmtime(claimed) >= self.stale_lock_timeout
+        if not stale:
+            try:
+                os.link(claimed, lock)
+            except OSError:
+                pass
+        os.remove(claimed)
+
+        return stale
+
+    @staticmethod
+    def _release(lock: Path, token: str) -> None:
+        # the lock is only removed if it is still owned, another writer may have taken it over as stale
+        try:
+            with open(lock) as f:
+                owned = f.read() == token
+        except FileNotFoundError:
+            return
+
+        if owned:
+            os.remove(lock)
+
+
 def payoff_table_method(
     problem: MOProblem,
     initial_guess: Optional[np.ndarray] = None,
     solver_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+    executor: Optional[Union[str, Executor]] = None,
+    n_workers: Optional[int] = None,
+    configuration: Optional[SolverConfiguration] = None,
+    cache: Optional[PayoffTableCache] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Uses the payoff table method to solve for the ideal and nadir points of a MOProblem.
     Call through to payoff_table_method_general.
@@ -109,24 +617,377 @@ def payoff_table_method(
             the variables in MOProblem. Defaults to None.
         solver_method (Optional[Union[ScalarMethod, str]]): The method used to minimize the
             individual problems in the payoff table method. Defaults to 'scipy_de'.
+        executor (Optional[Union[str, Executor]]): If given, solve the rows of the payoff
+            table concurrently. With 'process', the problem must be picklable. See
+            payoff_table_method_general. Defaults to None.
+        n_workers (Optional[int]): The maximum number of workers used by the executor.
+            Defaults to None.
+        configuration (Optional[SolverConfiguration]): If given, overrides solver_method,
+            executor, and n_workers. Defaults to None.
+        cache (Optional[PayoffTableCache]): If given, the payoff table is loaded from the
+            cache when available, and stored in it otherwise. The cache does not
+            distinguish between solver methods. Defaults to None.
     
     Returns:
         Tuple[np.ndarray, np.ndarray]: The ideal and nadir points
     """
+    if cache is not None:
+        entry = cache.load(problem)
+        if entry is not None:
+            return entry["ideal"], entry["nadir"]
+
+    if configuration is not None:
+        solver_method, executor, n_workers = (
+            _configured_method(configuration),
+            configuration.executor,
+            configuration.n_workers,
+        )
+
+    # the objectives and constraints share the evaluations of the problem
+    evaluations = EvaluationCache(problem)
+
+    # partials instead of lambdas, so that the evaluators can be sent to worker processes
     if problem.n_of_constraints > 0:
-        constraints = lambda x: problem.evaluate(x).constraints.squeeze()
+        constraints = partial(_evaluate_constraints, evaluations)
     else:
         constraints = None
 
-    return payoff_table_method_general(
-        lambda xs: problem.evaluate(xs).objectives,
+    po_table, xs = _solve_payoff_table(
+        partial(_evaluate_objectives, evaluations),
         problem.n_of_objectives,
         problem.get_variable_bounds(),
         constraints,
         initial_guess,
         solver_method,
+        executor,
+        n_workers,
     )
 
+    if cache is not None:
+        cache.store(problem, po_table, xs)
+
+    return np.diag(po_table), np.max(po_table, axis=0)
+
+
+def _warm_started_minimize(
+    fun: Callable[[np.ndarray], np.ndarray], x0: np.ndarray, bounds: np.ndarray, constraints=(), **kwargs
+) -> Dict:
+    """Minimizes fun locally starting from x0, for warm-starting from a neighbouring solution.
+
+    The achievement scalarizing function is not smooth, which stalls gradient based
+    solvers at its kinks. Uses Nelder-Mead instead, with an initial simplex scaled to
+    the bounds, since the default one degenerates when x0 is close to zero.
+    """
+    x0 = np.asarray(x0, dtype=float)
+    lower, upper = bounds[:, 0], bounds[:, 1]
+    widths = np.where(np.isfinite(upper - lower), upper - lower, 1.0)
+
+    simplex = np.tile(x0, (len(x0) + 1, 1))
+    steps = 0.05 * widths
+    # step away from the nearer bound
+    steps = np.where(x0 + steps > upper, -steps, steps)
+    simplex[np.arange(1, len(x0) + 1), np.arange(len(x0))] += steps
+
+    return minimize(fun, x0, method="Nelder-Mead", bounds=bounds, options={"initial_simplex": simplex}, **kwargs)
+
+
+def _iter_solve_reference_points(
+    objective_evaluator: Callable[[np.ndarray], np.ndarray],
+    variable_bounds: np.ndarray,
+    ideal: np.ndarray,
+    nadir: np.ndarray,
+    solver_method: Optional[Union[ScalarMethod, str]],
+    continuation: bool,
+    z_points: Iterable[np.ndarray],
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Solves an achievement scalarization problem for each reference point in z_points.
+
+    With continuation, each problem is first solved locally starting from
+    the solution of the previous reference point, falling back to
+    solver_method only when the local solve fails.
+
+    Yields:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The reference point, and the
+        variable and objective values found for it. Unsuccessful solves are skipped.
+    """
+    # use ASF to (almost) guarantee Pareto optimality.
+    asf = PointMethodASF(nadir, ideal)
+
+    scalarizer = Scalarizer(objective_evaluator, asf, scalarizer_args={"reference_point": None})
+    # the minimizer shifts the bounds in place, work on a copy
+    solver = ScalarMinimizer(scalarizer, bounds=np.copy(variable_bounds), method=solver_method)
+
+    if continuation:
+        local_method = ScalarMethod(_warm_started_minimize, use_scipy=True)
+        local_solver = ScalarMinimizer(scalarizer, bounds=np.copy(variable_bounds), method=local_method)
+
+    x_previous = None
+    for z in z_points:
+        scalarizer._scalarizer_args = {"reference_point": z}
+
+        res = None
+        if continuation and x_previous is not None:
+            res = local_solver.minimize(x_previous)
+
+        if res is None or not res["success"]:
+            res = solver.minimize(None)
+
+        if not res["success"]:
+            print("Non successfull optimization")
+            continue
+
+        x_previous = res["x"]
+        yield z, res["x"], np.reshape(objective_evaluator(res["x"]), -1)
+
+
+def _solve_reference_points(
+    objective_evaluator: Callable[[np.ndarray], np.ndarray],
+    variable_bounds: np.ndarray,
+    ideal: np.ndarray,
+    nadir: np.ndarray,
+    solver_method: Optional[Union[ScalarMethod, str]],
+    continuation: bool,
+    z_chunk: np.ndarray,
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Solves a chunk of reference points at once. See _iter_solve_reference_points.
+
+    Defined on the module level so that it can be sent to worker processes.
+    """
+    return list(
+        _iter_solve_reference_points(
+            objective_evaluator, variable_bounds, ideal, nadir, solver_method, continuation, z_chunk
+        )
+    )
+
+
+def _chunked(iterable: Iterable[np.ndarray], chunksize: int) -> Iterator[np.ndarray]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield np.array(chunk)
+
+
+def _iter_concurrent_solutions(
+    solve_chunk: Callable[[np.ndarray], List[Tuple[np.ndarray, np.ndarray, np.ndarray]]],
+    z_points: Iterable[np.ndarray],
+    executor: Union[str, Executor],
+    n_workers: Optional[int],
+    chunksize: int,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    chunks = _chunked(z_points, chunksize)
+    # keep only a bounded number of chunks in flight, so that the reference points are generated lazily
+    max_in_flight = 2 * (n_workers or os.cpu_count() or 1)
+
+    with managed_executor(executor, n_workers) as pool:
+        pending = {pool.submit(solve_chunk, chunk) for chunk in islice(chunks, max_in_flight)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending |= {pool.submit(solve_chunk, chunk) for chunk in islice(chunks, max_in_flight - len(pending))}
+
+                for future in done:
+                    yield from future.result()
+        finally:
+            # the consumer may stop early
+            for future in pending:
+                future.cancel()
+
+
+def _steps(ideal: np.ndarray, nadir: np.ndarray, step: Union[np.ndarray, float]) -> np.ndarray:
+    """Checks the supplied step and returns the step of each objective as an array.
+
+    Raises:
+        MCDMUtilityException: Mismatching sizes of the supplied ideal and
+        nadir points between the step, when step is an array. Or the type of
+        step is something else than np.ndarray of float.
+    """
+    if type(step) is float:
+        return np.full(ideal.shape, step)
+
+    elif type(step) is np.ndarray:
+        if not ideal.shape == nadir.shape == step.shape:
+            raise MCDMUtilityException(
+                "The shapes of the supplied step array does not match the " "shape of the ideal and nadir points."
+            )
+        return step
+
+    else:
+        raise MCDMUtilityException("step must be either a numpy array or an float.")
+
+
+def _grid_reference_points(
+    ideal: np.ndarray, nadir: np.ndarray, step: Union[np.ndarray, float], eps: float
+) -> Iterator[np.ndarray]:
+    """Lazily generates an evenly spaced grid of reference points between the ideal and nadir points."""
+    # bounds to be used to compute slices
+    stacked = np.stack((ideal, nadir)).T
+    lower_slice_b, upper_slice_b = np.min(stacked, axis=1), np.max(stacked, axis=1)
+
+    steps = _steps(ideal, nadir, step)
+    slices = [slice(start, stop + eps, s) for (start, stop, s) in zip(lower_slice_b, upper_slice_b, steps)]
+
+    # the grid of np.mgrid[slices] in the same order, without materializing the whole mesh
+    return map(np.array, product(*[np.mgrid[s] for s in slices]))
+
+
+def _n_of_simplex_divisions(ideal: np.ndarray, nadir: np.ndarray, step: Union[np.ndarray, float]) -> int:
+    # as many divisions as the grid has along its longest edge
+    return max(int(np.max(np.round(np.abs(nadir - ideal) / _steps(ideal, nadir, step)))), 1)
+
+
+def _compositions(total: int, n_of_parts: int) -> Iterator[Tuple[int, ...]]:
+    if n_of_parts == 1:
+        yield (total,)
+        return
+
+    for first in range(total, -1, -1):
+        for rest in _compositions(total - first, n_of_parts - 1):
+            yield (first,) + rest
+
+
+def _simplex_reference_points(ideal: np.ndarray, nadir: np.ndarray, n_of_divisions: int) -> Iterator[np.ndarray]:
+    """Lazily generates the Das-Dennis simplex lattice mapped between the ideal and nadir points.
+
+    The weights w of the lattice are non-negative multiples of 1/n_of_divisions
+    summing up to one. They are mapped to the reference points ideal + w * (nadir - ideal).
+    """
+    for composition in _compositions(n_of_divisions, len(ideal)):
+        yield ideal + np.array(composition) / n_of_divisions * (nadir - ideal)
+
+
+def _sampled_reference_points(
+    ideal: np.ndarray, nadir: np.ndarray, sampler: str, n_of_points: int, seed: Optional[int]
+) -> Iterator[np.ndarray]:
+    """Samples reference points in the box spanned by the ideal and nadir points using a
+    Latin hypercube ('lhs') or a scrambled Sobol sequence ('sobol')."""
+    if sampler == "lhs":
+        samples = qmc.LatinHypercube(d=len(ideal), seed=seed).random(n_of_points)
+    else:
+        # Sobol sequences are balanced in powers of two
+        m = max(int(np.ceil(np.log2(n_of_points))), 0)
+        samples = qmc.Sobol(d=len(ideal), seed=seed).random_base2(m)[:n_of_points]
+
+    return iter(ideal + samples * (nadir - ideal))
+
+
+def _morton_order(points: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Returns the indices that sort the points along a Morton (Z-order) curve
+    spanning the box between lower and upper."""
+    k = points.shape[1]
+    bits = min(16, 64 // k)
+
+    lower, upper = np.minimum(lower, upper), np.maximum(lower, upper)
+    span = np.where(upper > lower, upper - lower, 1.0)
+    cells = np.clip((points - lower) / span, 0.0, 1.0) * (2 ** bits - 1)
+    cells = np.round(cells).astype(np.uint64)
+
+    # interleave the bits of the coordinates, the most significant bits first
+    codes = np.zeros(len(points), dtype=np.uint64)
+    for bit in range(bits - 1, -1, -1):
+        for i in range(k):
+            codes = (codes << np.uint64(1)) | ((cells[:, i] >> np.uint64(bit)) & np.uint64(1))
+
+    return np.argsort(codes, kind="stable")
+
+
+def _reference_points(
+    ideal: np.ndarray,
+    nadir: np.ndarray,
+    step: Union[np.ndarray, float],
+    eps: float,
+    reference_set: str,
+    n_reference_points: Optional[int],
+    seed: Optional[int],
+) -> Iterator[np.ndarray]:
+    """Generates the reference points used to compute a Pareto front representation.
+
+    Raises:
+        MCDMUtilityException: An unknown reference set. Or the step is invalid, see _steps.
+    """
+    if reference_set == "grid":
+        return _grid_reference_points(ideal, nadir, step, eps)
+
+    elif reference_set == "simplex":
+        return _simplex_reference_points(ideal, nadir, _n_of_simplex_divisions(ideal, nadir, step))
+
+    elif reference_set in ("lhs", "sobol"):
+        if n_reference_points is None:
+            # as many points as on the simplex lattice with the same step
+            n_reference_points = comb(_n_of_simplex_divisions(ideal, nadir, step) + len(ideal) - 1, len(ideal) - 1)
+
+        return _sampled_reference_points(ideal, nadir, reference_set, n_reference_points, seed)
+
+    else:
+        raise MCDMUtilityException(
+            f"Unknown reference set '{reference_set}'. Expected one of 'grid', 'simplex', 'lhs', or 'sobol'."
+        )
+
+
+def iter_pareto_front_representation_general(
+    objective_evaluator: Callable[[np.ndarray], np.ndarray],
+    n_of_objectives: int,
+    variable_bounds: np.ndarray,
+    step: Optional[Union[np.ndarray, float]] = 0.1,
+    eps: Optional[float] = 1e-6,
+    ideal: Optional[np.ndarray] = None,
+    nadir: Optional[np.ndarray] = None,
+    constraint_evaluator: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    solver_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+    executor: Optional[Union[str, Executor]] = None,
+    n_workers: Optional[int] = None,
+    chunksize: int = 32,
+    reference_set: str = "grid",
+    n_reference_points: Optional[int] = None,
+    seed: Optional[int] = None,
+    continuation: bool = False,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Streaming variant of solve_pareto_front_representation_general.
+
+    The reference points are generated lazily and each solution is yielded
+    as soon as its achievement scalarization problem has been solved.
+    Unlike solve_pareto_front_representation_general, the yielded solutions
+    are not filtered for dominance. Collect them in a NonDominatedArchive
+    if needed. The arguments are the same as in
+    solve_pareto_front_representation_general.
+
+    Raises:
+        MCDMUtilityException: Mismatching sizes of the supplied ideal and
+        nadir points between the step, when step is an array. Or the type of
+        step is something else than np.ndarray of float. Or an unknown
+        reference_set.
+
+    Returns:
+        Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]: An iterator
+        yielding the reference point, and the variable and objective values
+        of each successful solve. With an executor, the solutions are yielded
+        in the order their chunks finish.
+    """
+    if np.all(np.isinf(ideal)) or np.all(np.isinf(nadir)):
+        # compure ideal and nadir using payoff table
+        ideal, nadir = payoff_table_method_general(
+            objective_evaluator, n_of_objectives, variable_bounds, constraint_evaluator,
+        )
+
+    z_points = _reference_points(ideal, nadir, step, eps, reference_set, n_reference_points, seed)
+
+    if continuation:
+        # walk the reference points so that consecutive points, and thus their solutions, are close to each other
+        z_points = np.array(list(z_points))
+        z_points = z_points[_morton_order(z_points, ideal, nadir)]
+
+    if executor is None:
+        return _iter_solve_reference_points(
+            objective_evaluator, variable_bounds, ideal, nadir, solver_method, continuation, z_points
+        )
+
+    solve_chunk = partial(
+        _solve_reference_points, objective_evaluator, variable_bounds, ideal, nadir, solver_method, continuation
+    )
+
+    return _iter_concurrent_solutions(solve_chunk, z_points, executor, n_workers, chunksize)
+
 
 def solve_pareto_front_representation_general(
     objective_evaluator: Callable[[np.ndarray], np.ndarray],
@@ -138,6 +999,13 @@ def solve_pareto_front_representation_general(
     nadir: Optional[np.ndarray] = None,
     constraint_evaluator: Optional[Callable[[np.ndarray], np.ndarray]] = None,
     solver_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+    executor: Optional[Union[str, Executor]] = None,
+    n_workers: Optional[int] = None,
+    chunksize: int = 32,
+    reference_set: str = "grid",
+    n_reference_points: Optional[int] = None,
+    seed: Optional[int] = None,
+    continuation: bool = False,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Computes a representation of a Pareto efficient front from a
     multiobjective minimization problem. Does so by generating an evenly spaced
@@ -178,81 +1046,79 @@ def solve_pareto_front_representation_general(
             method used to minimize the achievement scalarization problems
             arising when calculating Pareto efficient solutions. Defaults to
             "scipy_de".
+        executor (Optional[Union[str, Executor]], optional): If given, the
+            reference points are split into chunks which are solved
+            concurrently. Either 'process', 'thread', or an existing executor.
+            With 'process', the evaluators and the solver method must be
+            picklable. Defaults to None, which solves the points one after another.
+        n_workers (Optional[int], optional): The maximum number of workers used
+            when a new pool is created for executor. Defaults to None.
+        chunksize (int, optional): The number of reference points solved in a
+            single task when executor is given. Larger chunks amortize the
+            overhead of dispatching tasks. Defaults to 32.
+        reference_set (str, optional): How the reference points are generated.
+            'grid' spans the whole box between the ideal and nadir points with
+            the given step. 'simplex' uses a Das-Dennis simplex lattice with as
+            many divisions as the grid has along its longest edge, which needs
+            far fewer points in higher dimensions. 'lhs' and 'sobol' sample
+            n_reference_points points in the box using a Latin hypercube or a
+            scrambled Sobol sequence. Defaults to 'grid'.
+        n_reference_points (Optional[int], optional): The number of points
+            sampled with 'lhs' and 'sobol'. Defaults to None, which samples as
+            many points as there are on the simplex lattice.
+        seed (Optional[int], optional): Seed for 'lhs' and 'sobol'. Defaults to None.
+        continuation (bool, optional): If True, the reference points are
+            walked along a space-filling curve, and each achievement
+            scalarization problem is first solved with Nelder-Mead starting from
+            the solution of the previous point. solver_method is used only
+            for the first point of each chunk and when the local solve fails.
+            The reference points are then kept in memory for ordering.
+            Defaults to False.
 
     Raises:
         MCDMUtilityException: Mismatching sizes of the supplied ideal and
         nadir points between the step, when step is an array. Or the type of
-        step is something else than np.ndarray of float.
+        step is something else than np.ndarray of float. Or an unknown
+        reference_set.
     
     Returns:
         Tuple[np.ndarray, np.ndarray]: A tuple containing representations of
         the Pareto optimal variable values, and the corresponsing objective
-        values.
+        values. The solutions are mutually non-dominated and sorted by the
+        value of the first objective.
 
     Note:
         The objective evaluator should be defined such that minimization is
         expected in each of the objectives.
     """
-    if np.all(np.isinf(ideal)) or np.all(np.isinf(nadir)):
-        # compure ideal and nadir using payoff table
-        ideal, nadir = payoff_table_method_general(
-            objective_evaluator, n_of_objectives, variable_bounds, constraint_evaluator,
-        )
-
-    # use ASF to (almost) guarantee Pareto optimality.
-    asf = PointMethodASF(nadir, ideal)
-
-    scalarizer = Scalarizer(objective_evaluator, asf, scalarizer_args={"reference_point": None})
-    solver = ScalarMinimizer(scalarizer, bounds=variable_bounds, method=solver_method)
-
-    # bounds to be used to compute slices
-    stacked = np.stack((ideal, nadir)).T
-    lower_slice_b, upper_slice_b = np.min(stacked, axis=1), np.max(stacked, axis=1)
-
-    if type(step) is float:
-        slices = [slice(start, stop + eps, step) for (start, stop) in zip(lower_slice_b, upper_slice_b)]
-
-    elif type(step) is np.ndarray:
-        if not ideal.shape == nadir.shape == step.shape:
-            raise MCDMUtilityException(
-                "The shapes of the supplied step array does not match the " "shape of the ideal and nadir points."
-            )
-        slices = [slice(start, stop + eps, s) for (start, stop, s) in zip(lower_slice_b, upper_slice_b, step)]
-
-    else:
-        raise MCDMUtilityException("step must be either a numpy array or an float.")
-
-    z_mesh = np.mgrid[slices].reshape(len(ideal), -1).T
-
-    p_front_objectives = np.zeros(z_mesh.shape)
-    p_front_variables = np.zeros((len(p_front_objectives), len(variable_bounds.squeeze())))
-
-    for i, z in enumerate(z_mesh):
-        scalarizer._scalarizer_args = {"reference_point": z}
-        res = solver.minimize(None)
+    solutions = iter_pareto_front_representation_general(
+        objective_evaluator,
+        n_of_objectives,
+        variable_bounds,
+        step,
+        eps,
+        ideal,
+        nadir,
+        constraint_evaluator,
+        solver_method,
+        executor,
+        n_workers,
+        chunksize,
+        reference_set,
+        n_reference_points,
+        seed,
+        continuation,
+    )
 
-        if not res["success"]:
-            print("Non successfull optimization")
-            p_front_objectives[i] = np.nan
-            p_front_variables[i] = np.nan
-            continue
+    # accept only non-dominated solutions
+    archive = NonDominatedArchive(n_of_objectives)
+    for _, x, f in solutions:
+        archive.add(f, x)
 
-        # check for dominance, accept only non-dominated solutions
-        f_i = objective_evaluator(res["x"])
-        if not np.all(f_i > p_front_objectives[:i][~np.all(np.isnan(p_front_objectives[:i]), axis=1)]):
-            p_front_objectives[i] = f_i
-            p_front_variables[i] = res["x"]
-        elif i < 1:
-            p_front_objectives[i] = f_i
-            p_front_variables[i] = res["x"]
-        else:
-            p_front_objectives[i] = np.nan
-            p_front_variables[i] = np.nan
+    if len(archive) == 0:
+        return np.empty((0, len(variable_bounds))), np.empty((0, n_of_objectives))
 
-    return (
-        p_front_variables[~np.all(np.isnan(p_front_variables), axis=1)],
-        p_front_objectives[~np.all(np.isnan(p_front_objectives), axis=1)],
-    )
+    return np.array(archive.payloads), archive.objectives
 
 
 def solve_pareto_front_representation(
@@ -260,6 +1126,13 @@ def solve_pareto_front_representation(
     step: Optional[Union[np.ndarray, float]] = 0.1,
     eps: Optional[float] = 1e-6,
     solver_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+    executor: Optional[Union[str, Executor]] = None,
+    n_workers: Optional[int] = None,
+    chunksize: int = 32,
+    reference_set: str = "grid",
+    n_reference_points: Optional[int] = None,
+    seed: Optional[int] = None,
+    continuation: bool = False,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Pass through to solve_pareto_front_representation_general when the
     problem for which the front is being calculated for is defined as an
@@ -288,22 +1161,40 @@ def solve_pareto_front_representation(
             method used to minimize the achievement scalarization problems
             arising when calculating Pareto efficient solutions. Defaults to
             "scipy_de".
+        executor (Optional[Union[str, Executor]], optional): If given, solve
+            chunks of the reference points concurrently. With 'process', the
+            problem must be picklable. See
+            solve_pareto_front_representation_general. Defaults to None.
+        n_workers (Optional[int], optional): The maximum number of workers used
+            by the executor. Defaults to None.
+        chunksize (int, optional): The number of reference points solved in a
+            single task. Defaults to 32.
+        reference_set (str, optional): How the reference points are
+            generated, one of 'grid', 'simplex', 'lhs', or 'sobol'. See
+            solve_pareto_front_representation_general. Defaults to 'grid'.
+        n_reference_points (Optional[int], optional): The number of points
+            sampled with 'lhs' and 'sobol'. Defaults to None.
+        seed (Optional[int], optional): Seed for 'lhs' and 'sobol'. Defaults to None.
+        continuation (bool, optional): Whether to warm-start local solves from
+            neighbouring solutions. See solve_pareto_front_representation_general.
+            Defaults to False.
     
     Returns:
         Tuple[np.ndarray, np.ndarray]: A tuple containing representations of
         the Pareto optimal variable values, and the corresponsing objective
         values.
     """
+    # the objectives and constraints share the evaluations of the problem
+    evaluations = EvaluationCache(problem)
+
+    # partials instead of lambdas, so that the evaluators can be sent to worker processes
     if problem.n_of_constraints > 0:
-        constraints = lambda x: problem.evaluate(x).constraints.squeeze()
+        constraints = partial(_evaluate_constraints, evaluations)
     else:
         constraints = None
 
-    def evaluator(xs):
-        return problem.evaluate(xs).objectives
-
     var_values, obj_values = solve_pareto_front_representation_general(
-        evaluator,
+        partial(_evaluate_objectives, evaluations),
         problem.n_of_objectives,
         problem.get_variable_bounds(),
         step,
@@ -312,11 +1203,67 @@ def solve_pareto_front_representation(
         problem.nadir,
         constraints,
         solver_method,
+        executor,
+        n_workers,
+        chunksize,
+        reference_set,
+        n_reference_points,
+        seed,
+        continuation,
     )
 
     return var_values, obj_values
 
 
+def iter_pareto_front_representation(
+    problem: MOProblem,
+    step: Optional[Union[np.ndarray, float]] = 0.1,
+    eps: Optional[float] = 1e-6,
+    solver_method: Optional[Union[ScalarMethod, str]] = "scipy_de",
+    executor: Optional[Union[str, Executor]] = None,
+    n_workers: Optional[int] = None,
+    chunksize: int = 32,
+    reference_set: str = "grid",
+    n_reference_points: Optional[int] = None,
+    seed: Optional[int] = None,
+    continuation: bool = False,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Pass through to iter_pareto_front_representation_general when the
+    problem is defined as an MOProblem object. See
+    solve_pareto_front_representation for the arguments.
+
+    Returns:
+        Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]: An iterator
+        yielding the reference point, and the variable and objective values
+        of each successful solve.
+    """
+    evaluations = EvaluationCache(problem)
+
+    if problem.n_of_constraints > 0:
+        constraints = partial(_evaluate_constraints, evaluations)
+    else:
+        constraints = None
+
+    return iter_pareto_front_representation_general(
+        partial(_evaluate_objectives, evaluations),
+        problem.n_of_objectives,
+        problem.get_variable_bounds(),
+        step,
+        eps,
+        problem.ideal,
+        problem.nadir,
+        constraints,
+        solver_method,
+        executor,
+        n_workers,
+        chunksize,
+        reference_set,
+        n_reference_points,
+        seed,
+        continuation,
+    )
+
+
 if __name__ == "__main__":
     from desdeo_problem.problem import MOProblem, ScalarConstraint, _ScalarObjective, variable_builder
 
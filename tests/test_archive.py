@@ -0,0 +1,61 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+from desdeo_mcdm.utilities import ArchiveException, NonDominatedArchive
+
+
+def brute_force_non_dominated(fs: np.ndarray) -> np.ndarray:
+    keep = []
+    for i, f in enumerate(fs):
+        weakly_dominated = np.all(fs <= f, axis=1) & np.any(fs < f, axis=1)
+        duplicate_before = np.all(fs[:i] == f, axis=1)
+        if not np.any(weakly_dominated) and not np.any(duplicate_before):
+            keep.append(i)
+    return fs[keep]
+
+
+@pytest.mark.parametrize("n_of_objectives", [2, 3, 4])
+def test_archive_matches_brute_force(n_of_objectives):
+    rng = np.random.default_rng(0)
+    # rounding creates ties and duplicates
+    fs = np.round(rng.random((500, n_of_objectives)), 1)
+
+    archive = NonDominatedArchive(n_of_objectives, initial_capacity=4)
+    archive.extend(fs, list(range(len(fs))))
+
+    expected = brute_force_non_dominated(fs)
+    # sorted lexicographically
+    npt.assert_array_equal(archive.objectives, expected[np.lexsort(expected.T[::-1])])
+    npt.assert_array_equal(fs[archive.payloads], archive.objectives)
+
+
+def test_large_three_objective_archive():
+    rng = np.random.default_rng(1)
+    # a large archive of points on a front, mixed with dominated points
+    front = np.abs(rng.normal(size=(2000, 3)))
+    front /= np.linalg.norm(front, axis=1, keepdims=True)
+    fs = np.vstack((front, front[:1000] + rng.uniform(0, 0.1, size=(1000, 3))))
+    fs = fs[rng.permutation(len(fs))]
+
+    archive = NonDominatedArchive(3)
+    archive.extend(fs)
+
+    expected = brute_force_non_dominated(fs)
+    assert len(archive) == len(expected) >= 2000
+    npt.assert_array_equal(archive.objectives, expected[np.lexsort(expected.T[::-1])])
+
+
+def test_archive_rejects():
+    archive = NonDominatedArchive(2)
+
+    assert archive.add(np.array([1.0, 2.0]), "a")
+    assert not archive.add(np.array([1.0, 2.0]), "b")
+    assert not archive.add(np.array([1.5, 2.0]))
+    assert not archive.add(np.array([np.nan, 0.0]))
+    assert archive.add(np.array([0.5, 1.0]), "c")
+
+    assert len(archive) == 1
+    assert archive.payloads == ["c"]
+
+    with pytest.raises(ArchiveException):
+        archive.add(np.array([1.0, 2.0, 3.0]))
@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+from desdeo_mcdm.utilities import EvaluationCache, LRUCache
+from desdeo_problem.problem import MOProblem, ScalarConstraint, _ScalarObjective, variable_builder
+
+
+class CountingProblem:
+    def __init__(self, problem):
+        self.problem = problem
+        self.n_of_evaluations = 0
+
+    def evaluate(self, xs):
+        self.n_of_evaluations += 1
+        return self.problem.evaluate(xs)
+
+
+@pytest.fixture
+def problem():
+    f1 = _ScalarObjective(name="f1", evaluator=lambda x: x[:, 0] ** 2 + x[:, 1] ** 2)
+    f2 = _ScalarObjective(name="f2", evaluator=lambda x: (x[:, 0] - 1) ** 2 + x[:, 1] ** 2)
+    c1 = ScalarConstraint("c1", 2, 2, evaluator=lambda x, f: 1 - x[:, 0] - x[:, 1])
+    varsl = variable_builder(["x_1", "x_2"], initial_values=[0.5, 0.5], lower_bounds=[0, 0], upper_bounds=[1, 1])
+    return MOProblem(variables=varsl, objectives=[f1, f2], constraints=[c1])
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("b", lambda: 2) == 2
+    # touch a, so that b is evicted next
+    assert cache.get_or_compute("a", lambda: -1) == 1
+    assert cache.get_or_compute("c", lambda: 3) == 3
+
+    assert len(cache) == 2
+    assert cache.get_or_compute("b", lambda: 4) == 4
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.get_or_compute("b", lambda: -1) == 4
+
+
+def test_evaluation_cache_shares_evaluations(problem):
+    counting = CountingProblem(problem)
+    evaluations = EvaluationCache(counting)
+    xs = np.array([[0.2, 0.3], [0.5, 0.1]])
+
+    objectives = evaluations.objectives(xs)
+    constraints = evaluations.constraints(np.copy(xs))
+
+    assert counting.n_of_evaluations == 1
+    assert (evaluations.hits, evaluations.misses) == (1, 1)
+    npt.assert_allclose(objectives, problem.evaluate(xs).objectives)
+    npt.assert_allclose(constraints, problem.evaluate(xs).constraints)
+
+    evaluations.objectives(xs[:1])
+    assert counting.n_of_evaluations == 2
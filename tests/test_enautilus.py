@@ -309,7 +309,7 @@ def test_step_back_once(simple_data):
     """Tests stepping back once"""
     front, ideal, nadir = simple_data
 
-    method = ENautilus((front), ideal, nadir)
+    method = ENautilus((front), ideal, nadir, seed=1)
 
     req = method.start()
     n_iterations = 8
@@ -406,3 +406,119 @@ def test_get_solution(small_data):
     should_be = variables[should_be_i]
 
     np.testing.assert_almost_equal(should_be, req.content["solution"])
+
+
+@pytest.mark.enautilus
+def test_calculate_bounds():
+    """Compares the bounds to those computed one intermediate point and objective at a time."""
+    rng = np.random.default_rng(1)
+    front = rng.uniform(0, 1, size=(500, 4))
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+
+    method = ENautilus(front, ideal, nadir)
+    zs = method.calculate_intermediate_points(nadir, front[:6], 4)
+
+    lower_bounds, upper_bounds = method.calculate_bounds(front, zs)
+
+    assert lower_bounds.shape == upper_bounds.shape == zs.shape
+    for i, z in enumerate(zs):
+        for r in range(front.shape[1]):
+            considered = np.all(np.delete(front, r, axis=1) <= np.delete(z, r), axis=1)
+            assert lower_bounds[i, r] == np.min(front[considered, r])
+            assert upper_bounds[i, r] == np.max(front[considered, r])
+
+    with pytest.raises(ENautilusException):
+        method.calculate_bounds(front, ideal - 1)
+
+
+@pytest.mark.enautilus
+@pytest.mark.parametrize("use_index", [False, True])
+def test_unreachable_bounds(use_index):
+    """Tests that an intermediate point from which nothing is reachable raises, with and without the index."""
+    rng = np.random.default_rng(1)
+    front = rng.uniform(0, 1, size=(200, 3))
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+
+    method = ENautilus(front, ideal, nadir, use_index=use_index)
+    zs = np.vstack((nadir, ideal - 1))
+
+    with pytest.raises(ENautilusException):
+        method._calculate_bounds(zs)
+
+    lower_bounds, upper_bounds = method._calculate_bounds(zs[:1])
+    npt.assert_array_equal(lower_bounds, ideal[None])
+    npt.assert_array_equal(upper_bounds, nadir[None])
+
+
+@pytest.mark.enautilus
+@pytest.mark.parametrize("representative_method", ["kmeans", "minibatch_kmeans", "kmeans++", "farthest_point", "tree"])
+@pytest.mark.parametrize("warm_start", [False, True])
+def test_representative_methods(representative_method, warm_start):
+    """Iterates the method with each of the representative methods."""
+    rng = np.random.default_rng(1)
+    front = rng.uniform(0, 1, size=(300, 3))
+    front /= np.linalg.norm(front, axis=1, keepdims=True)
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+
+    method = ENautilus(front, ideal, nadir, representative_method=representative_method, warm_start=warm_start)
+
+    req = method.start()
+    req.response = {"n_iterations": 4, "n_points": 5}
+
+    for _ in range(3):
+        req = method.iterate(req)
+        # the representative points are distinct reachable solutions
+        zbars = method.calculate_representative_points(front, method._reachable_idx, 5)
+        assert len(np.unique(zbars, axis=0)) == min(5, np.size(method._reachable_idx))
+        assert all(np.any(np.all(front[method._reachable_idx] == zbar, axis=1)) for zbar in zbars)
+
+        req.response = {"preferred_point_index": 0, "step_back": False, "change_remaining": False}
+
+    with pytest.raises(ENautilusException):
+        ENautilus(front, ideal, nadir, representative_method="random")
+
+
+@pytest.mark.enautilus
+def test_tree_representatives():
+    """Tests that the tree method chooses the representative points within the given subset."""
+    rng = np.random.default_rng(1)
+    front = rng.uniform(0, 1, size=(300, 3))
+    front /= np.linalg.norm(front, axis=1, keepdims=True)
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+
+    method = ENautilus(front, ideal, nadir, representative_method="tree", seed=1)
+    subset = np.flatnonzero(np.all(front <= np.quantile(front, 0.6, axis=0), axis=1))
+
+    zbars = method.calculate_representative_points(front, subset, 5)
+    assert len(np.unique(zbars, axis=0)) == 5
+    assert all(np.any(np.all(front[subset] == zbar, axis=1)) for zbar in zbars)
+
+    # the bounds of the subset may be given instead
+    upper_bounds = np.max(front[subset], axis=0)
+    npt.assert_array_equal(
+        method.calculate_representative_points(front, subset, 5, lower_bounds=ideal, upper_bounds=upper_bounds), zbars
+    )
+
+    with pytest.raises(ENautilusException):
+        method.calculate_representative_points(np.copy(front), subset, 5)
+
+
+@pytest.mark.enautilus
+@pytest.mark.parametrize("representative_method", ["kmeans", "minibatch_kmeans", "kmeans++", "tree"])
+def test_seeded_iterations(simple_data, representative_method):
+    """Tests that seeded sessions with the same responses give the same intermediate points."""
+    front, ideal, nadir = simple_data
+
+    contents = []
+    for _ in range(2):
+        method = ENautilus(front, ideal, nadir, representative_method=representative_method, seed=3)
+        req = method.start()
+        req.response = {"n_iterations": 5, "n_points": 4}
+
+        for _ in range(3):
+            req = method.iterate(req)
+            req.response = {"preferred_point_index": 1, "step_back": False, "change_remaining": False}
+        contents.append(req.content)
+
+    npt.assert_array_equal(contents[0]["points"], contents[1]["points"])
+    npt.assert_array_equal(contents[0]["lower_bounds"], contents[1]["lower_bounds"])
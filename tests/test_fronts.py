@@ -0,0 +1,273 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+from desdeo_mcdm.interactive import ENautilus, NautilusNavigator
+from desdeo_mcdm.interactive.NIMBUS import DiscreteNimbusEngine
+from desdeo_mcdm.utilities import (
+    ClusterTree,
+    FrontException,
+    FrontIndex,
+    batched_argmin,
+    batched_leave_one_out_bounds,
+    chunked_argmin,
+    iter_chunks,
+    leave_one_out_bounds,
+    load_front,
+    nearest_point,
+    points_within_bounds,
+)
+from desdeo_tools.scalarization.ASF import PointMethodASF, StomASF
+
+
+@pytest.fixture
+def front():
+    rng = np.random.default_rng(1)
+    return rng.uniform(0, 1, size=(1000, 3))
+
+
+@pytest.fixture
+def front_path(tmp_path, front):
+    path = tmp_path / "front.npy"
+    np.save(path, front)
+    return path
+
+
+def test_load_front(tmp_path, front, front_path):
+    loaded = load_front(front_path)
+
+    assert isinstance(loaded, np.memmap)
+    npt.assert_array_equal(loaded, front)
+
+    # chunks are views of the memory-mapped front
+    assert all(isinstance(chunk, np.memmap) for (_, chunk) in iter_chunks(loaded, 300))
+
+    np.save(tmp_path / "vector.npy", front[0])
+    with pytest.raises(FrontException):
+        load_front(tmp_path / "vector.npy")
+
+
+def test_chunked_argmin(front):
+    values = front[:, 0] - front[:, 1]
+    values[::7] = np.nan
+    mask = np.ones(len(front), dtype=bool)
+    mask[np.nanargmin(values)] = False
+
+    index, value = chunked_argmin(front, lambda chunk: chunk[:, 0] - chunk[:, 1], mask=mask, chunksize=64)
+
+    masked = np.where(mask, values, np.nan)
+    assert index == np.nanargmin(masked)
+    assert value == np.nanmin(masked)
+
+    # only the rows at the given indices are evaluated
+    evaluated = []
+    indices = np.flatnonzero(mask)[::3]
+
+    def fun(chunk):
+        evaluated.append(len(chunk))
+        return chunk[:, 0] - chunk[:, 1]
+
+    index, _ = chunked_argmin(front, fun, chunksize=64, indices=indices)
+
+    assert sum(evaluated) == len(indices)
+    assert index == indices[np.nanargmin(values[indices])]
+
+    with pytest.raises(FrontException):
+        chunked_argmin(front, lambda chunk: chunk[:, 0], mask=np.zeros(len(front), dtype=bool))
+
+
+def test_points_within_bounds(front):
+    lower_bounds, upper_bounds = np.array([0.2, 0.0, 0.5]), np.array([0.6, 0.5, 1.0])
+    expected = np.flatnonzero(np.all((front >= lower_bounds) & (front <= upper_bounds), axis=1))
+
+    npt.assert_array_equal(points_within_bounds(front, lower_bounds, upper_bounds, chunksize=64), expected)
+    assert nearest_point(front, front[123] + 1e-9, chunksize=64) == 123
+
+
+def looped_bounds(front, point, user_bounds):
+    # computes the bounds one objective at a time, like the navigator used to
+    front = np.copy(front)
+    front[np.any(front > user_bounds, axis=1)] = np.nan
+    lower_bounds, upper_bounds = np.full(front.shape[1], np.inf), np.full(front.shape[1], -np.inf)
+    for r in range(front.shape[1]):
+        others = np.delete(front, r, axis=1)
+        considered = np.all(others <= np.delete(point, r), axis=1)
+        if np.any(considered):
+            lower_bounds[r] = np.nanmin(front[considered, r])
+            upper_bounds[r] = np.nanmax(front[considered, r])
+    return lower_bounds, upper_bounds
+
+
+@pytest.mark.parametrize("user_bounds", [np.full(3, np.nan), np.array([np.nan, 0.8, 0.9])])
+def test_leave_one_out_bounds(front, user_bounds):
+    point = np.array([0.5, 0.6, 0.7])
+    original = np.copy(front)
+
+    lower_bounds, upper_bounds, found = leave_one_out_bounds(front, point, user_bounds, chunksize=64)
+    expected_lower_bounds, expected_upper_bounds = looped_bounds(front, point, user_bounds)
+
+    assert np.all(found)
+    npt.assert_array_equal(lower_bounds, expected_lower_bounds)
+    npt.assert_array_equal(upper_bounds, expected_upper_bounds)
+    npt.assert_array_equal(front, original)
+
+    # a subset of the rows
+    indices = np.arange(0, len(front), 5)
+    lower_bounds, upper_bounds, _ = leave_one_out_bounds(front, point, user_bounds, chunksize=64, indices=indices)
+    expected_lower_bounds, expected_upper_bounds = looped_bounds(front[indices], point, user_bounds)
+
+    npt.assert_array_equal(lower_bounds, expected_lower_bounds)
+    npt.assert_array_equal(upper_bounds, expected_upper_bounds)
+
+
+def test_batched_kernels(front):
+    rng = np.random.default_rng(3)
+    points = rng.uniform(0.3, 0.9, size=(5, 3))
+    user_bounds = np.array([np.nan, 0.8, 0.9])
+    lower_bounds, upper_bounds = np.full((5, 3), 0.05), np.full((5, 3), 0.95)
+
+    results = batched_leave_one_out_bounds(front, points, user_bounds, lower_bounds, upper_bounds, chunksize=64)
+    indices = points_within_bounds(front, lower_bounds[0], upper_bounds[0])
+    for i, point in enumerate(points):
+        expected = leave_one_out_bounds(front, point, user_bounds, indices=indices)
+        for result, expected_result in zip(results, expected):
+            npt.assert_array_equal(result[i], expected_result)
+
+    indices, values = batched_argmin(front, lambda chunk: chunk @ points.T, len(points), chunksize=64)
+    for i, point in enumerate(points):
+        expected_index, expected_value = chunked_argmin(front, lambda chunk: chunk @ point)
+        assert indices[i] == expected_index
+        assert values[i] == pytest.approx(expected_value)
+
+    with pytest.raises(FrontException):
+        batched_argmin(front, lambda chunk: np.full((len(chunk), 2), np.nan), 2)
+
+
+def test_memory_mapped_navigation(front, front_path):
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+    response = {
+        "reference_point": np.array([0.2, 0.4, 0.3]),
+        "speed": 5,
+        "go_to_previous": False,
+        "stop": False,
+        "user_bounds": [None, 0.9, None],
+    }
+
+    contents = []
+    for pareto_front in (front, front_path):
+        method = NautilusNavigator(pareto_front, ideal, nadir)
+        method._steps_remaining = 5
+        request = method.start()
+        for _ in range(3):
+            request.response = dict(response)
+            request = method.iterate(request)
+        contents.append(request.content)
+
+    assert isinstance(method._pareto_front, np.memmap)
+    npt.assert_array_equal(contents[0]["navigation_point"], contents[1]["navigation_point"])
+    npt.assert_array_equal(contents[0]["reachable_idx"], contents[1]["reachable_idx"])
+
+
+def test_memory_mapped_discrete_engine(front, front_path):
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+    asfs = [PointMethodASF(nadir, ideal), StomASF(ideal)]
+    reference_points = [np.array([0.2, 0.4, 0.3]), np.array([0.5, 0.5, 0.5])]
+
+    in_memory = DiscreteNimbusEngine(front, ideal, nadir)
+    memory_mapped = DiscreteNimbusEngine(load_front(front_path), ideal, nadir, chunksize=64)
+
+    assert memory_mapped._normalized is None
+    npt.assert_array_equal(
+        in_memory.minimize(asfs, reference_points), memory_mapped.minimize(asfs, reference_points)
+    )
+
+
+def test_front_index(front):
+    index = FrontIndex(front)
+    rng = np.random.default_rng(2)
+
+    for _ in range(20):
+        lower_bounds, upper_bounds = np.sort(rng.uniform(0, 1, size=(2, 3)), axis=0)
+        npt.assert_array_equal(
+            index.points_within_bounds(lower_bounds, upper_bounds),
+            points_within_bounds(front, lower_bounds, upper_bounds),
+        )
+
+    # rows on the bounds are included
+    npt.assert_array_equal(index.points_within_bounds(front[7], front[7]), [7])
+    assert len(index.points_within_bounds(np.ones(3), np.zeros(3))) == 0
+
+    point = np.array([0.5, 0.6, 0.7])
+    for user_bounds in (np.full(3, np.nan), np.array([np.nan, 0.8, 0.9])):
+        expected = leave_one_out_bounds(front, point, user_bounds)
+        for result, expected_result in zip(index.leave_one_out_bounds(point, user_bounds), expected):
+            npt.assert_array_equal(result, expected_result)
+
+    # restricted to the rows within a box
+    lower_bounds, upper_bounds = np.array([0.1, 0.2, 0.0]), np.array([0.9, 1.0, 0.8])
+    indices = points_within_bounds(front, lower_bounds, upper_bounds)
+    expected = leave_one_out_bounds(front, point, indices=indices)
+    result = index.leave_one_out_bounds(point, lower_bounds=lower_bounds, upper_bounds=upper_bounds)
+    for result, expected_result in zip(result, expected):
+        npt.assert_array_equal(result, expected_result)
+
+
+def test_indexed_navigation(front):
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+    response = {
+        "reference_point": np.array([0.2, 0.4, 0.3]),
+        "speed": 5,
+        "go_to_previous": False,
+        "stop": False,
+        "user_bounds": [None, 0.9, None],
+    }
+
+    contents = []
+    for use_index in (False, True):
+        method = NautilusNavigator(front, ideal, nadir, use_index=use_index)
+        method._steps_remaining = 5
+        request = method.start()
+        for _ in range(4):
+            request.response = dict(response)
+            request = method.iterate(request)
+        contents.append(request.content)
+
+    for key in ("navigation_point", "reachable_lb", "reachable_ub", "reachable_idx"):
+        npt.assert_array_equal(contents[0][key], contents[1][key])
+
+    # the intermediate points of E-NAUTILUS
+    ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+    method = ENautilus(front, ideal, nadir, use_index=True)
+    zs = method.calculate_intermediate_points(nadir, front[:4], 3)
+    for result, expected_result in zip(method._calculate_bounds(zs), method.calculate_bounds(front, zs)):
+        npt.assert_array_equal(result, expected_result)
+
+
+def test_cluster_tree(front):
+    tree = ClusterTree(front, leaf_size=16)
+    rng = np.random.default_rng(2)
+
+    # the rows of each node are contiguous in the order of the tree
+    npt.assert_array_equal(np.sort(tree._order), np.arange(len(front)))
+    for node in range(len(tree)):
+        rows = front[tree._order[tree._starts[node] : tree._ends[node]]]
+        npt.assert_array_equal(np.min(rows, axis=0), tree._lowers[node])
+        npt.assert_array_equal(np.max(rows, axis=0), tree._uppers[node])
+
+    for n_points in (1, 5, 40):
+        lower_bounds, upper_bounds = np.sort(rng.uniform(0, 1, size=(2, 3)), axis=0)
+        lower_bounds, upper_bounds = lower_bounds / 2, upper_bounds / 2 + 0.5
+        indices = points_within_bounds(front, lower_bounds, upper_bounds)
+
+        representatives = tree.representatives(n_points, lower_bounds, upper_bounds, seed=1)
+
+        assert len(np.unique(representatives)) == min(n_points, len(indices))
+        assert np.all(np.isin(representatives, indices))
+        npt.assert_array_equal(representatives, tree.representatives(n_points, lower_bounds, upper_bounds, seed=1))
+
+    # every row, when asked for more representatives than there are rows
+    indices = points_within_bounds(front, front[7], front[7] + 0.05)
+    npt.assert_array_equal(np.sort(tree.representatives(10, front[7], front[7] + 0.05)), indices)
+    assert len(tree.representatives(10)) == 10
+
+    with pytest.raises(FrontException):
+        tree.representatives(3, np.ones(3), np.ones(3))
@@ -239,6 +239,181 @@ class TestNavigation:
         assert final_variables is None
 
 
+    def test_incremental_reachable_points(self):
+        """Test that the reachable solutions found from those reachable on the previous step are correct."""
+        rng = np.random.default_rng(1)
+        front = rng.uniform(0, 1, size=(2000, 3))
+        front /= np.linalg.norm(front, axis=1, keepdims=True)
+        method = NautilusNavigator(front, np.min(front, axis=0), np.max(front, axis=0))
+        method._steps_remaining = 20
+
+        subsets = []
+        calculate_reachable_point_indices = method.calculate_reachable_point_indices
+
+        def spy(*args, subset_indices=None):
+            subsets.append(subset_indices)
+            return calculate_reachable_point_indices(*args, subset_indices=subset_indices)
+
+        method.calculate_reachable_point_indices = spy
+
+        request = method.start()
+        for step in range(10):
+            request.response = {
+                "reference_point": np.array([0.3, 0.5, 0.6]),
+                "speed": 5,
+                "go_to_previous": False,
+                "stop": False,
+                # the user bounds change on the fifth step
+                "user_bounds": [None, None, 0.95 if step >= 4 else None],
+            }
+            request = method.iterate(request)
+
+            expected = np.flatnonzero(
+                np.all((front >= method._reachable_lb) & (front <= method._reachable_ub), axis=1)
+            )
+            npt.assert_array_equal(np.atleast_1d(method._reachable_idx), expected)
+
+        # the whole front is scanned on the first step and when the user bounds change
+        assert subsets[0] is None or np.size(subsets[0]) == len(front)
+        assert subsets[4] is None
+        assert sum(subset is not None for subset in subsets) >= 7
+
+    def test_trajectory_cache(self, pareto_front, ideal, nadir):
+        """Test that stepping forward again along the same path restores the cached steps."""
+        method = NautilusNavigator(pareto_front, ideal, nadir, trajectory_cache_size=4)
+        method._steps_remaining = 20
+        response = {
+            "reference_point": np.array([0.3, 0.5, 2.0, 2.0]),
+            "speed": 5,
+            "go_to_previous": False,
+            "stop": False,
+            "user_bounds": [None, None, None, None],
+        }
+
+        requests = [method.start()]
+        for _ in range(6):
+            requests[-1].response = dict(response)
+            requests.append(method.iterate(requests[-1]))
+
+        # only the four latest steps are kept
+        assert len(method._trajectory_cache) == 4
+
+        n_steps = []
+        calculate_bounds = method.calculate_bounds
+
+        def spy(*args, **kwargs):
+            n_steps.append(1)
+            return calculate_bounds(*args, **kwargs)
+
+        method.calculate_bounds = spy
+
+        # go back to the third step and navigate forward again
+        requests[3].response = {**response, "go_to_previous": True}
+        request = method.iterate(requests[3])
+        for expected in requests[4:]:
+            request.response = dict(response)
+            request = method.iterate(request)
+            for key in ("navigation_point", "reachable_lb", "reachable_ub", "reachable_idx", "distance"):
+                npt.assert_array_equal(request.content[key], expected.content[key])
+            assert request.content["step_number"] == expected.content["step_number"]
+
+        assert len(n_steps) == 0
+        assert method._trajectory_cache.hits == 3
+
+        # different preferences are not restored from the cache
+        request.response = {**response, "reference_point": np.array([0.5, 0.5, 2.0, 2.0])}
+        method.iterate(request)
+        assert len(n_steps) == 1
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_trajectory_cache_after_going_back(self, seed):
+        """Test that going back with changed user bounds gives the same steps with and without the cache."""
+        rng = np.random.default_rng(seed)
+        front = rng.uniform(0, 1, size=(50, 3))
+        front /= np.linalg.norm(front, axis=1, keepdims=True)
+        ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+        reference_points = rng.uniform(ideal, nadir, size=(2, 3))
+        user_bounds = [None, None, np.quantile(front[:, 2], 0.3)]
+
+        contents = []
+        for trajectory_cache_size in (0, 32):
+            method = NautilusNavigator(front, ideal, nadir, trajectory_cache_size=trajectory_cache_size)
+            method._steps_remaining = 10
+
+            def respond(request, reference_point, bounds, go_to_previous=False):
+                request.response = {
+                    "reference_point": reference_point,
+                    "speed": 5,
+                    "go_to_previous": go_to_previous,
+                    "stop": False,
+                    "user_bounds": bounds,
+                }
+                return method.iterate(request)
+
+            first = respond(method.start(), reference_points[0], [None, None, None])
+            # a new reference point is projected within the bounds of the state it is taken from
+            second = respond(first, reference_points[1], user_bounds)
+            respond(second, reference_points[0], user_bounds)
+
+            # going back sets the user bounds of the earlier state
+            request = respond(first, reference_points[0], user_bounds, go_to_previous=True)
+            request = respond(request, reference_points[1], user_bounds)
+            contents.append(respond(request, reference_points[1], user_bounds).content)
+
+        for key in ("navigation_point", "reachable_lb", "reachable_ub", "reachable_idx", "distance"):
+            npt.assert_array_equal(contents[0][key], contents[1][key])
+
+    def test_replay(self):
+        """Test that replaying many navigations at once matches iterating them one by one."""
+        rng = np.random.default_rng(1)
+        front = rng.uniform(0, 1, size=(2000, 3))
+        front /= np.linalg.norm(front, axis=1, keepdims=True)
+        ideal, nadir = np.min(front, axis=0), np.max(front, axis=0)
+
+        n_steps = 8
+        reference_points = np.repeat(
+            np.array([[0.3, 0.5, 0.6], [0.6, 0.3, 0.4], [0.5, 0.5, 0.5]])[:, None, :], n_steps, axis=1
+        )
+        # the reference point of the last navigation changes on the fourth step
+        reference_points[2, 3:] = [0.2, 0.6, 0.7]
+        user_bounds = np.full(reference_points.shape, np.nan)
+        user_bounds[1, 2:, 2] = 0.9
+
+        method = NautilusNavigator(front, ideal, nadir)
+        replayed = method.replay(reference_points, user_bounds, steps_remaining=6)
+
+        assert replayed["navigation_points"].shape == reference_points.shape
+        assert method._step_number == 1
+
+        for i in range(len(reference_points)):
+            method = NautilusNavigator(front, ideal, nadir)
+            method._steps_remaining = 6
+            request = method.start()
+            for step in range(n_steps):
+                request.response = {
+                    "reference_point": reference_points[i, step],
+                    "speed": 5,
+                    "go_to_previous": False,
+                    "stop": False,
+                    "user_bounds": user_bounds[i, step],
+                }
+                request = method.iterate(request)
+
+                npt.assert_array_equal(replayed["navigation_points"][i, step], request.content["navigation_point"])
+                npt.assert_array_equal(replayed["reachable_lb"][i, step], request.content["reachable_lb"])
+                npt.assert_array_equal(replayed["reachable_ub"][i, step], request.content["reachable_ub"])
+                npt.assert_allclose(replayed["distances"][i, step], request.content["distance"])
+                assert replayed["projection_indices"][i, step] == method._projection_index
+                assert replayed["step_numbers"][step] == request.content["step_number"]
+                assert replayed["steps_remaining"][step] == request.content["steps_remaining"]
+
+        with pytest.raises(NautilusNavigatorException):
+            method.replay(reference_points[0])
+
+        with pytest.raises(NautilusNavigatorException):
+            method.replay(reference_points + 1)
+
+
 class TestRefPointProjection:
     def test_no_bounds(self, asf_problem, pareto_front, ideal, nadir, asf):
         """Test the projection to the Pareto front without specifying any bounds.
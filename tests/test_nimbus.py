@@ -1,43 +1,60 @@
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+
 from desdeo_mcdm.interactive import NIMBUS, NimbusStopRequest
+from desdeo_mcdm.interactive.NIMBUS import DiscreteNimbusEngine, NimbusException
+from desdeo_mcdm.utilities import SolverConfiguration, make_de_method
 from desdeo_problem.problem import ScalarObjective
 from desdeo_problem.problem import variable_builder
 from desdeo_problem.problem import MOProblem
+from desdeo_problem.problem import DiscreteDataProblem
+from desdeo_tools.scalarization.ASF import AugmentedGuessASF, MaxOfTwoASF, PointMethodASF, StomASF
+from desdeo_tools.scalarization.Scalarizer import DiscreteScalarizer
+from desdeo_tools.solver.ScalarSolver import DiscreteMinimizer
+from desdeo_tools.solver.ScalarSolver import ScalarMethod
 import numpy as np
 import numpy.testing as npt
+import pandas as pd
 import pytest
+from scipy.optimize import differential_evolution
+
+
+# the objectives of the river pollution problem, on the module level so that they can be sent to worker processes
+def f_1(x: np.ndarray) -> np.ndarray:
+    x = np.atleast_2d(
+        x
+    )  # This step is to guarantee that the function works when called with a single decision variable vector as well.
+    return -4.07 - 2.27 * x[:, 0]
+
+
+def f_2(x: np.ndarray) -> np.ndarray:
+    x = np.atleast_2d(x)
+    return (
+        -2.60
+        - 0.03 * x[:, 0]
+        - 0.02 * x[:, 1]
+        - 0.01 / (1.39 - x[:, 0] ** 2)
+        - 0.30 / (1.39 + x[:, 1] ** 2)
+    )
+
+
+def f_3(x: np.ndarray) -> np.ndarray:
+    x = np.atleast_2d(x)
+    return -8.21 + 0.71 / (1.09 - x[:, 0] ** 2)
+
+
+def f_4(x: np.ndarray) -> np.ndarray:
+    x = np.atleast_2d(x)
+    return -0.96 - 0.96 / (1.09 - x[:, 1] ** 2)
+
+
+def f_5(x: np.ndarray) -> np.ndarray:
+    return np.max([np.abs(x[:, 0] - 0.65), np.abs(x[:, 1] - 0.65)], axis=0)
 
 
 @pytest.fixture
 def river_problem() -> MOProblem:
     # create the problem (river pollution)
-
-    def f_1(x: np.ndarray) -> np.ndarray:
-        x = np.atleast_2d(
-            x
-        )  # This step is to guarantee that the function works when called with a single decision variable vector as well.
-        return -4.07 - 2.27 * x[:, 0]
-
-    def f_2(x: np.ndarray) -> np.ndarray:
-        x = np.atleast_2d(x)
-        return (
-            -2.60
-            - 0.03 * x[:, 0]
-            - 0.02 * x[:, 1]
-            - 0.01 / (1.39 - x[:, 0] ** 2)
-            - 0.30 / (1.39 + x[:, 1] ** 2)
-        )
-
-    def f_3(x: np.ndarray) -> np.ndarray:
-        x = np.atleast_2d(x)
-        return -8.21 + 0.71 / (1.09 - x[:, 0] ** 2)
-
-    def f_4(x: np.ndarray) -> np.ndarray:
-        x = np.atleast_2d(x)
-        return -0.96 - 0.96 / (1.09 - x[:, 1] ** 2)
-
-    def f_5(x: np.ndarray) -> np.ndarray:
-        return np.max([np.abs(x[:, 0] - 0.65), np.abs(x[:, 1] - 0.65)], axis=0)
-
     f1 = ScalarObjective(name="f1", evaluator=f_1)
     f2 = ScalarObjective(name="f2", evaluator=f_2)
     f3 = ScalarObjective(name="f3", evaluator=f_3)
@@ -166,3 +183,199 @@ def test_init_w_no_start_point(river_problem):
     request, _ = method.iterate(request)
 
     assert isinstance(request, NimbusStopRequest)
+
+
+@pytest.mark.nimbus
+def test_solver_configuration(river_problem):
+    calls = []
+
+    def counting_de(fun, x0, **kwargs):
+        calls.append(1)
+        return differential_evolution(fun, **kwargs)
+
+    configuration = SolverConfiguration(
+        ScalarMethod(counting_de, method_args={"seed": 1, "maxiter": 50}, use_scipy=True)
+    )
+    # without the ideal and nadir, the payoff table is computed with the same configuration
+    river_problem.ideal = None
+    river_problem.nadir = None
+    method = NIMBUS(river_problem, solver_configuration=configuration)
+
+    # a row for each of the five objectives and the initial solution
+    assert len(calls) == 6
+    assert set(method.phase_times) == {"payoff_table", "initial_solution"}
+
+    request, _ = method.request_classification()
+    request.response = {
+        "classifications": ["<", "<=", "=", ">=", "0"],
+        "levels": method._ideal + 0.5 * (method._nadir - method._ideal),
+        "number_of_solutions": 2,
+    }
+    method.iterate(request)
+
+    assert len(calls) == 8
+    assert method.phase_times["new_solutions"] > 0
+
+
+class CountingProcessPool(ProcessPoolExecutor):
+    # a process pool counting the subproblems submitted to it
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n_submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.n_submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.nimbus
+def test_concurrent_subproblems(river_problem):
+    method_args = {"seed": 1, "maxiter": 50, "polish": False}
+    pool = CountingProcessPool(max_workers=2)
+
+    results = []
+    # the subproblems are sent to worker processes with a process executor
+    for executor in (None, "thread", "process", pool):
+        configuration = SolverConfiguration(make_de_method(method_args), executor=executor)
+        # each run gets a problem of its own, the method updates the ideal point in place
+        method = NIMBUS(deepcopy(river_problem), solver_configuration=configuration)
+
+        request, _ = method.request_classification()
+        request.response = {
+            "classifications": ["<", "<=", "=", ">=", "0"],
+            "levels": method._ideal + 0.5 * (method._nadir - method._ideal),
+            "number_of_solutions": 4,
+        }
+        save_request, _ = method.iterate(request)
+
+        assert set(save_request.content["subproblem_times"]) == {
+            "MaxOfTwoASF",
+            "StomASF",
+            "PointMethodASF",
+            "AugmentedGuessASF",
+        }
+        results.append(save_request.content["objectives"])
+
+    # the given pool is used, and not shut down
+    assert pool.n_submitted == 4
+    pool.shutdown()
+
+    # solved in the same order regardless of the executor
+    for result in results[1:]:
+        npt.assert_allclose(results[0], result)
+
+
+@pytest.mark.nimbus
+def test_warm_start(river_problem):
+    configuration = SolverConfiguration(warm_start=True)
+    method = NIMBUS(river_problem, solver_configuration=configuration)
+
+    request, _ = method.request_classification()
+    request.response = {
+        "classifications": ["<", "<=", "=", ">=", "0"],
+        "levels": method._ideal + 0.5 * (method._nadir - method._ideal),
+        "number_of_solutions": 2,
+    }
+    save_request, _ = method.iterate(request)
+
+    save_request.response = {"indices": [0, 1]}
+    intermediate_request, _ = method.iterate(save_request)
+
+    intermediate_request.response = {"indices": [0, 1], "number_of_desired_solutions": 2}
+    save_request, _ = method.iterate(intermediate_request)
+
+    # the projections of the intermediate points are solved as separate subproblems
+    assert set(save_request.content["subproblem_times"]) == {"intermediate_0", "intermediate_1"}
+    assert len(save_request.content["objectives"]) == 2
+
+    # the current solution, the two archived solutions, and the two intermediate solutions
+    assert method._initial_guess().shape == (5, 2)
+
+    # only the latest intermediate solutions are kept
+    save_request.response = {"indices": []}
+    intermediate_request, _ = method.iterate(save_request)
+    intermediate_request.response = {"indices": [0, 1], "number_of_desired_solutions": 3}
+    method.iterate(intermediate_request)
+    assert method._initial_guess().shape == (6, 2)
+
+    # other methods are not known to accept a 2D initial guess
+    method_args = {"seed": 1, "maxiter": 50, "polish": False}
+    configuration = SolverConfiguration(
+        ScalarMethod(lambda fun, x0, **kwargs: differential_evolution(fun, **kwargs), method_args, use_scipy=True),
+        warm_start=True,
+    )
+    with pytest.raises(NimbusException):
+        NIMBUS(river_problem, solver_configuration=configuration)
+
+
+@pytest.fixture
+def discrete_front() -> np.ndarray:
+    # points on a concave front, with some dominated points mixed in
+    rng = np.random.default_rng(1)
+    angles = rng.uniform(0, np.pi / 2, size=(2000, 2))
+    front = np.stack(
+        (
+            np.cos(angles[:, 0]) * np.cos(angles[:, 1]),
+            np.cos(angles[:, 0]) * np.sin(angles[:, 1]),
+            np.sin(angles[:, 0]),
+        ),
+        axis=1,
+    )
+    return front * rng.uniform(1.0, 1.2, size=(2000, 1))
+
+
+@pytest.mark.nimbus
+@pytest.mark.parametrize("chunksize", [16384, 7])
+def test_discrete_engine(discrete_front, chunksize):
+    ideal, nadir = np.min(discrete_front, axis=0), np.max(discrete_front, axis=0)
+    engine = DiscreteNimbusEngine(discrete_front, ideal, nadir, chunksize=chunksize)
+
+    current = discrete_front[0]
+    levels = np.array([0.0, 0.3, 1.0])
+    z = np.array([0.1, 0.3, 0.9])
+    asfs = [
+        MaxOfTwoASF(nadir, ideal, [0], [1]),
+        StomASF(ideal),
+        PointMethodASF(nadir, ideal),
+        AugmentedGuessASF(nadir, ideal, [2]),
+    ]
+    reference_points = [levels, z, z, z]
+
+    upper_bounds = np.array([current[0], current[1], levels[2]])
+    constrained = [True, False, False, False]
+    indices = engine.minimize(asfs, reference_points, upper_bounds=upper_bounds, constrained=constrained)
+
+    def cons(fs):
+        return np.all(fs <= upper_bounds, axis=1)
+
+    for i, (asf, reference_point) in enumerate(zip(asfs, reference_points)):
+        scalarizer = DiscreteScalarizer(asf, scalarizer_args={"reference_point": reference_point})
+        expected = DiscreteMinimizer(scalarizer, cons if i == 0 else None).minimize(discrete_front)["x"]
+        assert indices[i] == expected
+
+
+@pytest.mark.nimbus
+def test_discrete_nimbus(discrete_front):
+    data = pd.DataFrame(
+        np.hstack((discrete_front, discrete_front)), columns=["x1", "x2", "x3", "f1", "f2", "f3"]
+    )
+    problem = DiscreteDataProblem(
+        data, ["x1", "x2", "x3"], ["f1", "f2", "f3"], np.min(discrete_front, axis=0), np.max(discrete_front, axis=0)
+    )
+    method = NIMBUS(problem)
+
+    request, _ = method.request_classification()
+    current = method._current_objectives
+    request.response = {
+        "classifications": ["<", ">=", "0"],
+        "levels": np.array([0.0, current[1] + 0.2, 0.0]),
+        "number_of_solutions": 4,
+    }
+    save_request, _ = method.iterate(request)
+
+    objectives = np.array(save_request.content["objectives"])
+    assert objectives.shape == (4, 3)
+    assert set(save_request.content["subproblem_times"]) == {"fused"}
+    # the first solution improves the first objective without exceeding the bound of the second
+    assert objectives[0, 0] <= current[0]
+    assert objectives[0, 1] <= current[1] + 0.2
@@ -0,0 +1,264 @@
+import os
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+from desdeo_mcdm.utilities import (
+    PayoffTableCache,
+    SolverConfiguration,
+    is_warm_started,
+    make_de_method,
+    NonDominatedArchive,
+    iter_pareto_front_representation_general,
+    payoff_table_method,
+    payoff_table_method_general,
+    solve_pareto_front_representation_general,
+    weighted_scalarizer,
+)
+from desdeo_mcdm.utilities.solvers import MCDMUtilityException, _seeded_population
+from desdeo_problem.problem import MOProblem, _ScalarObjective, variable_builder
+from desdeo_tools.scalarization.ASF import PointMethodASF
+from desdeo_tools.scalarization.Scalarizer import Scalarizer
+from desdeo_tools.solver.ScalarSolver import ScalarMethod, ScalarMinimizer
+from scipy.optimize import differential_evolution
+
+
+def objectives(xs: np.ndarray) -> np.ndarray:
+    xs = np.atleast_2d(xs)
+    f_1 = xs[:, 0] ** 2 + xs[:, 1] ** 2
+    f_2 = (xs[:, 0] - 2) ** 2 + (xs[:, 1] - 1) ** 2
+    f_3 = (xs[:, 0] + 1) ** 2 + (xs[:, 1] - 2) ** 2
+    return np.stack((f_1, f_2, f_3)).T
+
+
+def bi_objectives(xs: np.ndarray) -> np.ndarray:
+    return objectives(xs)[:, :2]
+
+
+def seeded_de(fun, x0, **kwargs):
+    return differential_evolution(fun, **kwargs)
+
+
+@pytest.fixture
+def variable_bounds():
+    return np.array([[-3.0, 3.0], [-3.0, 3.0]])
+
+
+@pytest.fixture
+def seeded_method():
+    return ScalarMethod(seeded_de, method_args={"seed": 1, "polish": False, "maxiter": 100}, use_scipy=True)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_payoff_table_concurrent_matches_serial(variable_bounds, seeded_method, executor):
+    ideal, nadir = payoff_table_method_general(objectives, 3, variable_bounds, solver_method=seeded_method)
+    ideal_c, nadir_c = payoff_table_method_general(
+        objectives, 3, variable_bounds, solver_method=seeded_method, executor=executor, n_workers=2
+    )
+
+    npt.assert_array_equal(ideal, ideal_c)
+    npt.assert_array_equal(nadir, nadir_c)
+    npt.assert_allclose(ideal, np.zeros(3), atol=1e-2)
+
+
+def test_pareto_front_concurrent_matches_serial(variable_bounds, seeded_method):
+    ideal, nadir = np.array([0.0, 0.0]), np.array([5.0, 5.0])
+
+    xs, fs = solve_pareto_front_representation_general(
+        bi_objectives, 2, variable_bounds, step=1.0, ideal=ideal, nadir=nadir, solver_method=seeded_method
+    )
+    xs_c, fs_c = solve_pareto_front_representation_general(
+        bi_objectives,
+        2,
+        variable_bounds,
+        step=1.0,
+        ideal=ideal,
+        nadir=nadir,
+        solver_method=seeded_method,
+        executor="thread",
+        n_workers=2,
+        chunksize=5,
+    )
+
+    assert len(fs) > 0
+    npt.assert_array_equal(xs, xs_c)
+    npt.assert_array_equal(fs, fs_c)
+
+
+def test_iter_pareto_front_streams_solutions(variable_bounds, seeded_method):
+    ideal, nadir = np.array([0.0, 0.0]), np.array([5.0, 5.0])
+
+    solutions = iter_pareto_front_representation_general(
+        bi_objectives, 2, variable_bounds, step=1.0, ideal=ideal, nadir=nadir, solver_method=seeded_method
+    )
+
+    archive = NonDominatedArchive(2)
+    n_of_solutions = 0
+    for z, x, f in solutions:
+        npt.assert_allclose(bi_objectives(x).squeeze(), f)
+        archive.add(f, x)
+        n_of_solutions += 1
+
+    xs, fs = solve_pareto_front_representation_general(
+        bi_objectives, 2, variable_bounds, step=1.0, ideal=ideal, nadir=nadir, solver_method=seeded_method
+    )
+
+    assert n_of_solutions == 36
+    npt.assert_array_equal(archive.objectives, fs)
+    npt.assert_array_equal(np.array(archive.payloads), xs)
+
+
+@pytest.mark.parametrize("reference_set", ["simplex", "lhs", "sobol"])
+def test_pareto_front_reference_sets(variable_bounds, seeded_method, reference_set):
+    ideal, nadir = np.array([0.0, 0.0]), np.array([5.0, 5.0])
+
+    solutions = list(
+        iter_pareto_front_representation_general(
+            bi_objectives,
+            2,
+            variable_bounds,
+            step=1.0,
+            ideal=ideal,
+            nadir=nadir,
+            solver_method=seeded_method,
+            reference_set=reference_set,
+            seed=1,
+        )
+    )
+
+    # a lattice with 5 divisions has 6 points, and the samplers default to as many
+    assert len(solutions) == 6
+    for z, _, _ in solutions:
+        assert np.all((ideal <= z) & (z <= nadir))
+        if reference_set == "simplex":
+            npt.assert_allclose(np.sum(z / nadir), 1.0)
+
+
+def test_pareto_front_unknown_reference_set(variable_bounds):
+    with pytest.raises(MCDMUtilityException):
+        iter_pareto_front_representation_general(
+            bi_objectives, 2, variable_bounds, ideal=np.zeros(2), nadir=np.ones(2), reference_set="hexagonal"
+        )
+
+
+def test_pareto_front_continuation(variable_bounds, seeded_method):
+    ideal, nadir = np.array([0.0, 0.0]), np.array([5.0, 5.0])
+    kwargs = dict(step=0.5, ideal=ideal, nadir=nadir, solver_method=seeded_method, reference_set="simplex")
+
+    cold = iter_pareto_front_representation_general(bi_objectives, 2, variable_bounds, **kwargs)
+    warm = iter_pareto_front_representation_general(bi_objectives, 2, variable_bounds, continuation=True, **kwargs)
+
+    cold = {tuple(z): f for z, _, f in cold}
+    warm = {tuple(z): f for z, _, f in warm}
+
+    # the solutions may differ where the scalarization has several minimizers, compare the attained values instead
+    asf = PointMethodASF(nadir, ideal)
+    assert cold.keys() == warm.keys()
+    for z in cold:
+        npt.assert_allclose(
+            asf(warm[z], reference_point=np.array(z)), asf(cold[z], reference_point=np.array(z)), atol=1e-3
+        )
+
+
+def test_vectorized_de_method(variable_bounds):
+    calls = []
+
+    def evaluator(xs):
+        calls.append(np.atleast_2d(xs).shape[0])
+        return objectives(xs)
+
+    # keep x_1 + x_2 >= 1, with the constraint values of each candidate on a row
+    def constraints(xs):
+        return np.atleast_2d(xs)[:, 0] + np.atleast_2d(xs)[:, 1] - 1
+
+    scalarizer = Scalarizer(evaluator, weighted_scalarizer, scalarizer_args={"ws": np.array([1.0, 0.0, 0.0])})
+    method = make_de_method({"seed": 1, "polish": True, "popsize": 10})
+    res = ScalarMinimizer(scalarizer, np.copy(variable_bounds), constraints, method).minimize(None)
+
+    assert res["success"]
+    # the feasible candidates of a generation are evaluated at once
+    assert max(calls) > 1
+    npt.assert_allclose(res["x"], [0.5, 0.5], atol=1e-3)
+
+
+def test_warm_started_de_method(variable_bounds):
+    scalarizer = Scalarizer(objectives, weighted_scalarizer, scalarizer_args={"ws": np.array([1.0, 0.0, 0.0])})
+    method_args = {"seed": 1, "polish": False, "maxiter": 1}
+
+    # the optimum, and some other known solutions, seed the initial population
+    x0 = np.array([[0.0, 0.0], [2.0, 1.0], [-1.0, 2.0]])
+    warm = ScalarMinimizer(scalarizer, np.copy(variable_bounds), None, make_de_method(method_args, warm_start=True))
+    npt.assert_allclose(warm.minimize(x0)["x"], [0.0, 0.0])
+
+    cold = ScalarMinimizer(scalarizer, np.copy(variable_bounds), None, make_de_method(method_args))
+    assert cold.minimize(x0)["fun"] > 0
+
+    assert is_warm_started(make_de_method(method_args, warm_start=True))
+    assert not is_warm_started(make_de_method(method_args))
+    assert not is_warm_started("scipy_de")
+
+
+def test_seeded_population(variable_bounds):
+    # more known solutions than fit in half the population, the first one with the largest values
+    rng = np.random.default_rng(1)
+    x0 = np.vstack(([2.5, 2.5], rng.uniform(-2, 2, size=(20, 2))))
+    x0[5] = x0[3]
+
+    population = _seeded_population(x0, variable_bounds, popsize=5, seed=1)
+
+    assert population.shape == (10, 2)
+    # the first of the known solutions, in their order and without duplicates
+    npt.assert_array_equal(population[:5], np.delete(x0, 5, axis=0)[:5])
+
+
+def test_seeded_configuration(variable_bounds):
+    configuration = SolverConfiguration(seed=2)
+
+    tables = [payoff_table_method_general(objectives, 3, variable_bounds, configuration=configuration) for _ in range(2)]
+
+    npt.assert_array_equal(tables[0][0], tables[1][0])
+    npt.assert_array_equal(tables[0][1], tables[1][1])
+
+
+def test_payoff_table_cache(tmp_path, seeded_method):
+    f1 = _ScalarObjective(name="f1", evaluator=lambda x: objectives(x)[:, 0])
+    f2 = _ScalarObjective(name="f2", evaluator=lambda x: objectives(x)[:, 1])
+    varsl = variable_builder(["x_1", "x_2"], initial_values=[0, 0], lower_bounds=[-3, -3], upper_bounds=[3, 3])
+    problem = MOProblem(variables=varsl, objectives=[f1, f2])
+
+    cache = PayoffTableCache(tmp_path, model_version="1")
+    assert cache.load(problem) is None
+
+    ideal, nadir = payoff_table_method(problem, solver_method=seeded_method, cache=cache)
+    entry = cache.load(problem)
+    npt.assert_array_equal(entry["ideal"], ideal)
+    npt.assert_array_equal(entry["nadir"], nadir)
+    npt.assert_allclose(entry["xs"], [[0, 0], [2, 1]], atol=1e-2)
+
+    # served from the cache without solving
+    assert payoff_table_method(problem, solver_method="not a method", cache=cache)[0] is not None
+
+    # another model version is another entry
+    assert PayoffTableCache(tmp_path, model_version="2").load(problem) is None
+
+    # a held lock makes other writers skip
+    lock = cache.path(problem).with_suffix(".lock")
+    lock.write_text("another writer")
+    assert not cache.store(problem, np.eye(2), np.zeros((2, 2)))
+    assert lock.read_text() == "another writer"
+
+    # a stale lock is taken over, and removed by its new owner
+    os.utime(lock, (0, 0))
+    assert cache.store(problem, np.eye(2), np.zeros((2, 2)))
+    assert not lock.exists()
+
+    # a lock taken over from a writer is not removed by it
+    token = cache._acquire(lock)
+    lock.write_text("another writer")
+    cache._release(lock, token)
+    assert lock.read_text() == "another writer"
+    lock.unlink()
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".npz"]
+
+    cache.invalidate(problem)
+    assert cache.load(problem) is None